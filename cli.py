@@ -0,0 +1,149 @@
+"""
+Punto de entrada sin GUI (no importa tkinter ni Matplotlib).
+
+    python cli.py list
+    python cli.py generate mid_square -n 1000000 --seed 5735 -o valores.txt
+    python cli.py test productos -n 1000 --seed 5735 --seed2 5375 -o resultados.jsonl
+    python cli.py run manifiesto.json --workers 4 -o resultados.jsonl
+
+Los generadores y pruebas se nombran como en la GUI, por su slug o por un
+trozo único del slug (ver `list` y core.batch.resolve). Los parámetros son
+los de la GUI: n, seed, seed2, const_a, k y alpha. Sin -o se escribe en la
+salida estándar.
+Código de salida: 0 si todo terminó, 1 si alguna corrida falló con error,
+2 si los argumentos no son válidos y 3 si alguna prueba rechazó H0 (solo
+con --strict).
+"""
+from contextlib import contextmanager
+from typing import IO, Iterator, List, Optional
+import argparse
+import sys
+
+from core import batch
+from core.registry import Registry
+
+
+@contextmanager
+def _open_output(path: Optional[str], binary: bool = False) -> Iterator[IO]:
+    if path is None or path == "-":
+        yield sys.stdout.buffer if binary else sys.stdout
+        return
+    with open(path, "wb" if binary else "w", encoding=None if binary else "utf-8",
+              newline=None if binary else "") as fh:
+        yield fh
+
+
+def _add_run_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("generator", help="nombre o slug del generador (ver 'list')")
+    parser.add_argument("-n", type=int, default=batch.JOB_DEFAULTS["n"], help="cantidad de valores")
+    parser.add_argument("--seed", type=int, required=True, help="semilla X0")
+    parser.add_argument("--seed2", type=int, help="segunda semilla X1 (Productos Medios)")
+    parser.add_argument("--const-a", dest="const_a", type=int, help="constante a (Multiplicador Constante)")
+
+
+def cmd_list(args: argparse.Namespace) -> int:
+    print("Generadores:")
+    for name, gen in Registry.generators.items():
+        extra = []
+        if getattr(gen, "required_seeds", 1) == 2:
+            extra.append("seed2")
+        if getattr(gen, "requires_constant", False):
+            extra.append("const_a")
+        needs = f"  (requiere {', '.join(extra)})" if extra else ""
+        print(f"  {batch.slug(name):45s} {name}{needs}")
+    print("Pruebas:")
+    for name in Registry.tests:
+        print(f"  {batch.slug(name):45s} {name}")
+    return 0
+
+
+def cmd_generate(args: argparse.Namespace) -> int:
+    job = batch.normalize_job({"generator": args.generator, "n": args.n, "seed": args.seed,
+                               "seed2": args.seed2, "const_a": args.const_a, "tests": []})
+    kwargs = batch.generator_kwargs(job["generator"], job)
+    chunks = batch.stream_values(job["generator"], job["n"], job["seed"], args.block_size,
+                                 dtype=args.dtype, **kwargs)
+    binary = args.format == "bin"
+    with _open_output(args.output, binary=binary) as fh:
+        if args.format == "csv":
+            fh.write("index,value\n")
+        batch.write_values(chunks, fh, fmt=args.format)
+    return 0
+
+
+def _report(records, output: Optional[str], strict: bool) -> int:
+    with _open_output(output) as fh:
+        counts = batch.write_records(records, fh)
+    if counts["errors"]:
+        print(f"{counts['errors']} corrida(s) con error.", file=sys.stderr)
+        return 1
+    if strict and counts["failed"]:
+        return 3
+    return 0
+
+
+def cmd_test(args: argparse.Namespace) -> int:
+    job = batch.normalize_job({"generator": args.generator, "n": args.n, "seed": args.seed,
+                               "seed2": args.seed2, "const_a": args.const_a, "tests": args.tests,
+                               "alpha": args.alpha, "k": args.k})
+    # Argumentos inválidos (nombres, semillas) -> ValueError y código 2, antes de correr
+    kwargs = batch.generator_kwargs(job["generator"], job)
+    Registry.generators[job["generator"]]().init_state(int(job["seed"]), **kwargs)
+    return _report(batch.run_job(job), args.output, args.strict)
+
+
+def cmd_run(args: argparse.Namespace) -> int:
+    jobs = batch.load_manifest(args.manifest)
+    return _report(batch.run_manifest(jobs, workers=args.workers), args.output, args.strict)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="cli.py", description="Generadores y pruebas sin GUI.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("list", help="generadores y pruebas registrados")
+    p.set_defaults(func=cmd_list)
+
+    p = sub.add_parser("generate", help="escribe la secuencia por bloques (memoria constante)")
+    _add_run_args(p)
+    p.add_argument("-o", "--output", help="archivo de salida (por defecto stdout)")
+    p.add_argument("--format", choices=("txt", "csv", "bin"), default="txt",
+                   help="txt: un valor por línea; csv: index,value; bin: bytes crudos del dtype")
+    p.add_argument("--dtype", choices=("float64", "float32", "uint32", "uint64"), default=None,
+                   help="uint*: el estado entero crudo X en lugar de r")
+    p.add_argument("--block-size", type=int, default=1 << 16, help="valores por bloque")
+    p.set_defaults(func=cmd_generate)
+
+    p = sub.add_parser("test", help="genera y aplica pruebas; resultados en JSON lines")
+    _add_run_args(p)
+    p.add_argument("--tests", nargs="+", help="pruebas a aplicar (por defecto todas)")
+    p.add_argument("--alpha", type=float, default=batch.JOB_DEFAULTS["alpha"], help="significancia")
+    p.add_argument("-k", type=int, default=batch.JOB_DEFAULTS["k"], help="intervalos (m en χ²)")
+    p.add_argument("-o", "--output", help="archivo .jsonl (por defecto stdout)")
+    p.add_argument("--strict", action="store_true", help="código 3 si alguna prueba rechaza H0")
+    p.set_defaults(func=cmd_test)
+
+    p = sub.add_parser("run", help="ejecuta un manifiesto (.json o .jsonl) con varios procesos")
+    p.add_argument("manifest")
+    p.add_argument("--workers", type=int, default=None, help="procesos (por defecto uno por CPU)")
+    p.add_argument("-o", "--output", help="archivo .jsonl (por defecto stdout)")
+    p.add_argument("--strict", action="store_true", help="código 3 si alguna prueba rechaza H0")
+    p.set_defaults(func=cmd_run)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    try:
+        return args.func(args)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+    except BrokenPipeError:
+        # p.ej. `python cli.py generate ... | head`
+        sys.stderr.close()
+        return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
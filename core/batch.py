@@ -0,0 +1,252 @@
+"""
+Ejecución sin GUI (servidores, tareas programadas): generación por
+streaming, pruebas y manifiestos de muchas corridas.
+
+Una corrida ("job") es un dict con los mismos parámetros que usa la GUI:
+    {"generator": "Cuadrados Medios (Mid-Square)", "n": 1000, "seed": 5735,
+     "seed2": None, "const_a": None, "tests": [...], "alpha": 0.05, "k": 10,
+     "id": "opcional"}
+- generator/tests: nombre exacto del Registry, su slug
+  ("cuadrados_medios_mid_square") o un trozo único del slug que empiece
+  en una palabra ("mid_square").
+- tests: por defecto todas las registradas.
+- k: intervalos (m) de Uniformidad χ², como en la pestaña Variables.
+
+Cada corrida produce un registro JSON por prueba (el resultado de la
+prueba en formato JSON-lines de tests.result, con la tabla en columnas,
+más los parámetros de la corrida); si la corrida falla se
+produce un solo registro con "error". Los manifiestos se reparten en un
+ProcessPoolExecutor y los registros salen en el orden del manifiesto.
+
+Este módulo (y cli.py) no importa tkinter ni Matplotlib.
+"""
+from time import perf_counter
+from typing import Any, Dict, IO, Iterable, Iterator, List, Optional
+import json
+import pathlib
+import re
+import unicodedata
+
+from core.plugins import register_builtin_plugins
+from core.registry import Registry
+from tests.result import result_dict
+
+# Parámetros de una corrida y sus valores por defecto (los de AppState)
+JOB_DEFAULTS: Dict[str, Any] = {
+    "generator": None,
+    "n": 1000,
+    "seed": None,
+    "seed2": None,
+    "const_a": None,
+    "tests": None,
+    "alpha": 0.05,
+    "k": 10,
+}
+
+register_builtin_plugins()
+
+
+def slug(name: str) -> str:
+    """Nombre a slug sin acentos: Póker -> poker, Correlación serial -> correlacion_serial."""
+    plain = "".join(ch for ch in unicodedata.normalize("NFD", name) if not unicodedata.combining(ch))
+    return re.sub(r"[^0-9A-Za-z]+", "_", plain).strip("_").lower()
+
+
+def resolve(catalog: Dict[str, Any], name: str, kind: str) -> str:
+    """
+    Nombre registrado a partir del nombre exacto, su slug o un trozo único
+    del slug que empiece en una palabra ("mid_square", "congruencial_mixto").
+    """
+    if name in catalog:
+        return name
+    wanted = slug(name)
+    exact = [key for key in catalog if slug(key) == wanted]
+    matches = exact or [key for key in catalog if f"_{wanted}" in f"_{slug(key)}"]
+    if len(matches) == 1:
+        return matches[0]
+    if matches:
+        raise ValueError(f"'{name}' es ambiguo ({len(matches)} coincidencias):\n  " + "\n  ".join(matches))
+    options = "\n  ".join(catalog)
+    registered = "registrada" if kind == "prueba" else "registrado"
+    raise ValueError(f"No hay {kind} {registered} como '{name}'. Opciones:\n  {options}")
+
+
+def resolve_generator(name: str) -> str:
+    return resolve(Registry.generators, name, "generador")
+
+
+def resolve_tests(names: Optional[Iterable[str]]) -> List[str]:
+    if names is None:
+        return list(Registry.tests)
+    return [resolve(Registry.tests, name, "prueba") for name in names]
+
+
+def generator_kwargs(gen_name: str, job: Dict[str, Any]) -> Dict[str, Any]:
+    """kwargs de init_state/generate (seed2, const_a) con las validaciones de la GUI."""
+    gen_cls = Registry.generators[gen_name]
+    kwargs: Dict[str, Any] = {}
+    if job.get("seed") is None:
+        raise ValueError("Falta la semilla (seed).")
+    if getattr(gen_cls, "required_seeds", 1) == 2:
+        if job.get("seed2") is None:
+            raise ValueError(f"'{gen_name}' requiere dos semillas (seed y seed2).")
+        kwargs["seed2"] = int(job["seed2"])
+    if getattr(gen_cls, "requires_constant", False):
+        if job.get("const_a") is None:
+            raise ValueError(f"'{gen_name}' requiere la constante const_a.")
+        kwargs["const_a"] = int(job["const_a"])
+    return kwargs
+
+
+def normalize_job(job: Dict[str, Any]) -> Dict[str, Any]:
+    """Completa con JOB_DEFAULTS y resuelve los nombres del generador y las pruebas."""
+    unknown = set(job) - set(JOB_DEFAULTS) - {"id"}
+    if unknown:
+        raise ValueError(f"Parámetros desconocidos: {', '.join(sorted(unknown))}.")
+    spec = dict(JOB_DEFAULTS)
+    spec.update(job)
+    if spec["generator"] is None:
+        raise ValueError("Falta el generador (generator).")
+    spec["generator"] = resolve_generator(str(spec["generator"]))
+    spec["tests"] = resolve_tests(spec["tests"])
+    spec["n"] = int(spec["n"])
+    if spec["n"] <= 0:
+        raise ValueError("n debe ser un entero positivo.")
+    return spec
+
+
+# ----------------- Generación -----------------
+
+def stream_values(gen_name: str, n: int, seed: int, block_size: int,
+                  dtype: Any = None, **kwargs) -> Iterator[Any]:
+    """Bloques NumPy de la secuencia (memoria constante, ver RandomGenerator.stream)."""
+    gen = Registry.generators[gen_name]()
+    state = gen.init_state(seed, **kwargs)
+    return gen.stream(state, block_size=block_size, n=n, dtype=dtype)
+
+
+def write_values(chunks: Iterable[Any], fh: IO, fmt: str = "txt", start: int = 0) -> int:
+    """
+    Escribe los bloques en `fh` y retorna la cantidad de valores.
+    fmt: "txt" (un valor por línea), "csv" (index,value como utils.exporter;
+    el encabezado lo escribe quien llama) o "bin" (bytes crudos del dtype;
+    `fh` binario).
+    """
+    import numpy as np
+
+    count = start
+    for chunk in chunks:
+        if fmt == "bin":
+            fh.write(np.ascontiguousarray(chunk).tobytes())
+        else:
+            value_fmt = "%d" if chunk.dtype.kind == "u" else "%.17g"
+            if fmt == "csv":
+                rows = np.column_stack((np.arange(count, count + chunk.shape[0]), chunk))
+                np.savetxt(fh, rows, fmt=("%d", value_fmt), delimiter=",")
+            else:
+                np.savetxt(fh, chunk, fmt=value_fmt)
+        count += chunk.shape[0]
+    return count - start
+
+
+# ----------------- Pruebas -----------------
+
+def run_job(job: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Ejecuta una corrida ya normalizada (o no) y retorna sus registros. Los
+    errores de la corrida se devuelven como registro, no se lanzan (así un
+    manifiesto sigue con las demás corridas).
+    """
+    from core.test_runner import run_tests
+
+    base = {"id": job.get("id")}
+    try:
+        spec = normalize_job(job)
+        base.update({key: spec[key] for key in ("generator", "n", "seed", "seed2", "const_a",
+                                                "alpha", "k")})
+        kwargs = generator_kwargs(spec["generator"], spec)
+        t0 = perf_counter()
+        gen = Registry.generators[spec["generator"]]()
+        # Mismas opciones que la GUI: se corta al detectar el ciclo y se repite
+        seq = gen.generate(spec["n"], int(spec["seed"]), trace=False, detect_cycles=True, **kwargs)
+        gen_seconds = perf_counter() - t0
+        run = run_tests(seq, spec["tests"], alpha=float(spec["alpha"]), k=int(spec["k"]),
+                        m=int(spec["k"]))
+    except Exception as e:          # noqa: BLE001 - se reporta en el registro de la corrida
+        return [dict(base, error=f"{type(e).__name__}: {e}")]
+
+    records = []
+    for name, result in zip(spec["tests"], run["results"]):
+        record = dict(base, test=name, generation_seconds=gen_seconds,
+                      seconds=run["timings"].get(name))
+        record.update(result_dict(result))
+        records.append(record)
+    return records
+
+
+def load_manifest(path: str) -> List[Dict[str, Any]]:
+    """
+    Lee un manifiesto:
+    - .jsonl: una corrida por línea (las líneas vacías y las que empiezan
+      con '#' se ignoran);
+    - .json: una lista de corridas, o {"defaults": {...}, "runs": [...]}.
+    Las corridas sin "id" reciben su posición en el manifiesto.
+    """
+    p = pathlib.Path(path)
+    text = p.read_text(encoding="utf-8")
+    defaults: Dict[str, Any] = {}
+    if p.suffix == ".jsonl":
+        runs = [json.loads(line) for line in text.splitlines()
+                if line.strip() and not line.lstrip().startswith("#")]
+    else:
+        data = json.loads(text)
+        if isinstance(data, dict):
+            defaults = data.get("defaults", {})
+            runs = data.get("runs", [])
+        else:
+            runs = data
+    jobs = []
+    for i, run in enumerate(runs):
+        job = dict(defaults)
+        job.update(run)
+        job.setdefault("id", i)
+        jobs.append(job)
+    return jobs
+
+
+def run_manifest(jobs: List[Dict[str, Any]], workers: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Registros de todas las corridas, en el orden del manifiesto. Con
+    workers=1 se ejecuta en este proceso; si no, en un ProcessPoolExecutor
+    (workers=None: un proceso por CPU).
+    """
+    if workers == 1 or len(jobs) <= 1:
+        for job in jobs:
+            yield from run_job(job)
+        return
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for records in pool.map(run_job, jobs):
+            yield from records
+
+
+def write_records(records: Iterable[Dict[str, Any]], fh: IO) -> Dict[str, int]:
+    """JSON lines (una línea por registro, se vacía el búfer en cada una)."""
+    counts = {"records": 0, "errors": 0, "failed": 0}
+    for record in records:
+        fh.write(json.dumps(record, ensure_ascii=False, default=_json_default) + "\n")
+        fh.flush()
+        counts["records"] += 1
+        if "error" in record:
+            counts["errors"] += 1
+        elif not record.get("passed", True):
+            counts["failed"] += 1
+    return counts
+
+
+def _json_default(value: Any) -> Any:
+    # Escalares y arreglos NumPy dentro de los resultados
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    raise TypeError(f"{type(value).__name__} no es serializable a JSON.")
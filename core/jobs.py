@@ -0,0 +1,185 @@
+"""
+Trabajos en segundo plano para la GUI: un hilo por trabajo y una cola de
+mensajes que el loop de Tk vacía con `after()`.
+
+Pasos:
+1) JobRunner.submit(fn, *args, on_progress=..., on_partial=..., on_done=...,
+   on_error=..., on_cancel=...) arranca un hilo (daemon) que ejecuta
+   fn(ctx, *args, **kwargs); ctx es el JobContext del trabajo.
+2) Desde el hilo, el trabajo solo encola mensajes:
+   - ctx.progress(hechos, total, texto)  -> on_progress(hechos, total, texto)
+   - ctx.partial(payload)                -> on_partial(payload)
+   - retorno de fn                       -> on_done(valor)
+   - excepción                           -> on_error(excepción)
+   - JobCancelled                        -> on_cancel()
+3) JobRunner.pump() vacía la cola y llama los callbacks en el hilo que lo
+   invoca. Con un widget (cualquier objeto con `after`), el runner se
+   reprograma cada POLL_MS mientras haya trabajos activos: los widgets solo
+   se tocan desde el loop de Tk y la ventana sigue respondiendo.
+
+Cancelación cooperativa: JobRunner.cancel(job) marca el trabajo y
+ctx.check() (también ctx.progress / ctx.partial) lanza JobCancelled en el
+siguiente punto de control; un cálculo de NumPy en curso no se interrumpe.
+Los mensajes de progreso de un trabajo ya cancelado se descartan.
+
+Se usa un hilo y no un proceso: la secuencia, la traza y los resultados se
+entregan sin copiarlos ni serializarlos, y NumPy suelta el GIL en los
+cálculos grandes. Las pruebas de segundo nivel siguen repartiendo bloques
+entre procesos (core.second_level) desde el hilo del trabajo.
+Este módulo no importa tkinter (se puede usar y probar sin pantalla).
+"""
+from typing import Any, Callable, Dict, Optional
+import itertools
+import queue
+import threading
+
+# Intervalo de sondeo de la cola desde el loop de Tk (ms)
+POLL_MS = 50
+
+
+class JobCancelled(Exception):
+    """El trabajo se detuvo porque se pidió cancelarlo."""
+
+
+class JobContext:
+    """Lo que ve la función del trabajo: progreso, resultados parciales y cancelación."""
+
+    def __init__(self, job_id: int, messages: "queue.Queue"):
+        self.job_id = job_id
+        self._messages = messages
+        self._cancel = threading.Event()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel.is_set()
+
+    def cancel(self) -> None:
+        self._cancel.set()
+
+    def check(self) -> None:
+        """Punto de cancelación: lanza JobCancelled si se pidió cancelar."""
+        if self._cancel.is_set():
+            raise JobCancelled()
+
+    def progress(self, done: int, total: int, text: str = "") -> None:
+        self.check()
+        self._messages.put((self.job_id, "progress", (done, total, text)))
+
+    def partial(self, payload: Any) -> None:
+        self.check()
+        self._messages.put((self.job_id, "partial", payload))
+
+
+class Job:
+    """Un trabajo enviado: su contexto, sus callbacks y su hilo."""
+    __slots__ = ("ctx", "callbacks", "thread")
+
+    def __init__(self, ctx: JobContext, callbacks: Dict[str, Optional[Callable]], thread: threading.Thread):
+        self.ctx = ctx
+        self.callbacks = callbacks
+        self.thread = thread
+
+    @property
+    def job_id(self) -> int:
+        return self.ctx.job_id
+
+    @property
+    def cancelled(self) -> bool:
+        return self.ctx.cancelled
+
+
+class JobRunner:
+    def __init__(self, widget: Any = None, interval_ms: int = POLL_MS):
+        self.widget = widget
+        self.interval_ms = int(interval_ms)
+        self._messages: "queue.Queue" = queue.Queue()
+        self._jobs: Dict[int, Job] = {}
+        self._ids = itertools.count(1)
+        self._polling = False
+
+    # ----------------- Envío y cancelación -----------------
+
+    def submit(self, fn: Callable[..., Any], *args,
+               on_progress: Optional[Callable[[int, int, str], None]] = None,
+               on_partial: Optional[Callable[[Any], None]] = None,
+               on_done: Optional[Callable[[Any], None]] = None,
+               on_error: Optional[Callable[[BaseException], None]] = None,
+               on_cancel: Optional[Callable[[], None]] = None,
+               **kwargs) -> Job:
+        """Ejecuta fn(ctx, *args, **kwargs) en un hilo nuevo (ver docstring del módulo)."""
+        ctx = JobContext(next(self._ids), self._messages)
+        callbacks = {"progress": on_progress, "partial": on_partial, "done": on_done,
+                     "error": on_error, "cancelled": on_cancel}
+        thread = threading.Thread(target=self._work, args=(ctx, fn, args, kwargs),
+                                  name=f"job-{ctx.job_id}", daemon=True)
+        job = Job(ctx, callbacks, thread)
+        self._jobs[ctx.job_id] = job
+        thread.start()
+        self._schedule()
+        return job
+
+    def cancel(self, job: Optional[Job] = None) -> None:
+        """Pide cancelar `job` (o todos los activos)."""
+        for j in ([job] if job is not None else list(self._jobs.values())):
+            j.ctx.cancel()
+
+    @property
+    def busy(self) -> bool:
+        return bool(self._jobs)
+
+    def _work(self, ctx: JobContext, fn: Callable[..., Any], args: tuple, kwargs: Dict[str, Any]) -> None:
+        try:
+            value = fn(ctx, *args, **kwargs)
+        except JobCancelled:
+            self._messages.put((ctx.job_id, "cancelled", None))
+        except Exception as e:
+            self._messages.put((ctx.job_id, "error", e))
+        else:
+            self._messages.put((ctx.job_id, "done", value))
+
+    # ----------------- Entrega en el hilo de la GUI -----------------
+
+    def pump(self) -> int:
+        """Vacía la cola llamando los callbacks; retorna cuántos mensajes entregó."""
+        delivered = 0
+        while True:
+            try:
+                job_id, kind, payload = self._messages.get_nowait()
+            except queue.Empty:
+                return delivered
+            job = self._jobs.get(job_id)
+            if job is None:
+                continue
+            if kind in ("done", "error", "cancelled"):
+                del self._jobs[job_id]
+            elif job.cancelled:
+                continue
+            callback = job.callbacks[kind]
+            delivered += 1
+            if callback is None:
+                continue
+            if kind == "progress":
+                callback(*payload)
+            elif kind == "cancelled":
+                callback()
+            else:
+                callback(payload)
+
+    def join(self, timeout: Optional[float] = None) -> None:
+        """Espera a los trabajos activos y entrega sus mensajes (uso sin GUI)."""
+        for job in list(self._jobs.values()):
+            job.thread.join(timeout)
+        self.pump()
+
+    def _schedule(self) -> None:
+        if self.widget is not None and not self._polling:
+            self._polling = True
+            self.widget.after(self.interval_ms, self._poll)
+
+    def _poll(self) -> None:
+        self._polling = False
+        try:
+            self.pump()
+        finally:
+            if self._jobs:
+                self._schedule()
@@ -0,0 +1,54 @@
+"""
+Catálogo de los plugins incluidos, como descriptores de carga diferida
+(ver core.registry.PluginDescriptor).
+
+Registrar el catálogo no importa ningún generador ni prueba: la GUI arma
+sus listas con los nombres y muestra los campos de semillas/constante con
+los metadatos del descriptor; el módulo se importa al generar o probar por
+primera vez. Los metadatos deben coincidir con los atributos de la clase
+(PluginDescriptor.load lo verifica).
+"""
+from core.registry import PluginDescriptor, Registry
+
+# Generadores visibles en la GUI (generators.numpy_uniform no se incluye)
+BUILTIN_GENERATORS = (
+    PluginDescriptor("Cuadrados Medios (Mid-Square)", "generator", "generators.mid_square", "MidSquare"),
+    PluginDescriptor("Productos Medios (Middle Product)", "generator", "generators.productos_medios",
+                     "MiddleProduct", required_seeds=2),
+    PluginDescriptor("Multiplicador Constante", "generator", "generators.multiplicador_constante",
+                     "ConstantMultiplier", requires_constant=True),
+    PluginDescriptor("Congruencial Mixto (LCG)", "generator", "generators.congruencial",
+                     "MixedCongruential"),
+    PluginDescriptor("Congruencial Multiplicativo (Park–Miller)", "generator", "generators.congruencial",
+                     "MultiplicativeCongruential"),
+)
+
+# Pruebas activas (sin placeholders)
+BUILTIN_TESTS = (
+    PluginDescriptor("Medias Z (Uniforme[0,1])", "test", "tests.medias", "MeanZTest"),
+    PluginDescriptor("Varianza χ² (Uniforme[0,1])", "test", "tests.varianza", "VarianceChiSquare"),
+    PluginDescriptor("Uniformidad χ² (Uniforme[0,1])", "test", "tests.uniformidad_chi2",
+                     "UniformityChiSquare"),
+    PluginDescriptor("Serial χ² (d-tuplas)", "test", "tests.serial_chi2", "SerialChiSquare"),
+    PluginDescriptor("Corridas arriba y abajo", "test", "tests.corridas", "RunsUpDownTest"),
+    PluginDescriptor("Corridas arriba y abajo de la media", "test", "tests.corridas_media",
+                     "RunsAboveBelowMeanTest"),
+    PluginDescriptor("Póker", "test", "tests.poker", "PokerTest"),
+    PluginDescriptor("Huecos", "test", "tests.huecos", "GapTest"),
+    PluginDescriptor("Correlación serial", "test", "tests.correlacion_serial", "SerialCorrelationTest"),
+)
+
+
+def register_builtin_generators() -> None:
+    for descriptor in BUILTIN_GENERATORS:
+        Registry.describe(descriptor)
+
+
+def register_builtin_tests() -> None:
+    for descriptor in BUILTIN_TESTS:
+        Registry.describe(descriptor)
+
+
+def register_builtin_plugins() -> None:
+    register_builtin_generators()
+    register_builtin_tests()
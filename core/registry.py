@@ -1,13 +1,46 @@
 """
 Registro global de plugins (generadores y pruebas) sin dependencias
 de runtime hacia 'tests.*' ni 'generators.*' para evitar imports circulares.
+
+Carga diferida: en lugar de importar el módulo de un plugin al arrancar,
+se puede registrar un PluginDescriptor (nombre, módulo, atributo y los
+metadatos que la GUI necesita: required_seeds, requires_constant). El
+descriptor es callable igual que la clase: la primera llamada importa el
+módulo, y el módulo al cargarse se registra con register_generator /
+register_test, reemplazando al descriptor en el mismo lugar del catálogo.
 """
 
+from dataclasses import dataclass
 from typing import Dict, Any, Callable
+import importlib
+
+@dataclass(frozen=True)
+class PluginDescriptor:
+    name: str
+    kind: str                       # "generator" o "test"
+    module: str                     # p.ej. "generators.mid_square"
+    attr: str                       # clase dentro del módulo
+    required_seeds: int = 1
+    requires_constant: bool = False
+
+    def load(self) -> Callable[..., Any]:
+        """Importa el módulo (solo la primera vez) y devuelve la clase."""
+        impl = getattr(importlib.import_module(self.module), self.attr)
+        if self.kind == "generator":
+            for meta, default in (("required_seeds", 1), ("requires_constant", False)):
+                declared, actual = getattr(self, meta), getattr(impl, meta, default)
+                if declared != actual:
+                    raise TypeError(f"El descriptor de '{self.name}' declara {meta}={declared!r}, "
+                                    f"pero {self.module}.{self.attr} tiene {actual!r}.")
+        return impl
+
+    def __call__(self, *args, **kwargs) -> Any:
+        return self.load()(*args, **kwargs)
+
 
 class Registry:
-    # Guardamos callables (clases o fábricas). No tipamos con clases concretas
-    # para no forzar imports en tiempo de carga.
+    # Guardamos callables (clases, fábricas o PluginDescriptor). No tipamos con
+    # clases concretas para no forzar imports en tiempo de carga.
     generators: Dict[str, Callable[..., Any]] = {}
     tests: Dict[str, Callable[[], Any]] = {}
 
@@ -26,3 +59,20 @@ class Registry:
         Ej.: Registry.register_test("Varianza χ²", lambda: VarianceChiSquare())
         """
         cls.tests[name] = test_factory
+
+    @classmethod
+    def describe(cls, descriptor: PluginDescriptor) -> None:
+        """
+        Registra un plugin sin importarlo. Si el módulo ya se cargó (y se
+        registró), se conserva la implementación.
+        """
+        if descriptor.kind not in ("generator", "test"):
+            raise ValueError(f"Tipo de plugin desconocido: '{descriptor.kind}'.")
+        catalog = cls.generators if descriptor.kind == "generator" else cls.tests
+        catalog.setdefault(descriptor.name, descriptor)
+
+    @classmethod
+    def is_loaded(cls, name: str) -> bool:
+        """False si `name` sigue siendo un descriptor sin importar."""
+        entry = cls.generators.get(name, cls.tests.get(name))
+        return entry is not None and not isinstance(entry, PluginDescriptor)
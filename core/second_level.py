@@ -0,0 +1,214 @@
+"""
+Pruebas de segundo nivel: una prueba registrada aplicada a B bloques y,
+sobre los B p-values, una prueba de uniformidad.
+
+Bajo H0 cada p-value es Uniforme(0,1); un generador puede pasar la prueba
+sobre la secuencia completa y aun así dar p-values amontonados (demasiado
+buenos, o sesgados hacia 0 en algunos bloques).
+
+Entrada:
+- una secuencia 1-D que se parte en B bloques contiguos de L = n // B
+  valores (el resto final se descarta), o
+- una matriz (B, L): una secuencia por fila (p.ej. una por semilla).
+
+Pasos:
+1) p_i = p-value de la prueba sobre el bloque i (RandomnessTest.run_batch
+   por grupos de bloques, así las pruebas vectorizadas procesan el grupo
+   en una llamada).
+2) Segundo nivel sobre p_1..p_B:
+   - "ks":   D = max_i max(i/B - p_(i), p_(i) - (i-1)/B); p-value exacto
+             de KS (tests.quantiles.ks_sf).
+   - "chi2": histograma de `bins` intervalos iguales en [0,1],
+             χ² = Σ (O_j - B/bins)² / (B/bins), df = bins - 1.
+   Acepta H0 si p-value >= α.
+3) Se devuelve además el histograma de los p-values (bordes y conteos) para
+   mostrarlo (PruebasTab).
+
+Paralelismo: los grupos de bloques se reparten en un ProcessPoolExecutor.
+La matriz se copia una sola vez a memoria compartida
+(multiprocessing.shared_memory); cada proceso se adjunta por nombre y
+trabaja sobre vistas de sus filas, sin recibir copias serializadas. Cada
+tarea devuelve solo sus p-values. Con workers=1 (o pocos bloques) se
+calcula en el proceso actual.
+Los procesos se inician con "forkserver" (no fork): la GUI llama desde el
+hilo de un trabajo (core.jobs) y hacer fork de un proceso con varios hilos
+puede bloquear al hijo. Cada proceso registra las pruebas (`import tests`)
+y se adjunta a la memoria compartida por nombre, sin depender de fork.
+"""
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import os
+import numpy as np
+
+from core.registry import Registry
+from tests.quantiles import chi2_sf, ks_sf
+
+SECOND_LEVEL_METHODS = ("ks", "chi2")
+SECOND_LEVEL_BINS = 10
+# Grupos por proceso: reparte la carga sin multiplicar el costo por tarea
+GROUPS_PER_WORKER = 4
+# Menos bloques que esto se calculan en el proceso actual
+PARALLEL_MIN_BLOCKS = 8
+# Inicio de los procesos (ver docstring del módulo)
+START_METHOD = "forkserver"
+
+
+def block_matrix(sequence: Any, blocks: Optional[int] = None) -> np.ndarray:
+    """Vista (B, L) de la entrada: filas de una matriz o bloques contiguos de una secuencia."""
+    a = np.asarray(sequence)
+    if a.ndim == 2:
+        return a
+    if a.ndim != 1:
+        raise ValueError("Se espera una secuencia 1-D o una matriz (bloques, valores).")
+    if blocks is None or int(blocks) < 2:
+        raise ValueError("Indica blocks >= 2 para partir la secuencia.")
+    B = int(blocks)
+    L = a.shape[0] // B
+    if L < 1:
+        raise ValueError(f"La secuencia ({a.shape[0]} valores) es más corta que blocks={B}.")
+    return a[:B * L].reshape(B, L)
+
+
+def block_p_values(test_name: str, matrix: np.ndarray, **kwargs) -> np.ndarray:
+    """p-value de `test_name` sobre cada fila de `matrix`."""
+    import tests  # noqa: F401  (autoregistro de pruebas en este proceso)
+
+    factory = Registry.tests.get(test_name)
+    if factory is None:
+        raise ValueError(f"Prueba '{test_name}' no registrada.")
+    res = factory().run_batch(matrix, **kwargs)
+    return np.broadcast_to(np.asarray(res["p_value"], dtype=float), (matrix.shape[0],)).copy()
+
+
+def _run_group(shm_name: str, shape: Tuple[int, int], dtype: str, lo: int, hi: int,
+               test_name: str, kwargs: Dict[str, Any]) -> Tuple[int, np.ndarray]:
+    """Trabajo de un proceso: p-values de las filas [lo, hi) de la matriz compartida."""
+    from multiprocessing import shared_memory
+
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        rows = np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)[lo:hi]
+        p = block_p_values(test_name, rows, **kwargs)
+        del rows                      # soltar la vista antes de cerrar el bloque compartido
+        return lo, p
+    finally:
+        shm.close()
+
+
+def parallel_p_values(test_name: str, matrix: np.ndarray, workers: Optional[int] = None,
+                      progress: Optional[Callable[[int, int], None]] = None,
+                      **kwargs) -> np.ndarray:
+    """
+    p-values por fila repartiendo grupos de filas entre procesos que leen
+    la matriz desde memoria compartida. `progress(hechos, total_grupos)` se
+    llama al terminar cada grupo; si lanza una excepción (p.ej. la
+    cancelación de core.jobs) los grupos aún no iniciados se descartan.
+    """
+    B = matrix.shape[0]
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1 or B < PARALLEL_MIN_BLOCKS:
+        p = block_p_values(test_name, matrix, **kwargs)
+        if progress is not None:
+            progress(1, 1)
+        return p
+
+    # Imports diferidos: la GUI importa este módulo al arrancar
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+    import multiprocessing
+    from multiprocessing import shared_memory
+
+    groups = min(B, workers * GROUPS_PER_WORKER)
+    bounds = np.linspace(0, B, groups + 1).astype(int)
+    M = np.ascontiguousarray(matrix)
+    shm = shared_memory.SharedMemory(create=True, size=max(M.nbytes, 1))
+    try:
+        shared = np.ndarray(M.shape, dtype=M.dtype, buffer=shm.buf)
+        shared[...] = M
+        p = np.empty(B, dtype=float)
+        with ProcessPoolExecutor(max_workers=workers,
+                                 mp_context=multiprocessing.get_context(START_METHOD)) as pool:
+            futures = [pool.submit(_run_group, shm.name, M.shape, M.dtype.str, int(lo), int(hi),
+                                   test_name, kwargs)
+                       for lo, hi in zip(bounds[:-1], bounds[1:]) if hi > lo]
+            try:
+                for done, fut in enumerate(as_completed(futures), start=1):
+                    lo, values = fut.result()
+                    p[lo:lo + values.shape[0]] = values
+                    if progress is not None:
+                        progress(done, len(futures))
+            except BaseException:
+                # Error o cancelación (progress lanzó): no esperar los grupos pendientes
+                for fut in futures:
+                    fut.cancel()
+                raise
+        del shared
+    finally:
+        shm.close()
+        shm.unlink()
+    return p
+
+
+def uniformity_of_p_values(p: np.ndarray, method: str = "ks", bins: int = SECOND_LEVEL_BINS,
+                           alpha: float = 0.05) -> Dict[str, Any]:
+    """Prueba de uniformidad (KS o χ²) sobre los p-values finitos."""
+    if method not in SECOND_LEVEL_METHODS:
+        raise ValueError(f"Método de segundo nivel desconocido: '{method}'. Usa {SECOND_LEVEL_METHODS}.")
+    q = np.sort(p[np.isfinite(p)])
+    B = q.shape[0]
+    counts, edges = np.histogram(q, bins=int(bins), range=(0.0, 1.0))
+    out: Dict[str, Any] = {"method": method, "histogram": {"edges": edges.tolist(), "counts": counts.tolist()}}
+    if B == 0:
+        out.update({"p_value": float("nan"), "passed": False})
+        return out
+    if method == "ks":
+        i = np.arange(1, B + 1)
+        D = float(max(np.max(i / B - q), np.max(q - (i - 1) / B)))
+        out.update({"ks_D": D, "p_value": ks_sf(D, B)})
+    else:
+        E = B / int(bins)
+        stat = float(np.sum((counts - E) ** 2) / E)
+        out.update({"df": int(bins) - 1, "chi2_stat": stat, "E": E,
+                    "p_value": chi2_sf(stat, int(bins) - 1)})
+    out["passed"] = bool(out["p_value"] >= alpha)
+    return out
+
+
+def second_level(sequence: Any, test_name: str, blocks: Optional[int] = None, method: str = "ks",
+                 bins: int = SECOND_LEVEL_BINS, workers: Optional[int] = None,
+                 progress: Optional[Callable[[int, int], None]] = None,
+                 **kwargs) -> Dict[str, Any]:
+    """
+    Prueba de segundo nivel de `test_name`. kwargs (alpha, m, k, scale, ...)
+    van a la prueba de cada bloque; alpha también al segundo nivel.
+    """
+    alpha = float(kwargs.get("alpha", 0.05))
+    M = block_matrix(sequence, blocks)
+    B, L = M.shape
+    p = parallel_p_values(test_name, M, workers=workers, progress=progress, **kwargs)
+
+    warnings: List[str] = []
+    finite = np.isfinite(p)
+    if not np.all(finite):
+        warnings.append(f"{int(np.count_nonzero(~finite))} bloques sin p-value; se omiten.")
+    if method == "chi2" and B / int(bins) < 5:
+        warnings.append(f"E = B/bins = {B / int(bins):.2f} < 5; usa más bloques o el método KS.")
+    if B < 10:
+        warnings.append("Menos de 10 bloques: el segundo nivel puede no ser fiable.")
+    level2 = uniformity_of_p_values(p, method, bins, alpha)
+
+    result: Dict[str, Any] = {
+        "test": f"Segundo nivel: {test_name}",
+        "alpha": alpha,
+        "blocks": B,
+        "block_size": L,
+        "method": method,
+        "passed_blocks": int(np.count_nonzero(p[finite] >= alpha)),
+        "p_values": p.tolist(),
+        **{k: v for k, v in level2.items() if k != "method"},
+        "conclusion": ("Los p-values de los bloques son uniformes (pasa segundo nivel)" if level2["passed"]
+                       else "Los p-values de los bloques no son uniformes (no pasa segundo nivel)"),
+        "status": "ok",
+    }
+    if warnings:
+        result["warnings"] = warnings
+        result["status"] = "warning"
+    return result
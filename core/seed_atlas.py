@@ -0,0 +1,282 @@
+"""
+Atlas de semillas: recorre TODAS las configuraciones de D dígitos de un
+generador y guarda, por configuración:
+- tail, period: cola y periodo del ciclo (MiddleDigitGenerator.find_cycle)
+- zero: si la secuencia cae en 0
+- passed: máscara de bits con las pruebas registradas que pasa sobre los
+  primeros n valores (bit i = i-ésima prueba de `tests` en meta.json); cada
+  prueba se aplica a todo el bloque con RandomnessTest.run_batch
+
+Configuraciones según el generador:
+- 1 semilla:               X0 en [10^(D-1), 10^D)
+- required_seeds == 2:     pares (X0, X1), ambos de D dígitos
+- requires_constant:       pares (a, X0), ambos de D dígitos
+
+El trabajo se parte en bloques de índices que se reparten en un
+ProcessPoolExecutor. Cada bloque terminado se escribe como
+`chunk_<inicio>.npz` (columnar) en el directorio del atlas; al reanudar se
+saltan los bloques ya escritos. El tamaño de bloque queda en meta.json y al
+reanudar se usa ese (no el pedido), así los bloques nuevos no se solapan con
+los viejos. Al final se consolidan en `atlas.npz`, solo si los bloques
+cubren exactamente [0, total).
+
+Directorio por defecto: $PSEUDOALEATORIOS_ATLAS o ~/.cache/pseudoaleatorios/atlas.
+"""
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import json
+import os
+import pathlib
+import re
+import tempfile
+import numpy as np
+
+from core.registry import Registry
+
+# Columnas del archivo y su dtype
+COLUMNS: Dict[str, Any] = {
+    "seed": np.int64,
+    "seed2": np.int64,      # -1 si no aplica
+    "const_a": np.int64,    # -1 si no aplica
+    "tail": np.int64,
+    "period": np.int64,
+    "zero": np.bool_,
+    "passed": np.uint32,
+}
+
+
+def default_atlas_dir() -> pathlib.Path:
+    env = os.environ.get("PSEUDOALEATORIOS_ATLAS")
+    if env:
+        return pathlib.Path(env)
+    return pathlib.Path.home() / ".cache" / "pseudoaleatorios" / "atlas"
+
+
+def _slug(name: str) -> str:
+    return re.sub(r"[^0-9A-Za-z]+", "_", name).strip("_").lower()
+
+
+def _run_chunk(gen_cls, D: int, lo: int, hi: int, n: int, alpha: float, k: int,
+               test_names: List[str], engine: str) -> Tuple[int, Dict[str, np.ndarray]]:
+    """Trabajo de un proceso: evalúa las configuraciones [lo, hi)."""
+    import tests  # noqa: F401  (autoregistro de pruebas en este proceso)
+
+    factories = [Registry.tests[name] for name in test_names]
+    gen = gen_cls()
+    size = hi - lo
+    cols = {name: np.zeros(size, dtype=dt) for name, dt in COLUMNS.items()}
+    seqs = np.empty((size, n), dtype=float)
+    for i in range(size):
+        kwargs = config_for(gen_cls, D, lo + i)
+        seed = kwargs.pop("seed")
+        cols["seed"][i] = seed
+        cols["seed2"][i] = kwargs.get("seed2", -1)
+        cols["const_a"][i] = kwargs.get("const_a", -1)
+
+        info = gen.find_cycle(seed, engine=engine, **kwargs)
+        cols["tail"][i] = info["tail"]
+        cols["period"][i] = info["period"]
+        cols["zero"][i] = info["zero"]
+
+        gen.generate(n, seed, trace=False, detect_cycles=True, engine=engine, out=seqs[i], **kwargs)
+
+    # Pruebas por lotes: una llamada por prueba para todo el bloque
+    for bit, factory in enumerate(factories):
+        res = factory().run_batch(seqs, alpha=alpha, k=k, m=k)
+        cols["passed"] |= np.asarray(res["passed"], dtype=np.uint32) << np.uint32(bit)
+    return lo, cols
+
+
+def config_count(gen_cls, D: int) -> int:
+    width = 9 * 10 ** (D - 1)          # cantidad de enteros con D dígitos
+    if getattr(gen_cls, "required_seeds", 1) == 2 or getattr(gen_cls, "requires_constant", False):
+        return width * width
+    return width
+
+
+def config_for(gen_cls, D: int, index: int) -> Dict[str, int]:
+    """Parámetros (seed y, si aplica, seed2 o const_a) de la configuración `index`."""
+    low = 10 ** (D - 1)
+    width = 9 * low
+    if getattr(gen_cls, "required_seeds", 1) == 2:
+        i, j = divmod(index, width)
+        return {"seed": low + i, "seed2": low + j}
+    if getattr(gen_cls, "requires_constant", False):
+        i, j = divmod(index, width)
+        return {"const_a": low + i, "seed": low + j}
+    return {"seed": low + index}
+
+
+class SeedAtlas:
+    def __init__(self, gen_name: str, D: int, n: int = 1000, alpha: float = 0.05, k: int = 10,
+                 directory: Optional[os.PathLike] = None, chunk_size: int = 2000,
+                 engine: str = "kernel"):
+        gen_cls = Registry.generators.get(gen_name)
+        if gen_cls is None:
+            raise ValueError(f"Generador '{gen_name}' no registrado.")
+        if D <= 3:
+            raise ValueError(f"El atlas requiere D>3. Recibido D={D}.")
+        self.gen_name = gen_name
+        self.gen_cls = gen_cls
+        self.D = int(D)
+        self.n = int(n)
+        self.alpha = float(alpha)
+        self.k = int(k)
+        self.chunk_size = int(chunk_size)
+        self.engine = engine
+        root = pathlib.Path(directory) if directory is not None else default_atlas_dir()
+        self.directory = root / f"{_slug(gen_name)}_D{self.D}"
+
+    @property
+    def total(self) -> int:
+        return config_count(self.gen_cls, self.D)
+
+    @property
+    def atlas_path(self) -> pathlib.Path:
+        return self.directory / "atlas.npz"
+
+    def _chunk_path(self, lo: int) -> pathlib.Path:
+        return self.directory / f"chunk_{lo:015d}.npz"
+
+    def _meta(self) -> Dict[str, Any]:
+        import tests  # noqa: F401  (las pruebas registradas definen los bits de `passed`)
+        return {"generator": self.gen_name, "D": self.D, "n": self.n, "alpha": self.alpha,
+                "k": self.k, "tests": list(Registry.tests.keys()), "total": self.total,
+                "chunk_size": self.chunk_size}
+
+    def _check_meta(self) -> Dict[str, Any]:
+        """
+        Crea meta.json o verifica que el atlas en disco use los mismos
+        parámetros. Un atlas existente impone su chunk_size (si no lo tenía,
+        se guarda el actual).
+        """
+        meta = self._meta()
+        p = self.directory / "meta.json"
+        if p.exists():
+            old = json.loads(p.read_text(encoding="utf-8"))
+            if {k: old.get(k) for k in ("n", "alpha", "k")} != {k: meta[k] for k in ("n", "alpha", "k")}:
+                raise ValueError(f"El atlas en {self.directory} usa otros parámetros (n, α, k); "
+                                 f"bórralo o usa otro directorio.")
+            if old.get("chunk_size") is None:
+                old["chunk_size"] = self.chunk_size
+                p.write_text(json.dumps(old, ensure_ascii=False, indent=2), encoding="utf-8")
+            self.chunk_size = int(old["chunk_size"])
+            return old
+        self.directory.mkdir(parents=True, exist_ok=True)
+        p.write_text(json.dumps(meta, ensure_ascii=False, indent=2), encoding="utf-8")
+        return meta
+
+    def pending(self) -> List[Tuple[int, int]]:
+        """Bloques [lo, hi) que aún no tienen archivo."""
+        total = self.total
+        return [(lo, min(lo + self.chunk_size, total))
+                for lo in range(0, total, self.chunk_size)
+                if not self._chunk_path(lo).exists()]
+
+    def run(self, workers: Optional[int] = None,
+            progress: Optional[Callable[[int, int], None]] = None) -> Dict[str, np.ndarray]:
+        """
+        Ejecuta (o reanuda) el atlas. `progress(hechos, total_bloques)` se
+        llama cada vez que se guarda un bloque. Retorna las columnas consolidadas.
+        """
+        meta = self._check_meta()
+        todo = self.pending()
+        n_chunks = -(-self.total // self.chunk_size)
+        done = n_chunks - len(todo)
+        if todo:
+            # Import diferido: la GUI importa este módulo al arrancar y no necesita multiprocessing
+            from concurrent.futures import ProcessPoolExecutor, as_completed
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [pool.submit(_run_chunk, self.gen_cls, self.D, lo, hi, self.n,
+                                       self.alpha, self.k, meta["tests"], self.engine)
+                           for lo, hi in todo]
+                for fut in as_completed(futures):
+                    lo, cols = fut.result()
+                    self._save(self._chunk_path(lo), cols)
+                    done += 1
+                    if progress is not None:
+                        progress(done, n_chunks)
+        return self.consolidate()
+
+    def consolidate(self) -> Dict[str, np.ndarray]:
+        """
+        Une los bloques en atlas.npz (columnar, ordenado por configuración).
+        Bloques solapados son un error; con huecos se retornan las columnas
+        unidas pero atlas.npz no se escribe.
+        """
+        parts = []
+        end = 0
+        complete = True
+        for p in sorted(self.directory.glob("chunk_*.npz")):
+            lo = int(p.stem.split("_")[1])
+            with np.load(p) as data:
+                part = {name: data[name] for name in COLUMNS}
+            if lo < end:
+                raise ValueError(f"El bloque {p.name} se solapa con el anterior (termina en {end}); "
+                                 f"el atlas en {self.directory} mezcla tamaños de bloque.")
+            complete = complete and lo == end
+            end = lo + part["seed"].shape[0]
+            parts.append(part)
+        cols = {name: (np.concatenate([c[name] for c in parts]) if parts
+                       else np.zeros(0, dtype=dt)) for name, dt in COLUMNS.items()}
+        if complete and end == self.total:
+            self._save(self.atlas_path, cols)
+        return cols
+
+    def load(self) -> Optional[Dict[str, np.ndarray]]:
+        """Columnas del atlas consolidado, o None si aún no existe."""
+        if not self.atlas_path.exists():
+            return None
+        with np.load(self.atlas_path) as data:
+            return {name: data[name] for name in COLUMNS}
+
+    @staticmethod
+    def _save(path: pathlib.Path, cols: Dict[str, np.ndarray]) -> None:
+        fd, tmp = tempfile.mkstemp(prefix=".tmp_", suffix=".npz", dir=path.parent)
+        os.close(fd)
+        try:
+            np.savez(tmp, **cols)
+            os.replace(tmp, path)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
+
+
+def _popcount(mask: np.ndarray) -> np.ndarray:
+    mask = mask.astype(np.uint32)
+    count = np.zeros(mask.shape, dtype=np.int64)
+    while np.any(mask):
+        count += (mask & 1).astype(np.int64)
+        mask >>= 1
+    return count
+
+
+def suggest_seeds(gen_name: str, limit: int = 20,
+                  directory: Optional[os.PathLike] = None) -> List[Dict[str, Any]]:
+    """
+    Mejores configuraciones de los atlas consolidados de `gen_name` (todos
+    los D disponibles): se descartan las que caen en 0 y se ordenan por
+    cantidad de pruebas que pasan, luego periodo y luego cola más largos.
+    """
+    root = pathlib.Path(directory) if directory is not None else default_atlas_dir()
+    suggestions: List[Dict[str, Any]] = []
+    for atlas_dir in sorted(root.glob(f"{_slug(gen_name)}_D*")):
+        meta_p, atlas_p = atlas_dir / "meta.json", atlas_dir / "atlas.npz"
+        if not (meta_p.exists() and atlas_p.exists()):
+            continue
+        meta = json.loads(meta_p.read_text(encoding="utf-8"))
+        with np.load(atlas_p) as data:
+            ok = np.flatnonzero(~data["zero"])
+            passed = _popcount(data["passed"][ok])
+            order = np.lexsort((-data["tail"][ok], -data["period"][ok], -passed))[:limit]
+            for i, n_passed in zip(ok[order], passed[order]):
+                item = {"D": meta["D"], "seed": int(data["seed"][i]),
+                        "period": int(data["period"][i]), "tail": int(data["tail"][i]),
+                        "passed": int(n_passed), "tests": len(meta["tests"])}
+                if data["seed2"][i] >= 0:
+                    item["seed2"] = int(data["seed2"][i])
+                if data["const_a"][i] >= 0:
+                    item["const_a"] = int(data["const_a"][i])
+                suggestions.append(item)
+    suggestions.sort(key=lambda s: (-s["passed"], -s["period"], -s["tail"]))
+    return suggestions[:limit]
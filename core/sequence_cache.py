@@ -0,0 +1,220 @@
+"""
+Caché LRU de secuencias generadas, con extensión de prefijo.
+
+Clave: (generador, semilla, semilla 2, constante a, D, parámetros extra del
+estado, detect_cycles). Solo se cachean salidas float64 (sin dtype ni out).
+Cada entrada guarda:
+- values:     la secuencia float64 ya generada (prefijo de largo n)
+- state:      el GeneratorState al terminar (paso n)
+- trace:      la GenerationTrace, si se generó con traza
+- cycle_info: metadatos del ciclo, si ya se cerró dentro del prefijo
+
+Al pedir n' valores con la misma clave:
+- n' <= n   -> acierto: se devuelven vistas de solo lectura de los primeros n'
+- n' >  n   -> extensión: solo se calcula el tramo [n, n') con
+               RandomGenerator.extend desde el estado guardado (o se repite
+               el ciclo si ya se conocía)
+- sin clave -> fallo: se genera desde X0
+Una entrada sin traza no puede extenderse si ahora se pide traza: cuenta
+como fallo y se regenera.
+
+El tamaño total (values + columnas de la traza) se limita a `max_bytes`
+desalojando las entradas menos usadas; una entrada que por sí sola excede
+el tope no se guarda. Por defecto $PSEUDOALEATORIOS_SEQ_CACHE_MB (256 MB).
+
+Con `progress(hechos, n)` (la GUI lo usa desde core.jobs) lo que falta se
+calcula por tramos: el primero de GENERATE_CHUNK valores y cada siguiente
+del largo de lo ya hecho, sobre los mismos arreglos de n valores (sin
+copias por tramo). `progress` se llama tras cada tramo y puede lanzar una
+excepción (p.ej. JobCancelled) para abortar: la caché queda como estaba.
+Los tramos comparten el dict de estados vistos (`seen` de extend), así
+que los ciclos se detectan igual que generando todo de una vez.
+
+Es seguro usarla desde varios hilos (un lock por caché); la GUI y los
+procesos sin GUI comparten `default_sequence_cache()`.
+"""
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterator, Optional, Tuple
+import os
+import threading
+import numpy as np
+
+from core.registry import Registry
+
+# Primer tramo de la generación con progreso (los siguientes duplican lo hecho)
+GENERATE_CHUNK = 1 << 16
+
+
+def default_max_bytes() -> int:
+    return int(float(os.environ.get("PSEUDOALEATORIOS_SEQ_CACHE_MB", 256)) * 1024 * 1024)
+
+
+class _Entry:
+    __slots__ = ("values", "state", "trace", "cycle_info")
+
+    def __init__(self, values: np.ndarray, state: Any, trace: Any, cycle_info: Optional[Dict[str, Any]]):
+        self.values = values
+        self.state = state
+        self.trace = trace
+        self.cycle_info = cycle_info
+
+    @property
+    def n(self) -> int:
+        return int(self.values.shape[0])
+
+    @property
+    def nbytes(self) -> int:
+        return int(self.values.nbytes + (self.trace.nbytes if self.trace is not None else 0))
+
+
+class SequenceCache:
+    def __init__(self, max_bytes: Optional[int] = None):
+        self.max_bytes = int(max_bytes) if max_bytes is not None else default_max_bytes()
+        self._entries: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.extensions = 0
+        self.misses = 0
+
+    # ----------------- Consulta -----------------
+
+    @staticmethod
+    def key(gen_name: str, seed: Optional[int], state: Any, **kwargs) -> Hashable:
+        """(generador, semilla, semilla 2, a, D, parámetros extra del estado, detect_cycles)."""
+        return (gen_name, seed, kwargs.get("seed2"), state.a, state.D,
+                tuple(sorted(state.params.items())), bool(kwargs.get("detect_cycles", False)))
+
+    def generate(self, gen_name: str, n: int, seed: Optional[int],
+                 progress: Optional[Callable[[int, int], None]] = None, **kwargs) -> Dict[str, Any]:
+        """
+        Equivalente a Registry.generators[gen_name]().generate(n, seed, **kwargs)
+        pasando por la caché. Retorna {"values", "trace", "cycle_info", "source"}
+        con source en ("hit", "extend", "miss"). Los arreglos son de solo lectura.
+        Con `progress` se genera por tramos (ver docstring del módulo).
+        """
+        gen_cls = Registry.generators.get(gen_name)
+        if gen_cls is None:
+            raise ValueError(f"Generador '{gen_name}' no registrado.")
+        if n <= 0:
+            raise ValueError("n debe ser un entero positivo.")
+        if kwargs.get("dtype") is not None or kwargs.get("out") is not None:
+            raise ValueError("La caché de secuencias solo guarda float64; usa el generador directamente.")
+        gen = gen_cls()
+        record = bool(kwargs.get("trace", True)) and hasattr(gen, "trace")
+        origin = gen.init_state(seed, **kwargs)
+        key = self.key(gen_name, seed, origin, **kwargs)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and record and entry.trace is None:
+                entry = None                    # no se puede extender una traza que no se guardó
+            if entry is not None and n <= entry.n:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return self._result(entry, n, record, "hit")
+
+            if entry is not None:
+                source = "extend"
+                self.extensions += 1
+                entry = self._extend(gen, entry, n, origin, progress, **kwargs)
+            else:
+                source = "miss"
+                self.misses += 1
+                # Con progreso se parte de 0 valores y todo se calcula por tramos
+                values = gen.generate(n if progress is None else 0, seed, **kwargs)
+                entry = _Entry(values, gen.last_state, getattr(gen, "trace", None) if record else None,
+                               getattr(gen, "cycle_info", None))
+                if progress is not None:
+                    entry = self._extend(gen, entry, n, origin, progress, **kwargs)
+            self._store(key, entry)
+            return self._result(entry, n, record, source)
+
+    def _extend(self, gen: Any, entry: _Entry, n: int, origin: Any,
+                progress: Optional[Callable[[int, int], None]] = None, **kwargs) -> _Entry:
+        """
+        Nueva entrada de n valores: copia el prefijo y calcula solo el resto.
+        `origin` (estado inicial) permite ubicar la cola exacta de un ciclo
+        que empezó en el prefijo aunque la entrada no tenga traza.
+        """
+        start = entry.n
+        values = np.empty(n, dtype=entry.values.dtype)
+        values[:start] = entry.values
+        trace = entry.trace.with_length(n) if entry.trace is not None else None
+        state = entry.state.copy()
+        cycle_info = entry.cycle_info
+        ext_kwargs = {k: v for k, v in kwargs.items() if k != "trace"}
+        # Estados vistos: uno para todos los tramos (el ciclo puede cruzarlos)
+        seen: Dict[Hashable, int] = {}
+        for lo, hi in self._chunks(start, n, progress is not None):
+            # Vistas de largo hi: extend llena las filas [lo, hi)
+            part = trace.with_length(hi) if trace is not None else None
+            if part is not None or cycle_info is not None:
+                cycle_info = gen.extend(state, values[:hi], lo, trace=part,
+                                        cycle_info=cycle_info, origin=origin, seen=seen, **ext_kwargs)
+            else:
+                cycle_info = gen.extend(state, values[:hi], lo, origin=origin, seen=seen, **ext_kwargs)
+            if progress is not None:
+                progress(hi, n)
+        return _Entry(values, state, trace, cycle_info)
+
+    @staticmethod
+    def _chunks(start: int, n: int, chunked: bool) -> Iterator[Tuple[int, int]]:
+        """Tramos [lo, hi) de start a n: uno solo, o duplicando lo hecho."""
+        lo = start
+        while lo < n:
+            hi = n if not chunked else min(n, lo + max(lo, GENERATE_CHUNK))
+            yield lo, hi
+            lo = hi
+
+    @staticmethod
+    def _result(entry: _Entry, n: int, record: bool, source: str) -> Dict[str, Any]:
+        values = entry.values[:n]
+        values.flags.writeable = False
+        trace = entry.trace.with_length(n) if record and entry.trace is not None else None
+        cycle_info = entry.cycle_info
+        if cycle_info is not None and cycle_info["tail"] + cycle_info["period"] > n:
+            cycle_info = None                   # con n valores el ciclo aún no se cierra
+        return {"values": values, "trace": trace, "cycle_info": cycle_info, "source": source}
+
+    # ----------------- Tope y desalojo -----------------
+
+    def _store(self, key: Hashable, entry: _Entry) -> None:
+        self._entries.pop(key, None)
+        if entry.nbytes > self.max_bytes:
+            return
+        self._entries[key] = entry
+        self._evict()
+
+    def _evict(self) -> None:
+        total = self.nbytes
+        while total > self.max_bytes and len(self._entries) > 1:
+            _, old = self._entries.popitem(last=False)
+            total -= old.nbytes
+
+    @property
+    def nbytes(self) -> int:
+        with self._lock:
+            return sum(e.nbytes for e in self._entries.values())
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"entries": len(self._entries), "nbytes": self.nbytes, "max_bytes": self.max_bytes,
+                    "hits": self.hits, "extensions": self.extensions, "misses": self.misses}
+
+
+# Instancia compartida por la GUI y los procesos sin GUI
+_default_sequence_cache: Optional[SequenceCache] = None
+
+
+def default_sequence_cache() -> SequenceCache:
+    global _default_sequence_cache
+    if _default_sequence_cache is None:
+        _default_sequence_cache = SequenceCache()
+    return _default_sequence_cache
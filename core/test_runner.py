@@ -0,0 +1,91 @@
+"""
+Ejecución conjunta de pruebas: una sola pasada sobre la secuencia.
+
+Las pruebas que implementan `run_stats` (ver tests.accumulator) solo
+necesitan estadísticos suficientes: n, media, M2, min/max, conteos fuera de
+rango y, si alguna lo pide, las frecuencias en m intervalos. El runner:
+1) pregunta a cada prueba seleccionada si necesita intervalos
+   (`stats_bins(n, **kwargs)`, p.ej. el m efectivo de Uniformidad χ²),
+2) llena UN SufficientStats recorriendo la secuencia por tramos de
+   FUSED_CHUNK valores (caben en caché, así la media, M2, min/max y el
+   bincount de floor(u*m) de cada tramo no vuelven a leer memoria),
+3) entrega ese acumulador a cada prueba con run_stats.
+Las pruebas sin run_stats (o que piden otro m) se ejecutan con run sobre la
+secuencia, como antes. Los dicts de resultado son los mismos que da `run`.
+
+Se mide el tiempo de la pasada compartida y el de cada prueba. Con
+`progress(hechas, total, nombre, resultado)` se avisa al terminar cada
+prueba (la GUI muestra así resultados parciales desde core.jobs; si el
+callback lanza una excepción, las pruebas restantes no se ejecutan).
+"""
+from time import perf_counter
+from typing import Any, Callable, Dict, Iterable, List, Optional
+import numpy as np
+
+from core.registry import Registry
+from tests.accumulator import SufficientStats
+from tests.base import RandomnessTest
+
+# Valores por tramo de la pasada compartida
+FUSED_CHUNK = 1 << 16
+
+# Clave de `timings` para la pasada compartida
+SHARED_PASS = "pasada compartida"
+
+
+def uses_stats(test: RandomnessTest) -> bool:
+    """True si la prueba redefine run_stats (puede usar el acumulador)."""
+    return type(test).run_stats is not RandomnessTest.run_stats
+
+
+def sequence_stats(sequence: Any, bins: Optional[int] = None,
+                   scale: Optional[int] = None) -> SufficientStats:
+    """Una pasada por tramos de FUSED_CHUNK valores (p.ej. métricas de la GUI)."""
+    stats = SufficientStats(bins=bins, scale=scale, chunk_size=FUSED_CHUNK)
+    return stats.update(sequence)
+
+
+def run_tests(sequence: Any, names: Iterable[str],
+              progress: Optional[Callable[[int, int, str, Any], None]] = None,
+              **kwargs) -> Dict[str, Any]:
+    """
+    Ejecuta las pruebas registradas `names` sobre `sequence` con los mismos
+    kwargs que recibiría cada `run` (alpha, k, m, scale...).
+    `progress(hechas, total, nombre, resultado)` se llama tras cada prueba.
+    Retorna {"results": [dict por prueba], "timings": {nombre: segundos},
+    "stats": SufficientStats usado (o None)}.
+    """
+    tests: List = []
+    for name in names:
+        factory = Registry.tests.get(name)
+        if factory is not None:
+            tests.append((name, factory()))
+
+    n = int(np.size(sequence))
+    # El primer m pedido define los intervalos del acumulador compartido
+    bins: Optional[int] = None
+    for _, test in tests:
+        if uses_stats(test):
+            wanted = test.stats_bins(n, **kwargs)
+            if wanted is not None and bins is None:
+                bins = wanted
+
+    timings: Dict[str, float] = {}
+    stats: Optional[SufficientStats] = None
+    if any(uses_stats(test) for _, test in tests):
+        t0 = perf_counter()
+        stats = sequence_stats(sequence, bins=bins, scale=kwargs.get("scale"))
+        timings[SHARED_PASS] = perf_counter() - t0
+
+    results: List[Dict[str, Any]] = []
+    for name, test in tests:
+        t0 = perf_counter()
+        if stats is not None and uses_stats(test) and test.stats_bins(n, **kwargs) in (None, bins):
+            res = test.run_stats(stats, **kwargs)
+        else:
+            res = test.run(sequence, **kwargs)
+        timings[name] = perf_counter() - t0
+        results.append(res)
+        if progress is not None:
+            progress(len(results), len(tests), name, res)
+    return {"results": results, "timings": timings, "stats": stats}
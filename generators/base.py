@@ -4,16 +4,195 @@ Cada nuevo algoritmo debe heredar de RandomGenerator y registrarse en Registry.
 
 Se agrega el atributo de clase `required_seeds` (por defecto 1) para que la GUI
 sepa si debe pedir una segunda semilla (p.ej., Productos Medios).
+
+Camino de streaming (todos los generadores):
+- `init_state(seed, **kwargs)` valida y retorna un GeneratorState explícito
+  (D, X actual, X previo, a, índice de paso).
+- `fill(state, out)` escribe len(out) valores y avanza el estado en sitio.
+- `stream(state, block_size, n)` entrega bloques NumPy de tamaño fijo con
+  memoria constante. El estado se puede serializar (to_json/from_json) en
+  cualquier momento para pausar y reanudar en otro proceso.
+- `generate(n, seed)` es un envoltorio: init_state + fill. El estado final
+  queda en `self.last_state`.
+- `extend(state, out, start)` continúa una secuencia ya generada: llena
+  out[start:] desde el estado del paso `start` (ver core.sequence_cache).
+
+Salida (generate y stream): `dtype` elige el tipo del arreglo y `out=`
+recibe un búfer ya reservado (también un np.memmap) donde se escribe en
+sitio, sin copias intermedias:
+- float64 / float32: r en [0,1)
+- uint32 / uint64: el estado entero crudo X (r = X / output_scale(state));
+  sirve para guardar secuencias largas con la mitad de memoria o menos.
+
+`generate_batch` genera una fila por semilla. La versión base llama a
+`generate` en un bucle; los algoritmos que pueden avanzar todas las semillas
+a la vez (ver generators.middle_digits) la sobrescriben.
 """
 from abc import ABC, abstractmethod
-from typing import Optional
+from dataclasses import asdict, dataclass, field, replace
+from typing import Any, Dict, Iterator, Optional
+import json
 import numpy as np
 
+# Tamaño de bloque por defecto del streaming (valores por bloque)
+DEFAULT_BLOCK_SIZE = 1 << 16
+
+# Tipos de salida admitidos: r en punto flotante o el estado entero crudo
+OUTPUT_DTYPES = tuple(np.dtype(t) for t in (np.float64, np.float32, np.uint32, np.uint64))
+
+
+def output_buffer(n: Optional[int], dtype: Any = None, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Arreglo de salida: `out` si se dio (se valida forma y dtype), o uno nuevo
+    de n valores con `dtype` (float64 por defecto).
+    """
+    if out is not None:
+        if out.ndim != 1:
+            raise ValueError("out debe ser un arreglo 1-D.")
+        if n is not None and out.shape[0] != n:
+            raise ValueError(f"out tiene {out.shape[0]} valores y se pidieron n={n}.")
+        if dtype is not None and np.dtype(dtype) != out.dtype:
+            raise ValueError(f"out es {out.dtype} pero se pidió dtype={np.dtype(dtype)}.")
+        dtype = out.dtype
+    dtype = np.dtype(float if dtype is None else dtype)
+    if dtype not in OUTPUT_DTYPES:
+        raise ValueError(f"dtype no admitido: {dtype}. Opciones: "
+                         f"{', '.join(str(t) for t in OUTPUT_DTYPES)}.")
+    if out is not None:
+        return out
+    if n is None:
+        raise ValueError("Indica n o un búfer out.")
+    return np.empty(n, dtype=dtype)
+
+
+@dataclass
+class GeneratorState:
+    """Estado completo de un generador: con él se reanuda la secuencia exacta."""
+    algorithm: str                  # nombre de la clase del generador
+    D: int                          # dígitos del estado
+    x: int                          # X actual (último X generado o la semilla)
+    x_prev: Optional[int] = None    # X previo (Productos Medios)
+    a: Optional[int] = None         # constante (Multiplicador Constante)
+    step: int = 0                   # cantidad de valores ya emitidos
+    params: Dict[str, Any] = field(default_factory=dict)  # extras del algoritmo
+
+    def copy(self) -> "GeneratorState":
+        return replace(self, params=dict(self.params))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "GeneratorState":
+        return cls(**data)
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict())
+
+    @classmethod
+    def from_json(cls, text: str) -> "GeneratorState":
+        return cls.from_dict(json.loads(text))
+
+
 class RandomGenerator(ABC):
     # Cantidad de semillas requeridas por el algoritmo (1 o 2)
     required_seeds: int = 1
+    # Estado al terminar el último generate (para continuar la secuencia)
+    last_state: Optional[GeneratorState] = None
+
+    @abstractmethod
+    def init_state(self, seed: Optional[int], **kwargs) -> GeneratorState:
+        """Valida parámetros y retorna el estado inicial (step=0)."""
+        raise NotImplementedError
 
     @abstractmethod
-    def generate(self, n: int, seed: Optional[int], **kwargs) -> np.ndarray:
-        """Genera una secuencia de longitud n. Retorna np.ndarray de floats o ints."""
+    def fill(self, state: GeneratorState, out: np.ndarray, **kwargs) -> np.ndarray:
+        """Escribe len(out) valores en `out`, avanza `state` en sitio y retorna `out`."""
         raise NotImplementedError
+
+    def output_scale(self, state: GeneratorState) -> int:
+        """Divisor que lleva el estado crudo X a r = X / escala (10^D por defecto)."""
+        return 10 ** state.D
+
+    def check_output(self, state: GeneratorState, out: np.ndarray) -> bool:
+        """
+        Valida `out` para este estado. Retorna True si es entero (estado
+        crudo), lo que exige que todo X < escala quepa en su dtype.
+        """
+        if out.dtype not in OUTPUT_DTYPES:
+            raise ValueError(f"dtype no admitido: {out.dtype}.")
+        if out.dtype.kind != "u":
+            return False
+        if self.output_scale(state) - 1 > np.iinfo(out.dtype).max:
+            raise ValueError(f"El estado de {state.D} dígitos no cabe en {out.dtype}; "
+                             f"usa uint64 o una salida float.")
+        return True
+
+    def generate(self, n: Optional[int], seed: Optional[int], dtype: Any = None,
+                 out: Optional[np.ndarray] = None, **kwargs) -> np.ndarray:
+        """
+        Genera una secuencia de longitud n (o len(out)). Retorna el arreglo de
+        salida: `out` si se dio, o uno nuevo de tipo `dtype` (float64 por defecto).
+        """
+        state = self.init_state(seed, **kwargs)
+        out = self.fill(state, output_buffer(n, dtype, out), **kwargs)
+        self.last_state = state
+        return out
+
+    def extend(self, state: GeneratorState, out: np.ndarray, start: int,
+               origin: Optional[GeneratorState] = None,
+               seen: Optional[Dict[Any, int]] = None, **kwargs) -> Optional[Dict[str, Any]]:
+        """
+        Llena out[start:] a partir de `state`, que debe estar en el paso
+        `start` (out[:start] ya tiene la secuencia). Retorna los metadatos de
+        ciclo si el algoritmo los detecta (None en la versión base).
+        `origin` (estado inicial) y `seen` (estados vistos, compartido entre
+        tramos) solo los usan los algoritmos que detectan ciclos.
+        """
+        self.fill(state, out[start:], **kwargs)
+        return None
+
+    def stream(self, state: GeneratorState, block_size: int = DEFAULT_BLOCK_SIZE,
+               n: Optional[int] = None, dtype: Any = None,
+               out: Optional[np.ndarray] = None, **kwargs) -> Iterator[np.ndarray]:
+        """
+        Entrega bloques de `block_size` valores (el último puede ser menor)
+        hasta completar n valores, o sin fin si n es None. `state` avanza con
+        cada bloque, así que se puede guardar entre bloques para reanudar.
+        Con `out` (p.ej. un memmap) cada bloque es una vista de tramos
+        consecutivos de `out` y n es, por defecto, len(out).
+        """
+        if state.algorithm != type(self).__name__:
+            raise ValueError(f"El estado es de '{state.algorithm}', no de '{type(self).__name__}'.")
+        if block_size <= 0:
+            raise ValueError("block_size debe ser positivo.")
+        if out is not None:
+            out = output_buffer(None, dtype, out)
+            n = out.shape[0] if n is None else min(n, out.shape[0])
+        else:
+            dtype = output_buffer(0, dtype).dtype
+        done = 0
+        while n is None or done < n:
+            size = block_size if n is None else min(block_size, n - done)
+            block = out[done:done + size] if out is not None else np.empty(size, dtype=dtype)
+            yield self.fill(state, block, **kwargs)
+            done += size
+
+    def generate_batch(self, n: int, seeds: np.ndarray, **kwargs) -> np.ndarray:
+        """
+        Genera len(seeds) secuencias de longitud n. Retorna matriz (len(seeds), n).
+        Los kwargs que sean arreglos de longitud len(seeds) (p.ej. seed2 o
+        const_a) se toman fila por fila; el resto es común a todas.
+        """
+        seeds = np.asarray(seeds).ravel()
+        rows = seeds.shape[0]
+        out = np.empty((rows, n), dtype=float)
+        for i in range(rows):
+            row_kwargs: Dict[str, Any] = {}
+            for key, value in kwargs.items():
+                if np.ndim(value) == 1 and len(value) == rows:
+                    value = value[i]
+                    value = value.item() if isinstance(value, np.generic) else value
+                row_kwargs[key] = value
+            out[i] = self.generate(n, int(seeds[i]), **row_kwargs)
+        return out
@@ -0,0 +1,233 @@
+"""
+Generadores congruenciales lineales (LCG) vectorizados.
+
+Reglas:
+1) Elegir multiplicador a, incremento c y módulo m (0 < a < m, 0 <= c < m).
+2) Ingresar una semilla X0 con 0 <= X0 < m (X0 != 0 si c = 0).
+3) X_{j+1} = (a * X_j + c) mod m ; r_{j+1} = X_{j+1} / m
+4) Repetir...
+
+Con c = 0 es el congruencial multiplicativo.
+
+Salto en forma cerrada: tras k pasos
+    X_{j+k} = (A_k * X_j + C_k) mod m
+    A_k = a^k mod m,   C_k = c * (a^k - 1) / (a - 1) mod m
+(C_k = c*k si a = 1). La división entre (a - 1) se hace exacta calculando
+a^k mod ((a - 1) * m).
+
+Generación por bloques: para un bloque de B valores se precalculan (una vez
+por (a, c, m, B)) los arreglos A_1..A_B y C_1..C_B, y cada bloque es una
+sola operación NumPy:
+    X[j+1 .. j+B] = (A * X_j + C) mod m
+Con m <= 2^32 el producto A*X_j + C cabe en uint64. La reducción usa `&`
+si m es potencia de 2 y el plegado de Mersenne si m = 2^p - 1.
+
+Con dtype uint32/uint64 la salida es el X crudo (X < m <= 2^32 siempre
+cabe en uint32); output_scale(state) = m.
+
+Flujos paralelos: split(state, k) devuelve k estados separados por
+periodo // k pasos (o `spacing`), que no se solapan mientras cada flujo
+consuma menos de esa cantidad de valores. Los estados son serializables
+(GeneratorState.to_json) para enviarlos a otros procesos; generate_range
+permite además usar generators.jump_ahead.generate_parallel.
+"""
+from functools import lru_cache
+from typing import List, Optional, Tuple
+import numpy as np
+
+from generators.base import GeneratorState, RandomGenerator
+from generators.digits import decimal_length
+from core.registry import Registry
+
+# Módulo máximo: a*X + c debe caber en uint64
+MAX_MODULUS = 1 << 32
+
+# Valores por bloque vectorizado
+LCG_BLOCK = 1 << 15
+
+
+def skip_coefficients(a: int, c: int, m: int, k: int) -> Tuple[int, int]:
+    """(A_k, C_k) tales que X_{j+k} = (A_k * X_j + C_k) mod m."""
+    if k < 0:
+        raise ValueError("k debe ser no negativo.")
+    if a == 1:
+        return 1 % m, (c * k) % m
+    # a^k - 1 es múltiplo de a - 1: se reduce módulo (a-1)*m y se divide exacto
+    geometric = (pow(a, k, (a - 1) * m) - 1) % ((a - 1) * m) // (a - 1)
+    return pow(a, k, m), (c * geometric) % m
+
+
+@lru_cache(maxsize=16)
+def _block_coefficients(a: int, c: int, m: int, size: int) -> Tuple[np.ndarray, np.ndarray]:
+    """A_1..A_size y C_1..C_size (uint64, solo lectura)."""
+    A = np.empty(size, dtype=np.uint64)
+    C = np.empty(size, dtype=np.uint64)
+    # Recurrencia en lotes: con (A_h, C_h) del primer tramo se obtiene el siguiente
+    A[0], C[0] = a % m, c % m
+    h = 1
+    while h < size:
+        w = min(h, size - h)
+        Ah, Ch = skip_coefficients(a, c, m, h)
+        A[h:h + w] = _reduce(A[:w] * np.uint64(Ah), m)
+        C[h:h + w] = _reduce(C[:w] * np.uint64(Ah) + np.uint64(Ch), m)
+        h += w
+    A.flags.writeable = False
+    C.flags.writeable = False
+    return A, C
+
+
+def _reduce(v: np.ndarray, m: int) -> np.ndarray:
+    """v mod m en sitio (v uint64)."""
+    if m & (m - 1) == 0:
+        v &= np.uint64(m - 1)
+    elif (m + 1) & m == 0:
+        # m = 2^p - 1: x mod m = (x & m) + (x >> p), dos pliegues y un ajuste
+        p = np.uint64(m.bit_length())
+        mm = np.uint64(m)
+        for _ in range(2):
+            hi = v >> p
+            v &= mm
+            v += hi
+        np.subtract(v, mm, out=v, where=v >= mm)
+    else:
+        v %= np.uint64(m)
+    return v
+
+
+class LinearCongruential(RandomGenerator):
+    required_seeds = 1
+    # Parámetros por defecto; se pueden cambiar con los kwargs a, c y m
+    multiplier: int = 1103515245
+    increment: int = 12345
+    modulus: int = 1 << 31
+
+    def _params(self, **kwargs) -> Tuple[int, int, int]:
+        a = int(kwargs.get("a") if kwargs.get("a") is not None else self.multiplier)
+        c = int(kwargs.get("c") if kwargs.get("c") is not None else self.increment)
+        m = int(kwargs.get("m") if kwargs.get("m") is not None else self.modulus)
+        if not 1 < m <= MAX_MODULUS:
+            raise ValueError(f"El módulo m debe cumplir 1 < m <= 2^32. Recibido m={m}.")
+        if not 0 < a < m:
+            raise ValueError(f"El multiplicador debe cumplir 0 < a < m. Recibido a={a}.")
+        if not 0 <= c < m:
+            raise ValueError(f"El incremento debe cumplir 0 <= c < m. Recibido c={c}.")
+        return a, c, m
+
+    # ----------------- Estado y streaming -----------------
+
+    def init_state(self, seed: Optional[int], **kwargs) -> GeneratorState:
+        a, c, m = self._params(**kwargs)
+        if seed is None:
+            raise ValueError("El generador congruencial requiere una semilla entera X0.")
+        x = int(seed)
+        if not 0 <= x < m:
+            raise ValueError(f"La semilla debe cumplir 0 <= X0 < m={m}. Recibido X0={x}.")
+        if c == 0 and x == 0:
+            raise ValueError("Con c=0 (multiplicativo) la semilla no puede ser 0.")
+        return GeneratorState(algorithm=type(self).__name__, D=decimal_length(m - 1),
+                              x=x, a=a, params={"c": c, "m": m})
+
+    def output_scale(self, state: GeneratorState) -> int:
+        return state.params["m"]
+
+    def fill(self, state: GeneratorState, out: np.ndarray, **kwargs) -> np.ndarray:
+        a, c, m = state.a, state.params["c"], state.params["m"]
+        raw = self.check_output(state, out)
+        n = out.shape[0]
+        if n == 0:
+            return out
+        size = min(n, LCG_BLOCK)
+        A, C = _block_coefficients(a, c, m, size)
+        # Con salida uint64 se calcula directo sobre `out`; si no, en un búfer de un bloque
+        direct = out.dtype == np.uint64
+        buf = None if direct else np.empty(size, dtype=np.uint64)
+        x = state.x
+        for lo in range(0, n, size):
+            w = min(size, n - lo)
+            v = out[lo:lo + w] if direct else buf[:w]
+            np.multiply(A[:w], np.uint64(x), out=v)
+            v += C[:w]
+            _reduce(v, m)
+            if raw and not direct:
+                out[lo:lo + w] = v
+            elif not raw:
+                np.divide(v, m, out=out[lo:lo + w])
+            x = int(v[-1])
+        state.x = x
+        state.step += n
+        return out
+
+    # ----------------- Salto y flujos -----------------
+
+    def jump_state(self, state: GeneratorState, k: int, **kwargs) -> GeneratorState:
+        """Avanza `state` k pasos en sitio con la fórmula cerrada (O(log k))."""
+        m = state.params["m"]
+        Ak, Ck = skip_coefficients(state.a, state.params["c"], m, k)
+        state.x = (Ak * state.x + Ck) % m
+        state.step += k
+        return state
+
+    def generate_range(self, seed: Optional[int], start: int, count: int, **kwargs) -> np.ndarray:
+        """Valores out[start:start+count] de generate(..., seed) sin generar los previos."""
+        state = self.init_state(seed, **kwargs)
+        self.jump_state(state, start)
+        return self.fill(state, np.empty(count, dtype=float))
+
+    def value_at(self, seed: Optional[int], index: int, **kwargs) -> float:
+        """Valor en la posición `index` (0-based) de la secuencia."""
+        return float(self.generate_range(seed, index, 1, **kwargs)[0])
+
+    def split(self, state: GeneratorState, k: int, spacing: Optional[int] = None) -> List[GeneratorState]:
+        """
+        k estados independientes: el i-ésimo es `state` adelantado i*spacing
+        pasos (por defecto spacing = m // k). `state` no se modifica.
+        """
+        if k <= 0:
+            raise ValueError("k debe ser positivo.")
+        spacing = state.params["m"] // k if spacing is None else int(spacing)
+        if spacing <= 0:
+            raise ValueError("spacing debe ser positivo.")
+        streams = [state.copy()]
+        for _ in range(k - 1):
+            streams.append(self.jump_state(streams[-1].copy(), spacing))
+        return streams
+
+    # ----------------- Lotes -----------------
+
+    def generate_batch(self, n: int, seeds: np.ndarray, **kwargs) -> np.ndarray:
+        """Una fila por semilla; cada bloque es (A ⊗ X + C) mod m sobre la matriz."""
+        a, c, m = self._params(**kwargs)
+        states = [self.init_state(int(s), a=a, c=c, m=m) for s in np.asarray(seeds).ravel()]
+        out = np.empty((len(states), n), dtype=float)
+        if n == 0 or not states:
+            return out
+        size = min(n, LCG_BLOCK)
+        A, C = _block_coefficients(a, c, m, size)
+        x = np.array([s.x for s in states], dtype=np.uint64)
+        for lo in range(0, n, size):
+            w = min(size, n - lo)
+            v = A[:w] * x[:, None]
+            v += C[:w]
+            _reduce(v, m)
+            np.divide(v, m, out=out[:, lo:lo + w])
+            x = v[:, -1].copy()
+        return out
+
+
+class MixedCongruential(LinearCongruential):
+    """Congruencial mixto: a=1103515245, c=12345, m=2^31 (ANSI C)."""
+    multiplier = 1103515245
+    increment = 12345
+    modulus = 1 << 31
+
+
+class MultiplicativeCongruential(LinearCongruential):
+    """Congruencial multiplicativo de Park–Miller: a=16807, c=0, m=2^31-1."""
+    multiplier = 16807
+    increment = 0
+    modulus = (1 << 31) - 1
+
+
+# Registrar en el catálogo
+Registry.register_generator("Congruencial Mixto (LCG)", MixedCongruential)
+Registry.register_generator("Congruencial Multiplicativo (Park–Miller)", MultiplicativeCongruential)
@@ -0,0 +1,180 @@
+"""
+Extracción de los D dígitos centrales con aritmética entera.
+
+Los tres generadores de dígitos medios (Cuadrados Medios, Productos Medios y
+Multiplicador Constante) comparten la misma regla de centrado:
+
+- Se toma Y sin rellenar a 2D. Solo si len(str(Y)) es impar se antepone un '0'.
+- Se extraen los D dígitos centrales: y_str[start:start+D], con
+  start = (L - D) // 2.
+
+La versión de referencia (`middle_digits_str`) hace exactamente eso con
+cadenas. La versión por defecto (`middle_digits`) obtiene el mismo resultado
+sin convertir a texto:
+
+1) L = cantidad de dígitos de Y: estimación por bit_length y una sola
+   comparación contra la tabla precalculada de potencias de 10.
+2) Si L es impar, L += 1 (equivale al '0' antepuesto).
+3) X = (Y // 10^(L - start - D)) % 10^D   -> un floor-divide y un módulo.
+
+Si L < D el slice de Python con índice negativo se comporta distinto; ese caso
+borde también se reproduce para que ambos modos den resultados idénticos.
+
+D grande (cientos o miles de dígitos): `middle_digits_big` hace lo mismo pero
+toma las potencias de 10 de una caché por exponente (solo se crean las 3 o 4
+que usa cada D, no la tabla completa hasta 10^(2D)) y nunca pasa por str, así
+que tampoco choca con el límite de conversión int/str de CPython. Con
+extraction="int" se elige sola a partir de D >= LARGE_D. Los textos de la
+traza se arman con `to_decimal_str`, que parte el número por mitades.
+"""
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional
+import numpy as np
+
+# Si y tiene b bits, 2^(b-1) <= y < 2^b: floor((b-1)*log10(2)) es una cota
+# inferior de floor(log10 y) que falla como mucho por 1.
+_LOG10_2 = 0.30102999566398120
+
+# POW10[k] = 10**k. Se amplía bajo demanda (ver _ensure_pow10).
+POW10: List[int] = [10 ** k for k in range(64)]
+
+
+# A partir de este D se usa middle_digits_big con extraction="int"
+LARGE_D = 64
+
+# Dígitos por trozo en to_decimal_str (bajo el límite int->str de CPython)
+_STR_CHUNK = 2000
+
+
+@lru_cache(maxsize=512)
+def pow10(k: int) -> int:
+    """10**k con caché por exponente (para D grande)."""
+    return 10 ** k
+
+
+def _ensure_pow10(k: int) -> None:
+    """Garantiza que POW10 tenga al menos las potencias 10^0..10^k."""
+    while len(POW10) <= k:
+        POW10.append(POW10[-1] * 10)
+
+
+def decimal_length(y: int) -> int:
+    """Cantidad de dígitos decimales de y >= 0 (igual que len(str(y)))."""
+    # t = len(y) - 1 o len(y) - 2; una comparación con 10^(t+1) decide
+    t = int((y.bit_length() - 1) * _LOG10_2) if y > 0 else 0
+    p = POW10[t + 1] if t + 1 < len(POW10) else pow10(t + 1)
+    return t + 2 if y >= p else t + 1
+
+
+def middle_digits(y: int, D: int) -> int:
+    """D dígitos centrales de y con la regla de centrado (solo enteros)."""
+    if y < 0:
+        # El signo participa en la cadena; se delega en la referencia
+        return middle_digits_str(y, D)
+
+    # Igual que decimal_length, en línea para evitar la llamada extra
+    t = int((y.bit_length() - 1) * _LOG10_2) if y > 0 else 0
+    if t + 1 >= len(POW10) or D >= len(POW10):
+        _ensure_pow10(max(t + 1, D))
+    L = t + 2 if y >= POW10[t + 1] else t + 1
+    if L & 1:               # equivale a anteponer '0'
+        L += 1
+
+    if L >= D:
+        # dígitos a la derecha del bloque: L - start - D, start = (L - D) // 2
+        return (y // POW10[(L - D + 1) // 2]) % POW10[D]
+
+    # L < D: y_str[start:start+D] con start<0 toma los últimos L-a caracteres,
+    # con a = max(0, L + start). El '0' antepuesto no altera el valor.
+    a = max(0, L + (L - D) // 2)
+    return y % POW10[L - a]
+
+
+# Potencias de 10 como uint64 (10^19 es la mayor que cabe en 64 bits)
+POW10_U64 = np.array([10 ** k for k in range(20)], dtype=np.uint64)
+
+
+def decimal_length_array(y: np.ndarray) -> np.ndarray:
+    """Cantidad de dígitos de cada elemento (uint64): potencias de 10 <= y, mínimo 1."""
+    return np.maximum(np.searchsorted(POW10_U64, np.asarray(y, dtype=np.uint64), side="right"), 1)
+
+
+def middle_digits_array(y: np.ndarray, D: int) -> np.ndarray:
+    """
+    Versión vectorizada de middle_digits para arreglos de Y >= 0 (uint64).
+
+    Requiere D <= 9 para que Y = X*X' < 10^18 no desborde 64 bits. Aplica la
+    misma regla (incluido el caso L < D) elemento a elemento.
+    """
+    if not 1 <= D <= 9:
+        raise ValueError(f"La extracción vectorizada admite 1<=D<=9. Recibido D={D}.")
+    y = np.asarray(y, dtype=np.uint64)
+    L = decimal_length_array(y)
+    L += L & 1                                   # impar -> anteponer '0'
+    wide = L >= D
+    # L >= D: (y // 10^((L-D+1)//2)) % 10^D
+    shift = np.where(wide, (L - D + 1) // 2, 0)
+    # L < D: y % 10^(L - max(0, L + (L-D)//2))
+    keep = np.where(wide, D, L - np.maximum(0, L + (L - D) // 2))
+    return (y // POW10_U64[shift]) % POW10_U64[keep]
+
+
+def middle_digits_big(y: int, D: int) -> int:
+    """middle_digits para D grande: potencias cacheadas por exponente y divmod."""
+    if y < 0:
+        return middle_digits_str(y, D)
+    L = decimal_length(y)
+    L += L & 1
+    if L >= D:
+        q = y // pow10((L - D + 1) // 2)
+        return divmod(q, pow10(D))[1]
+    a = max(0, L + (L - D) // 2)
+    return y % pow10(L - a)
+
+
+def middle_digits_str(y: int, D: int) -> int:
+    """Versión de referencia: la regla original basada en cadenas."""
+    y_str = str(y)
+    if len(y_str) % 2 == 1:
+        y_str = "0" + y_str
+    start = (len(y_str) - D) // 2
+    return int(y_str[start:start + D])
+
+
+def to_decimal_str(y: int) -> str:
+    """str(y) sin el límite de dígitos de CPython: divide y vencerás por 10^k."""
+    if y < 0:
+        return "-" + to_decimal_str(-y)
+    if y < POW10[-1] or y.bit_length() < _STR_CHUNK * 3:
+        return str(y)
+    half = decimal_length(y) // 2
+    hi, lo = divmod(y, pow10(half))
+    return to_decimal_str(hi) + to_decimal_str(lo).zfill(half)
+
+
+def padded_str(y: int) -> str:
+    """Texto de Y tal como se muestra en la traza: '0' antepuesto si es impar."""
+    y_str = to_decimal_str(y)
+    return "0" + y_str if len(y_str) % 2 == 1 else y_str
+
+
+# Modos disponibles para los generadores (kwarg `extraction`)
+EXTRACTORS: Dict[str, Callable[[int, int], int]] = {
+    "int": middle_digits,
+    "big": middle_digits_big,
+    "str": middle_digits_str,
+}
+
+
+def get_extractor(mode: str = "int", D: Optional[int] = None) -> Callable[[int, int], int]:
+    """
+    Devuelve la función de extracción para el modo pedido ('int', 'big' o
+    'str'). Con 'int' y D >= LARGE_D se usa la variante para D grande.
+    """
+    if mode == "int" and D is not None and D >= LARGE_D:
+        mode = "big"
+    try:
+        return EXTRACTORS[mode]
+    except KeyError:
+        raise ValueError(f"Modo de extracción desconocido: '{mode}'. "
+                         f"Opciones: {', '.join(EXTRACTORS)}.") from None
@@ -0,0 +1,106 @@
+"""
+Salto logarítmico (binary lifting) para Cuadrados Medios y Multiplicador
+Constante con D pequeño.
+
+Sobre la tabla de sucesores next[x] (generators.successor_table) se arman
+tablas de duplicación:
+    T_0 = next,   T_i = T_{i-1}[T_{i-1}]   =>   T_i[x] = next^(2^i)(x)
+Para avanzar k pasos se recorren los niveles i = 0..bit_length(k)-1 una
+sola vez (cada nivel se busca una vez en la caché y, si falta, se arma
+desde el anterior ya abierto) y se aplica T_i por cada bit encendido:
+O(log k) consultas. Cada nivel se guarda como .npy en la caché de disco
+(utils.array_cache) con clave (algoritmo, D, a, nivel) y se abre como
+memmap, así que se reutiliza entre ejecuciones y procesos.
+Cada nivel ocupa 4·10^D bytes (400 MB con D = 8): si los niveles que pide
+k no caben en el tope de la caché, el salto se rechaza (el desalojo LRU
+los reconstruiría en cada llamada).
+
+Con esto se puede:
+- leer el valor de cualquier posición sin generar las anteriores,
+- generar tramos disjuntos de la secuencia en paralelo (generate_parallel).
+"""
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional
+import numpy as np
+
+from generators.successor_table import successor_table, table_key
+from utils.array_cache import DiskArrayCache, default_cache
+
+# Elementos por bloque al componer un nivel con el anterior
+_BUILD_BLOCK = 1 << 22
+
+
+def levels_nbytes(D: int, levels: int) -> int:
+    """Bytes en disco de los niveles T_0..T_{levels-1}."""
+    return levels * 10 ** D * np.dtype(np.uint32).itemsize
+
+
+def doubling_table(kind: str, D: int, a: Optional[int], level: int,
+                   cache: Optional[DiskArrayCache] = None,
+                   prev: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    T_level[x] = next^(2^level)(x) para x en [0, 10^D) (uint32, memmap).
+    Los niveles anteriores solo se abren si hay que armar este; `prev`
+    (T_{level-1} ya abierto) evita buscarlo de nuevo.
+    """
+    cache = cache if cache is not None else default_cache()
+    if level == 0:
+        return successor_table(kind, D, a, cache=cache)
+
+    key = f"{table_key(kind, D, a)}_pow{level}"
+    table = cache.get(key)
+    if table is not None:
+        return table
+    size = 10 ** D
+
+    def build(out: np.ndarray) -> None:
+        src = prev if prev is not None else doubling_table(kind, D, a, level - 1, cache=cache)
+        src = np.asarray(src)
+        for lo in range(0, size, _BUILD_BLOCK):
+            out[lo:lo + _BUILD_BLOCK] = src[src[lo:lo + _BUILD_BLOCK]]
+
+    return cache.get_or_build(key, (size,), np.uint32, build)
+
+
+def jump(kind: str, D: int, a: Optional[int], x: int, k: int,
+         cache: Optional[DiskArrayCache] = None) -> int:
+    """X tras k pasos partiendo de x en [0, 10^D), en O(log k) consultas."""
+    if k < 0:
+        raise ValueError("k debe ser no negativo.")
+    if not 0 <= x < 10 ** D:
+        raise ValueError(f"x debe estar en [0, 10^{D}).")
+    cache = cache if cache is not None else default_cache()
+    needed = levels_nbytes(D, k.bit_length())
+    if needed > cache.max_bytes:
+        raise ValueError(f"Saltar k={k} con D={D} requiere {k.bit_length()} niveles "
+                         f"({needed / 2**20:.0f} MB) y la caché admite {cache.max_bytes / 2**20:.0f} MB; "
+                         f"sube PSEUDOALEATORIOS_CACHE_MB o usa un k menor.")
+    # Un solo recorrido: el nivel i+1 se arma (si falta) desde el nivel i ya abierto
+    table: Optional[np.ndarray] = None
+    level = 0
+    while k:
+        table = doubling_table(kind, D, a, level, cache=cache, prev=table)
+        if k & 1:
+            x = np.asarray(table).item(x)
+        k >>= 1
+        level += 1
+    return x
+
+
+def _generate_chunk(gen_cls, seed: Optional[int], start: int, count: int,
+                    kwargs: Dict[str, Any]) -> np.ndarray:
+    return gen_cls().generate_range(seed, start, count, **kwargs)
+
+
+def generate_parallel(gen_cls, n: int, seed: Optional[int], workers: Optional[int] = None,
+                      chunks: Optional[int] = None, **kwargs) -> np.ndarray:
+    """
+    Genera n valores repartiendo tramos disjuntos [start, start+count) entre
+    procesos; cada proceso salta a su inicio con las tablas de duplicación.
+    """
+    chunks = chunks or (workers or 4)
+    bounds = np.linspace(0, n, chunks + 1).astype(np.int64)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        parts: List = [pool.submit(_generate_chunk, gen_cls, seed, int(lo), int(hi - lo), kwargs)
+                       for lo, hi in zip(bounds[:-1], bounds[1:]) if hi > lo]
+        return np.concatenate([p.result() for p in parts]) if parts else np.empty(0, dtype=float)
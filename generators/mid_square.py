@@ -7,56 +7,43 @@ Regla:
   dígitos centrales. Si len(Y) es 6 y D=4, se toman directamente esos 4
   del medio (sin añadir '00').
 
-Además expone self.trace con líneas tipo:
+La extracción usa por defecto el motor entero de generators.digits
+(kwarg extraction="int"); extraction="str" conserva el camino original
+con cadenas como modo de referencia.
+
+Además expone self.trace (GenerationTrace) que arma bajo demanda líneas tipo:
   Y0=(X0)^2=resultado   X1=dddd   r1=0.dddd
-para que la GUI pueda mostrar los pasos en la tabla.
+para que la GUI pueda mostrar los pasos en la tabla. Con trace=False no se
+registra ningún paso. Con detect_cycles=True se detecta el ciclo y el resto
+de la salida se completa repitiéndolo (ver generators.middle_digits).
 """
-from typing import Optional
+from typing import Callable, Optional, Tuple
 import numpy as np
-from generators.base import RandomGenerator
+from generators.digits import decimal_length
+from generators.middle_digits import MiddleDigitGenerator, batch_digits
 from core.registry import Registry
 
-class MidSquare(RandomGenerator):
+class MidSquare(MiddleDigitGenerator):
     required_seeds = 1  # <- una sola semilla
+    trace_kind = "square"
 
-    def __init__(self):
-        self.trace = []  # lista de strings, una por fila/iteración
-
-    def generate(self, n: int, seed: Optional[int], **kwargs) -> np.ndarray:
+    def _prepare(self, seed: Optional[int], **kwargs) -> Tuple[int, None, None, int]:
         if seed is None:
             raise ValueError("Cuadrados Medios requiere semilla entera (X0) con D>3 dígitos.")
 
         # D = cantidad de dígitos de la semilla (base 10)
-        s = str(abs(int(seed)))
-        D = len(s)
+        D = decimal_length(abs(int(seed)))
         if D <= 3:
             raise ValueError(f"La semilla debe tener D>3 dígitos. Semilla '{seed}' tiene D={D}.")
+        return D, None, None, int(seed)
+
+    def _prepare_batch(self, seeds: np.ndarray, **kwargs) -> Tuple[int, None, None, np.ndarray]:
+        # X^2 no depende del signo: se trabaja con |X0|
+        x = np.abs(np.asarray(seeds, dtype=np.int64)).astype(np.uint64)
+        return batch_digits(x, "Semillas"), None, None, x
 
-        x = int(seed)
-        out = np.empty(n, dtype=float)
-        base = 10 ** D
-        self.trace.clear()
-
-        for j in range(n):
-            x_str_D = str(x).zfill(D)  # solo para mostrar Xj con D dígitos
-            y = x * x
-            y_str = str(y)             # NO rellenar a 2D
-            if len(y_str) % 2 == 1:    # solo si impar, anteponer un '0'
-                y_str = "0" + y_str
-
-            L = len(y_str)
-            start = (L - D) // 2       # índice inicial del bloque central de tamaño D
-            mid = y_str[start:start + D]  # Xi+1 (D dígitos)
-            x = int(mid)
-            r = x / base
-            out[j] = r
-
-            # Guardar paso legible
-            self.trace.append(
-                f"Y{j}=({x_str_D})^2={y_str}   X{j+1}={mid}   r{j+1}=0.{mid}"
-            )
-
-        return out
+    def _product(self, a: Optional[int]) -> Callable[[Optional[int], int], int]:
+        return lambda x_prev, x: x * x   # Y = X^2
 
 # Registrar en el catálogo
 Registry.register_generator("Cuadrados Medios (Mid-Square)", MidSquare)
@@ -0,0 +1,377 @@
+"""
+Base común de los generadores de dígitos medios.
+
+Los tres algoritmos (Cuadrados Medios, Productos Medios, Multiplicador
+Constante) comparten el mismo ciclo:
+    Y_j = f(X_prev, X_curr)   ->   X_next = D dígitos centrales de Y_j
+y solo difieren en f y en cómo validan semillas/constante. Cada subclase
+implementa `_prepare` (validación -> D, a, X_prev, X_curr) y `_product`
+(la función f); esta base se ocupa del bucle, la traza y los ciclos.
+
+El bucle vive en `_run`, que avanza un GeneratorState: `fill`/`stream`
+(ver generators.base) lo usan sin traza, y `generate` lo envuelve agregando
+traza y detección de ciclos.
+
+Detección de ciclos (kwarg detect_cycles=True):
+- El estado es X_curr, o el par (X_prev, X_curr) en Productos Medios.
+- Se guarda en un dict el primer índice en que aparece cada estado. Al
+  repetirse se conocen la cola (mu) y el periodo (lambda) y el resto de la
+  salida se rellena repitiendo el ciclo con NumPy: costo O(mu + lambda) en
+  lugar de O(n). El resultado es idéntico al de iterar los n pasos.
+- Los metadatos quedan en self.cycle_info:
+    tail        -> mu: índice del primer estado que pertenece al ciclo
+    period      -> lambda: longitud del ciclo
+    cycle_start -> primera posición de la salida que ya es periódica
+    zero        -> True si la secuencia cae en el punto fijo 0
+
+Motor de tabla (kwarg engine="table", solo algoritmos con estado X_curr):
+para D pequeño se usa la tabla de sucesores next[x] precalculada y cacheada
+en disco (generators.successor_table) en lugar de multiplicar y extraer.
+El motor por defecto (engine="kernel") usa generators.digits.
+
+Salto (jump_state / generate_range / value_at, solo algoritmos con estado
+X_curr y D <= 8): avanza k pasos en O(log k) con las tablas de duplicación
+de generators.jump_ahead, sin generar los valores intermedios.
+
+Lotes (generate_batch): todas las semillas avanzan a la vez como vectores
+uint64 con digits.middle_digits_array (requiere 4 <= D <= 9). Cada subclase
+valida sus arreglos en `_prepare_batch`; el resultado es idéntico a llamar
+`generate` fila por fila.
+"""
+from abc import abstractmethod
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+import numpy as np
+
+from generators.base import GeneratorState, RandomGenerator, output_buffer
+from generators.digits import decimal_length_array, get_extractor, middle_digits_array
+from generators.jump_ahead import jump
+from generators.successor_table import successor_table
+from generators.trace import GenerationTrace
+
+ENGINES = ("kernel", "table")
+
+# Con D <= 9 los productos X*X' < 10^18 caben en uint64
+MAX_BATCH_D = 9
+
+
+def batch_digits(values: np.ndarray, what: str) -> int:
+    """D común de un arreglo de enteros no negativos (todas las filas igual, 3<D<=9)."""
+    values = np.asarray(values)
+    if values.size == 0:
+        raise ValueError(f"{what}: se requiere al menos un valor.")
+    if np.any(values < 0):
+        raise ValueError(f"{what}: en lote se requieren enteros no negativos.")
+    lengths = np.unique(decimal_length_array(values))
+    if lengths.shape[0] != 1:
+        raise ValueError(f"{what}: todos los valores deben tener el mismo número de dígitos D. "
+                         f"Recibido D en {lengths.tolist()}.")
+    D = int(lengths[0])
+    if not 3 < D <= MAX_BATCH_D:
+        raise ValueError(f"{what}: en lote se requiere 3<D<={MAX_BATCH_D}. Recibido D={D}.")
+    return D
+
+
+class MiddleDigitGenerator(RandomGenerator):
+    # Tipo de traza ("square", "product" o "constant")
+    trace_kind: str = "square"
+    # 1: el futuro depende solo de X_curr; 2: depende de (X_prev, X_curr)
+    state_width: int = 1
+    # Si admite engine="table" (tabla de sucesores de 10^D estados)
+    supports_table: bool = True
+
+    def __init__(self):
+        self.trace = GenerationTrace.empty(self.trace_kind, 4, (0,) * self._offset(), a=0)
+        self.cycle_info: Optional[Dict[str, Any]] = None
+
+    @abstractmethod
+    def _prepare(self, seed: Optional[int], **kwargs) -> Tuple[int, Optional[int], Optional[int], int]:
+        """Valida parámetros y retorna (D, a, X_prev, X_curr) iniciales."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def _product(self, a: Optional[int]) -> Callable[[Optional[int], int], int]:
+        """Función f(X_prev, X_curr) -> Y del algoritmo (también sobre arreglos)."""
+        raise NotImplementedError
+
+    def _prepare_batch(self, seeds: np.ndarray, **kwargs) -> Tuple[int, Any, Optional[np.ndarray], np.ndarray]:
+        """Valida un lote y retorna (D, a, X_prev, X_curr) como arreglos uint64."""
+        raise NotImplementedError(f"{type(self).__name__} no implementa generación en lote.")
+
+    # ----------------- Utilidades -----------------
+
+    def _offset(self) -> int:
+        return 2 if self.trace_kind == "product" else 1
+
+    def _seeds(self, x_prev: Optional[int], x_curr: int) -> Tuple[int, ...]:
+        return (x_prev, x_curr) if self.state_width == 2 else (x_curr,)
+
+    def _key(self, x_prev: Optional[int], x_curr: int) -> Hashable:
+        return (x_prev, x_curr) if self.state_width == 2 else x_curr
+
+    def _table(self, D: int, a: Optional[int], **kwargs) -> Optional[np.ndarray]:
+        """Tabla de sucesores si se pidió engine="table"; None para el kernel."""
+        engine = kwargs.get("engine", "kernel")
+        if engine not in ENGINES:
+            raise ValueError(f"Motor desconocido: '{engine}'. Opciones: {', '.join(ENGINES)}.")
+        if engine == "kernel":
+            return None
+        if not self.supports_table:
+            raise ValueError(f"{type(self).__name__} no admite engine='table' "
+                             f"(su estado tiene 10^{self.state_width * D} valores).")
+        return successor_table(self.trace_kind, D, a, cache=kwargs.get("cache"))
+
+    def _successor(self, D: int, a: Optional[int], **kwargs) -> Callable[[Optional[int], int], int]:
+        """Función (X_prev, X_curr) -> X_next según el motor elegido."""
+        extract = get_extractor(kwargs.get("extraction", "int"), D)
+        f = self._product(a)
+        table = self._table(D, a, **kwargs)
+        if table is None:
+            return lambda x_prev, x_curr: extract(f(x_prev, x_curr), D)
+        size = table.shape[0]
+        lookup = np.asarray(table).item   # ndarray.item: int de Python sin pasar por memmap
+        # Semillas fuera de [0, 10^D) (negativas o con más dígitos) van por el kernel
+        return lambda x_prev, x_curr: (lookup(x_curr) if 0 <= x_curr < size
+                                       else extract(f(x_prev, x_curr), D))
+
+    # ----------------- Estado y streaming -----------------
+
+    def init_state(self, seed: Optional[int], **kwargs) -> GeneratorState:
+        D, a, x_prev, x_curr = self._prepare(seed, **kwargs)
+        return GeneratorState(algorithm=type(self).__name__, D=D, x=x_curr, x_prev=x_prev, a=a)
+
+    def fill(self, state: GeneratorState, out: np.ndarray, **kwargs) -> np.ndarray:
+        self._run(state, out, **kwargs)
+        return out
+
+    def _run(self, state: GeneratorState, out: np.ndarray,
+             ys: Optional[np.ndarray] = None, xs: Optional[np.ndarray] = None,
+             seen: Optional[Dict[Hashable, int]] = None, **kwargs) -> Optional[Tuple[int, int, int]]:
+        """
+        Bucle principal: escribe r en `out` (y Y, X_next en ys/xs si se dan) y
+        avanza `state`. Con `seen` (estado -> paso) se detiene en el primer
+        estado repetido y retorna (pasos hechos, mu, lambda); si no, None.
+        """
+        D, a = state.D, state.a
+        x_prev, x_curr, step0 = state.x_prev, state.x, state.step
+        extract = get_extractor(kwargs.get("extraction", "int"), D)
+        f = self._product(a)
+        table = self._table(D, a, **kwargs)
+        lookup = np.asarray(table).item if table is not None else None
+        base = 10 ** D
+        raw = self.check_output(state, out)
+        record = ys is not None
+        found = None
+
+        j = -1
+        for j in range(out.shape[0]):
+            if lookup is not None and 0 <= x_curr < base:
+                # Motor de tabla: Y solo hace falta para la traza
+                y = f(x_prev, x_curr) if record else 0
+                x_prev, x_curr = x_curr, lookup(x_curr)
+            else:
+                y = f(x_prev, x_curr)
+                x_prev, x_curr = x_curr, extract(y, D)
+            out[j] = x_curr if raw else x_curr / base
+
+            # Guardar paso (el texto se arma solo al mostrarlo)
+            if record:
+                ys[j] = y
+                xs[j] = x_curr
+
+            if seen is not None:
+                key = self._key(x_prev, x_curr)
+                mu = seen.get(key)
+                if mu is None:
+                    seen[key] = step0 + j + 1
+                    continue
+                found = (j + 1, mu, step0 + j + 1 - mu)
+                break
+
+        state.x_prev, state.x = x_prev, x_curr
+        state.step = step0 + j + 1
+        return found
+
+    # ----------------- Salto -----------------
+
+    def jump_state(self, state: GeneratorState, k: int, **kwargs) -> GeneratorState:
+        """Avanza `state` k pasos en sitio con O(log k) consultas a tablas."""
+        if not self.supports_table:
+            raise ValueError(f"{type(self).__name__} no admite saltos "
+                             f"(su estado tiene 10^{self.state_width * state.D} valores).")
+        if k < 0:
+            raise ValueError("k debe ser no negativo.")
+        if k == 0:
+            return state
+        if not 0 <= state.x < 10 ** state.D:
+            # Semilla fuera de [0, 10^D): el primer paso va por el kernel
+            self.fill(state, np.empty(1, dtype=float), **kwargs)
+            k -= 1
+            if k == 0:
+                return state
+        cache = kwargs.get("cache")
+        x_prev = jump(self.trace_kind, state.D, state.a, state.x, k - 1, cache=cache)
+        table = successor_table(self.trace_kind, state.D, state.a, cache=cache)
+        state.x_prev, state.x = x_prev, np.asarray(table).item(x_prev)
+        state.step += k
+        return state
+
+    def generate_range(self, seed: Optional[int], start: int, count: int, **kwargs) -> np.ndarray:
+        """Valores out[start:start+count] de generate(..., seed) sin generar los previos."""
+        state = self.init_state(seed, **kwargs)
+        self.jump_state(state, start, **kwargs)
+        return self.fill(state, np.empty(count, dtype=float), **kwargs)
+
+    def value_at(self, seed: Optional[int], index: int, **kwargs) -> float:
+        """Valor en la posición `index` (0-based) de la secuencia."""
+        return float(self.generate_range(seed, index, 1, **kwargs)[0])
+
+    # ----------------- Generación -----------------
+
+    def generate(self, n: Optional[int], seed: Optional[int], dtype: Any = None,
+                 out: Optional[np.ndarray] = None, **kwargs) -> np.ndarray:
+        state = self.init_state(seed, **kwargs)
+        out = output_buffer(n, dtype, out)
+        n = out.shape[0]
+
+        record = bool(kwargs.pop("trace", True))
+        self.trace = GenerationTrace(self.trace_kind, state.D, n if record else 0,
+                                     self._seeds(state.x_prev, state.x), a=state.a)
+        self.cycle_info = self.extend(state, out, 0, trace=self.trace if record else None, **kwargs)
+        self.last_state = state
+        return out
+
+    def extend(self, state: GeneratorState, out: np.ndarray, start: int,
+               trace: Optional[GenerationTrace] = None,
+               cycle_info: Optional[Dict[str, Any]] = None,
+               origin: Optional[GeneratorState] = None,
+               seen: Optional[Dict[Hashable, int]] = None, **kwargs) -> Optional[Dict[str, Any]]:
+        """
+        Llena out[start:] (y las filas start: de `trace`, de largo len(out))
+        desde `state`, que está en el paso `start`.
+        - Con `cycle_info` (ciclo ya hallado en out[:start]) solo se repite el ciclo.
+        - Con detect_cycles=True se buscan estados repetidos en el tramo nuevo.
+          `seen` (estado -> paso) puede compartirse entre llamadas sobre
+          tramos consecutivos: así el ciclo se detecta aunque su periodo no
+          quepa en un tramo. Si el estado repetido es el primero de `seen`,
+          el ciclo pudo empezar antes: la cola exacta se ubica
+          comparando X_s con X_{s+λ} en la traza o, sin traza, avanzando desde
+          `origin` (el estado inicial, paso 0; ver _exact_tail).
+        Retorna los metadatos del ciclo, o None si no se cerró.
+        """
+        record = trace is not None
+        ys, xs = (trace.y, trace.x_next) if record else (None, None)
+        if cycle_info is not None:
+            self._tile_cycle(out, ys, xs, done=start, period=cycle_info["period"], record=record)
+            return cycle_info
+
+        # Estado -> paso de su primera aparición (solo con detect_cycles)
+        if kwargs.get("detect_cycles", False):
+            seen = {} if seen is None else seen
+            seen.setdefault(self._key(state.x_prev, state.x), state.step)
+        else:
+            seen = None
+
+        tail_cols = (ys[start:], xs[start:]) if record else (None, None)
+        found = self._run(state, out[start:], *tail_cols, seen, **kwargs)
+        if found is None:
+            return None
+        done, mu, period = found
+        self._tile_cycle(out, ys, xs, done=start + done, period=period, record=record)
+        first = next(iter(seen.values()))
+        if first > 0 and mu == first:
+            # El estado repetido es el primero de `seen`: el ciclo pudo empezar antes
+            if record:
+                mu = self._cycle_tail(trace, start + done, period, mu)
+            elif origin is not None:
+                mu = self._exact_tail(origin, period, **kwargs)
+        return self._cycle_meta(mu, period, state.x_prev, state.x)
+
+    def _exact_tail(self, origin: GeneratorState, period: int, **kwargs) -> int:
+        """
+        Cola mu sin traza: dos estados separados por λ pasos avanzan juntos
+        desde `origin` hasta coincidir (O(mu + λ) pasos).
+        """
+        succ = self._successor(origin.D, origin.a, **kwargs)
+        lag = lead = (origin.x_prev, origin.x)
+        for _ in range(period):
+            lead = (lead[1], succ(*lead))
+        mu = 0
+        while self._key(*lag) != self._key(*lead):
+            lag = (lag[1], succ(*lag))
+            lead = (lead[1], succ(*lead))
+            mu += 1
+        return mu
+
+    def _cycle_tail(self, trace: GenerationTrace, done: int, period: int, fallback: int) -> int:
+        """Primer paso s cuyo estado reaparece en s+λ, según las columnas de la traza."""
+        xs = np.concatenate([np.array(trace.seeds, dtype=trace.x_next.dtype), trace.x_next[:done]])
+        count = xs.shape[0] - period - (self.state_width - 1)
+        if count <= 0:
+            return fallback
+        # Estado del paso s: X_s (o el par X_s, X_{s+1} en Productos Medios)
+        same = np.ones(count, dtype=bool)
+        for w in range(self.state_width):
+            same &= xs[w:w + count] == xs[w + period:w + period + count]
+        return int(np.argmax(same)) if same.any() else fallback
+
+    @staticmethod
+    def _tile_cycle(out: np.ndarray, ys: np.ndarray, xs: np.ndarray,
+                    done: int, period: int, record: bool) -> None:
+        """Completa out[done:] (y la traza) repitiendo los últimos `period` valores."""
+        if done >= out.shape[0]:
+            return
+        columns = (out, ys, xs) if record else (out,)
+        for col in columns:
+            dst = col[done:]
+            dst[:min(period, dst.shape[0])] = col[done - period:done][:dst.shape[0]]
+            # Duplicar lo ya copiado: log2(n/period) copias en bloque, sin temporales
+            k = period
+            while k < dst.shape[0]:
+                c = min(k, dst.shape[0] - k)
+                dst[k:k + c] = dst[:c]
+                k += c
+
+    def _cycle_meta(self, tail: int, period: int, x_prev: Optional[int], x_curr: int) -> Dict[str, Any]:
+        return {
+            "tail": tail,
+            "period": period,
+            "cycle_start": max(tail - 1, 0),
+            # 0 es punto fijo: si el estado repetido es 0 el ciclo es {0}
+            "zero": x_curr == 0 and (self.state_width == 1 or x_prev == 0),
+        }
+
+    def generate_batch(self, n: int, seeds: np.ndarray, **kwargs) -> np.ndarray:
+        """
+        Avanza todas las semillas en paralelo (vectores uint64). Retorna una
+        matriz (len(seeds), n); la fila i es generate(n, seeds[i], ...).
+        """
+        seeds = np.asarray(seeds).ravel()
+        D, a, x_prev, x_curr = self._prepare_batch(seeds, **kwargs)
+        f = self._product(a)
+        base = float(10 ** D)
+        out = np.empty((seeds.shape[0], n), dtype=float)
+        for j in range(n):
+            x_prev, x_curr = x_curr, middle_digits_array(f(x_prev, x_curr), D)
+            out[:, j] = x_curr / base
+        return out
+
+    def find_cycle(self, seed: Optional[int], limit: Optional[int] = None, **kwargs) -> Optional[Dict[str, Any]]:
+        """
+        Recorre solo los estados (sin salida ni traza) hasta encontrar el ciclo.
+        Con estados de D dígitos el ciclo aparece en a lo sumo 10^(D*ancho)
+        pasos; `limit` permite cortar antes (retorna None si no se alcanzó).
+        """
+        D, a, x_prev, x_curr = self._prepare(seed, **kwargs)
+        succ = self._successor(D, a, **kwargs)
+        if limit is None:
+            limit = 10 ** (D * self.state_width) + 1
+
+        seen: Dict[Hashable, int] = {self._key(x_prev, x_curr): 0}
+        for j in range(limit):
+            x_prev, x_curr = x_curr, succ(x_prev, x_curr)
+            key = self._key(x_prev, x_curr)
+            mu = seen.get(key)
+            if mu is not None:
+                return self._cycle_meta(mu, j + 1 - mu, x_prev, x_curr)
+            seen[key] = j + 1
+        return None
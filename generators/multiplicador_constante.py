@@ -13,23 +13,26 @@ Detalles:
 - Al formar Y = a * X, NO se rellena a 2D. Solo si len(Y) es impar,
   se antepone '0' para tener longitud par. Luego se toman los D dígitos
   centrales.
+- La extracción usa el motor entero de generators.digits por defecto
+  (kwarg extraction="int"); extraction="str" es el modo de referencia.
 - La semilla puede tener cualquier número de dígitos; para la trazabilidad
   se muestra con padding a D (zfill(D)).
+- self.trace es una GenerationTrace columnar; trace=False la deshabilita.
+- detect_cycles=True detecta el ciclo y lo repite para completar la salida.
 """
-from typing import Optional
+from typing import Callable, Optional, Tuple
 import numpy as np
-from generators.base import RandomGenerator
+from generators.digits import decimal_length
+from generators.middle_digits import MiddleDigitGenerator, batch_digits
 from core.registry import Registry
 
-class ConstantMultiplier(RandomGenerator):
+class ConstantMultiplier(MiddleDigitGenerator):
     required_seeds = 1
     requires_constant = True
+    # Ej.: "Y0=(a)*(X0)=resultado   X1=dddd   r1=0.dddd"
+    trace_kind = "constant"
 
-    def __init__(self):
-        # Ej.: "Y0=(a)*(X0)=resultado   X1=dddd   r1=0.dddd"
-        self.trace = []
-
-    def generate(self, n: int, seed: Optional[int], **kwargs) -> np.ndarray:
+    def _prepare(self, seed: Optional[int], **kwargs) -> Tuple[int, int, None, int]:
         if seed is None:
             raise ValueError("Multiplicador Constante requiere una semilla entera X0.")
         const_a = kwargs.get("const_a", None)
@@ -37,37 +40,28 @@ class ConstantMultiplier(RandomGenerator):
             raise ValueError("Debes proporcionar la constante 'a' con D>3 dígitos.")
 
         a = int(const_a)
-        a_str = str(abs(a))
-        D = len(a_str)
+        D = decimal_length(abs(a))
         if D <= 3:
             raise ValueError(f"La constante 'a' debe tener D>3 dígitos. Recibido D={D}.")
+        return D, a, None, int(seed)
 
-        base = 10 ** D
-        out = np.empty(n, dtype=float)
-        self.trace.clear()
-
-        x = int(seed)
-        for j in range(n):
-            x_str = str(x).zfill(D)
-            a_str_pad = a_str.zfill(D)
-
-            y = a * x
-            y_str = str(y)
-            if len(y_str) % 2 == 1:        # solo si impar, anteponer '0'
-                y_str = "0" + y_str
-
-            L = len(y_str)
-            start = (L - D) // 2
-            mid = y_str[start:start + D]   # X_{j+1}
-            x = int(mid)
-            r = x / base
-            out[j] = r
-
-            self.trace.append(
-                f"Y{j}=({a_str_pad})*({x_str})={y_str}   X{j+1}={mid}   r{j+1}=0.{mid}"
-            )
+    def _prepare_batch(self, seeds: np.ndarray, **kwargs) -> Tuple[int, np.ndarray, None, np.ndarray]:
+        const_a = kwargs.get("const_a", None)
+        if const_a is None:
+            raise ValueError("Debes proporcionar la constante 'a' (común o una por fila).")
+        x = np.asarray(seeds, dtype=np.int64)
+        # 'a' puede ser un escalar común o un arreglo con una constante por fila
+        a = np.broadcast_to(np.asarray(const_a, dtype=np.int64), x.shape)
+        D = batch_digits(a, "Constante 'a'")
+        if np.any(x < 0):
+            raise ValueError("Semillas: en lote se requieren enteros no negativos.")
+        # El primer producto a*X0 también debe caber en 64 bits
+        if int(a.max()) * int(x.max()) >= 2 ** 64:
+            raise ValueError("a*X0 no cabe en 64 bits; usa semillas con menos dígitos.")
+        return D, a.astype(np.uint64), None, x.astype(np.uint64)
 
-        return out
+    def _product(self, a: Optional[int]) -> Callable[[Optional[int], int], int]:
+        return lambda x_prev, x: a * x   # Y = a * X
 
 # Registrar en el catálogo
 Registry.register_generator("Multiplicador Constante", ConstantMultiplier)
@@ -12,65 +12,49 @@ Notas:
 - Ambas semillas deben tener el MISMO D (>3).
 - Al formar Y no se rellena a 2D. Solo si len(str(Y)) es impar, se antepone '0'.
 - Se toman siempre los D dígitos centrales para el siguiente X.
+- La extracción usa el motor entero de generators.digits por defecto
+  (kwarg extraction="int"); extraction="str" es el modo de referencia.
+- self.trace es una GenerationTrace columnar; trace=False la deshabilita.
+- detect_cycles=True detecta el ciclo sobre el par (X_prev, X_curr) y lo
+  repite para completar la salida.
 """
-from typing import Optional
+from typing import Callable, Optional, Tuple
 import numpy as np
-from generators.base import RandomGenerator
+from generators.digits import decimal_length
+from generators.middle_digits import MiddleDigitGenerator, batch_digits
 from core.registry import Registry
 
-class MiddleProduct(RandomGenerator):
+class MiddleProduct(MiddleDigitGenerator):
     required_seeds = 2  # requiere dos semillas
+    # Ejemplo de línea:
+    # Y0=(5735)*(1017)=583...   X2=abcd   r2=0.abcd
+    trace_kind = "product"
+    state_width = 2     # el siguiente X depende de (X_prev, X_curr)
+    supports_table = False
 
-    def __init__(self):
-        # Ejemplo de línea:
-        # Y0=(5735)*(1017)=583...   X2=abcd   r2=0.abcd
-        self.trace = []
-
-    def generate(self, n: int, seed: Optional[int], **kwargs) -> np.ndarray:
+    def _prepare(self, seed: Optional[int], **kwargs) -> Tuple[int, None, int, int]:
         seed2 = kwargs.get("seed2", None)
         if seed is None or seed2 is None:
             raise ValueError("Productos Medios requiere dos semillas enteras (X0 y X1) con D>3 dígitos.")
 
-        s1 = str(abs(int(seed)))
-        s2 = str(abs(int(seed2)))
-        D1, D2 = len(s1), len(s2)
+        D1 = decimal_length(abs(int(seed)))
+        D2 = decimal_length(abs(int(seed2)))
         if D1 != D2 or D1 <= 3:
             raise ValueError(f"Ambas semillas deben tener el mismo número de dígitos D>3. "
                              f"Recibido D1={D1}, D2={D2}.")
+        return D1, None, int(seed), int(seed2)   # X0, X1
 
-        D = D1
-        base = 10 ** D
-        out = np.empty(n, dtype=float)
-        self.trace.clear()
-
-        x_prev = int(seed)   # X0
-        x_curr = int(seed2)  # X1
-
-        for j in range(n):
-            x_prev_str = str(x_prev).zfill(D)
-            x_curr_str = str(x_curr).zfill(D)
-
-            y = x_prev * x_curr
-            y_str = str(y)
-            if len(y_str) % 2 == 1:  # solo si impar, anteponer '0'
-                y_str = "0" + y_str
-
-            L = len(y_str)
-            start = (L - D) // 2
-            mid = y_str[start:start + D]  # X_{j+2}
-            x_next = int(mid)
-            r = x_next / base
-            out[j] = r
-
-            # Guardar paso: Yj=(Xj)*(Xj+1)=...   X{j+2}=mid   r{j+2}=0.mid
-            self.trace.append(
-                f"Y{j}=({x_prev_str})*({x_curr_str})={y_str}   X{j+2}={mid}   r{j+2}=0.{mid}"
-            )
-
-            # desplazar
-            x_prev, x_curr = x_curr, x_next
-
-        return out
+    def _prepare_batch(self, seeds: np.ndarray, **kwargs) -> Tuple[int, None, np.ndarray, np.ndarray]:
+        seed2 = kwargs.get("seed2", None)
+        if seed2 is None:
+            raise ValueError("Productos Medios en lote requiere el arreglo seed2 (X1 de cada fila).")
+        x0 = np.asarray(seeds, dtype=np.int64)
+        x1 = np.broadcast_to(np.asarray(seed2, dtype=np.int64), x0.shape)
+        D = batch_digits(np.concatenate([x0, x1]), "Semillas X0/X1")
+        return D, None, x0.astype(np.uint64), x1.astype(np.uint64)
+
+    def _product(self, a: Optional[int]) -> Callable[[Optional[int], int], int]:
+        return lambda x_prev, x_curr: x_prev * x_curr   # Y = X_j * X_{j+1}
 
 # Registrar en el catálogo
 Registry.register_generator("Productos Medios (Middle Product)", MiddleProduct)
@@ -0,0 +1,60 @@
+"""
+Tablas de sucesores para D pequeño (Cuadrados Medios y Multiplicador Constante).
+
+Con D dígitos el espacio de estados tiene a lo sumo 10^D valores, así que la
+función X -> X_next se puede precalcular completa:
+    next[x] = D dígitos centrales de x*x     (Cuadrados Medios)
+    next[x] = D dígitos centrales de a*x     (Multiplicador Constante, a fijo)
+La tabla se arma una sola vez con NumPy (por bloques, usando
+digits.middle_digits_array) y se guarda como .npy en la caché de disco
+(utils.array_cache), que se reutiliza entre ejecuciones y entre procesos.
+Generar pasa a ser indexar la tabla repetidamente.
+
+Productos Medios no aplica: su estado (X_prev, X_curr) tiene 10^(2D) valores.
+"""
+from typing import Optional
+import numpy as np
+
+from generators.digits import middle_digits_array
+from utils.array_cache import DiskArrayCache, default_cache
+
+# Rango de D admitido (10^8 estados uint32 = 400 MB)
+MIN_TABLE_D = 1
+MAX_TABLE_D = 8
+
+# Estados por bloque al construir la tabla
+_BUILD_BLOCK = 1 << 22
+
+
+def table_key(kind: str, D: int, a: Optional[int] = None) -> str:
+    """Clave de caché (algoritmo, D, a)."""
+    if kind == "constant":
+        return f"succ_constant_D{D}_a{int(a)}"
+    return f"succ_{kind}_D{D}"
+
+
+def successor_table(kind: str, D: int, a: Optional[int] = None,
+                    cache: Optional[DiskArrayCache] = None) -> np.ndarray:
+    """
+    Retorna next[x] para x en [0, 10^D) como arreglo uint32 (memmap).
+    kind: "square" (Cuadrados Medios) o "constant" (Multiplicador Constante).
+    """
+    if kind not in ("square", "constant"):
+        raise ValueError(f"No hay tabla de sucesores para el tipo '{kind}'.")
+    if not MIN_TABLE_D <= D <= MAX_TABLE_D:
+        raise ValueError(f"La tabla de sucesores admite {MIN_TABLE_D}<=D<={MAX_TABLE_D}. Recibido D={D}.")
+    if kind == "constant":
+        if a is None or not 0 <= int(a) < 10 ** D:
+            raise ValueError("La tabla de Multiplicador Constante requiere 0 <= a < 10^D.")
+        a = int(a)
+
+    cache = cache if cache is not None else default_cache()
+    size = 10 ** D
+
+    def build(out: np.ndarray) -> None:
+        for lo in range(0, size, _BUILD_BLOCK):
+            x = np.arange(lo, min(lo + _BUILD_BLOCK, size), dtype=np.uint64)
+            y = x * x if kind == "square" else x * np.uint64(a)
+            out[lo:lo + x.shape[0]] = middle_digits_array(y, D)
+
+    return cache.get_or_build(table_key(kind, D, a), (size,), np.uint32, build)
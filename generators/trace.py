@@ -0,0 +1,130 @@
+"""
+Traza columnar de los generadores de dígitos medios.
+
+En lugar de guardar un string por iteración se guardan dos columnas NumPy:
+- y:      el producto Y_j de cada paso
+- x_next: el X siguiente (sus D dígitos son también los dígitos de r)
+
+X_prev (y X_curr en Productos Medios) se deriva de x_next desplazado y de las
+semillas, así que no ocupa memoria extra. Con D <= 9 ambas columnas son int64
+(16 bytes por paso); con D mayor Y ya no cabe en 64 bits y se usa dtype=object.
+
+La traza se comporta como una secuencia de strings de solo lectura:
+trace[j] arma la línea `Y{j}=(...)^2=...   X{j+1}=...   r{j+1}=0....`
+en el momento en que se pide, y trace[a:b] devuelve solo esas líneas.
+"""
+from typing import List, Optional, Sequence, Tuple, Union
+import numpy as np
+
+from generators.digits import padded_str, to_decimal_str
+
+# Tipos de traza: forma del producto Y en cada algoritmo
+KINDS = ("square", "product", "constant")
+
+_INT64_MAX = np.iinfo(np.int64).max
+
+
+def _column(n: int, bound: int) -> np.ndarray:
+    """Columna int64 si |valor| <= bound cabe en 64 bits; si no, dtype=object."""
+    if bound <= _INT64_MAX:
+        return np.zeros(n, dtype=np.int64)
+    return np.zeros(n, dtype=object)
+
+
+class GenerationTrace(Sequence):
+    def __init__(self, kind: str, D: int, n: int, seeds: Tuple[int, ...],
+                 a: Optional[int] = None):
+        if kind not in KINDS:
+            raise ValueError(f"Tipo de traza desconocido: '{kind}'.")
+        self.kind = kind
+        self.D = D
+        self.seeds = tuple(int(s) for s in seeds)
+        self.a = a
+
+        # Cotas para elegir el dtype de cada columna
+        x_max = max([10 ** D - 1] + [abs(s) for s in self.seeds])
+        if kind == "constant":
+            y_bound = abs(int(a)) * x_max
+        else:
+            y_bound = x_max * x_max
+        self.y = _column(n, y_bound)
+        self.x_next = _column(n, x_max)
+
+    @classmethod
+    def empty(cls, kind: str, D: int, seeds: Tuple[int, ...],
+              a: Optional[int] = None) -> "GenerationTrace":
+        """Traza deshabilitada (sin filas)."""
+        return cls(kind, D, 0, seeds, a)
+
+    def with_length(self, n: int) -> "GenerationTrace":
+        """
+        Traza de n filas con las mismas primeras filas: si n <= len(self)
+        las columnas son vistas; si no, se copian a columnas nuevas más largas.
+        """
+        if n <= len(self):
+            view = GenerationTrace.empty(self.kind, self.D, self.seeds, self.a)
+            view.y, view.x_next = self.y[:n], self.x_next[:n]
+            return view
+        grown = GenerationTrace(self.kind, self.D, n, self.seeds, self.a)
+        grown.y[:len(self)] = self.y
+        grown.x_next[:len(self)] = self.x_next
+        return grown
+
+    # ----------------- Columnas derivadas -----------------
+
+    @property
+    def offset(self) -> int:
+        """Índice del primer X generado (X1, o X2 en Productos Medios)."""
+        return 2 if self.kind == "product" else 1
+
+    @property
+    def x_prev(self) -> np.ndarray:
+        """Primer factor de cada Y (X_j); en Productos Medios es X_j de X_j*X_{j+1}."""
+        k = self.offset
+        head = np.array(self.seeds[:k], dtype=self.x_next.dtype) if len(self) else self.x_next[:0]
+        return np.concatenate([head[:len(self)], self.x_next[:max(len(self) - k, 0)]])
+
+    @property
+    def nbytes(self) -> int:
+        return int(self.y.nbytes + self.x_next.nbytes)
+
+    def _operand(self, j: int, back: int) -> int:
+        """X_{j+offset-back}: semilla si cae antes del primer X generado."""
+        i = j + self.offset - back
+        if i < self.offset:
+            return self.seeds[i]
+        return int(self.x_next[i - self.offset])
+
+    # ----------------- Protocolo de secuencia -----------------
+
+    def __len__(self) -> int:
+        return int(self.x_next.shape[0])
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[str, List[str]]:
+        if isinstance(index, slice):
+            return [self.format_row(j) for j in range(*index.indices(len(self)))]
+        j = int(index)
+        if j < 0:
+            j += len(self)
+        if not 0 <= j < len(self):
+            raise IndexError("índice de traza fuera de rango")
+        return self.format_row(j)
+
+    def format_row(self, j: int) -> str:
+        """Arma la línea legible del paso j (solo se llama para filas visibles)."""
+        D = self.D
+        k = self.offset
+        mid = to_decimal_str(int(self.x_next[j])).zfill(D)
+        y_str = padded_str(int(self.y[j]))
+        if self.kind == "square":
+            x_str = to_decimal_str(self._operand(j, 1)).zfill(D)
+            head = f"Y{j}=({x_str})^2={y_str}"
+        elif self.kind == "constant":
+            a_str = to_decimal_str(abs(int(self.a))).zfill(D)
+            x_str = to_decimal_str(self._operand(j, 1)).zfill(D)
+            head = f"Y{j}=({a_str})*({x_str})={y_str}"
+        else:
+            x_prev_str = to_decimal_str(self._operand(j, 2)).zfill(D)
+            x_curr_str = to_decimal_str(self._operand(j, 1)).zfill(D)
+            head = f"Y{j}=({x_prev_str})*({x_curr_str})={y_str}"
+        return f"{head}   X{j+k}={mid}   r{j+k}=0.{mid}"
@@ -1,26 +1,22 @@
 """
 Ventana principal con tema aplicado + barra animada superior.
-Incluye importación de módulos que se autoregistran en Registry.
+Registra el catálogo de plugins como descriptores de carga diferida
+(core.plugins): ningún generador, prueba, SciPy ni Matplotlib se importa
+antes de mostrar la ventana.
 """
 import tkinter as tk
 from tkinter import ttk, messagebox
 from core.app_state import AppState
+from core.plugins import register_builtin_plugins
 from gui.tab_generadores import GeneradoresTab
 from gui.tab_pruebas import PruebasTab
 from gui.tab_variables import VariablesTab
 from gui.theme import apply_theme
 from gui.widgets import ScanBar
 
-# -------- Generadores registrados (solo los que quieres) --------
-import generators.mid_square               # noqa: F401
-import generators.productos_medios         # noqa: F401
-import generators.multiplicador_constante  # noqa: F401
-# (No importamos generators.numpy_uniform para que no aparezca)
-
-# -------- Pruebas registradas (sin placeholders) --------
-import tests.medias                        # noqa: F401
-import tests.varianza                      # noqa: F401
-import tests.uniformidad_chi2              # noqa: F401
+# -------- Plugins registrados (descriptores; se importan al usarse) --------
+# (generators.numpy_uniform no está en el catálogo para que no aparezca)
+register_builtin_plugins()
 
 def launch_app() -> None:
     root = tk.Tk()
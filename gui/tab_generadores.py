@@ -2,22 +2,53 @@
 Tab 'Generadores' con look oscuro, métricas tipo 'chips', botones con hover
 y tostadas de confirmación. La tabla muestra los *pasos* cuando el generador
 provee `trace`. Ahora soporta algoritmos que requieren **dos semillas**
-y/o **constante 'a'**.
+y/o **constante 'a'**. Si existe un atlas de semillas (core.seed_atlas) para
+el algoritmo, el combo "Sugeridas" ofrece las mejores configuraciones.
+Las secuencias pasan por core.sequence_cache: repetir "Generar" con los
+mismos parámetros y un n mayor solo calcula los valores que faltan.
+Matplotlib se importa al dibujar el primer histograma (`_ensure_canvas`);
+hasta entonces el panel derecho es un marco vacío.
+La tabla es una VirtualTable: solo existen las filas visibles, que se
+piden por índice a la traza (o a la secuencia) al desplazarse, así n puede
+ser de millones sin costo de memoria ni de redibujo. "Ir a índice" salta a
+cualquier fila.
+La generación (con la traza), las métricas y los conteos del histograma
+corren en un hilo aparte (core.jobs): la ventana sigue respondiendo, la
+barra muestra el avance por tramos y "Generar" pasa a "Cancelar" mientras
+tanto. El estado y los widgets solo se actualizan al terminar, desde el
+loop de Tk (que solo dibuja las barras ya contadas).
 """
-from typing import Optional
+from typing import Any, Dict, Optional
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import numpy as np
 
 from core.app_state import AppState
+from core.jobs import JobContext, JobRunner
 from core.registry import Registry
+from core.seed_atlas import suggest_seeds
+from core.sequence_cache import default_sequence_cache
+from core.test_runner import sequence_stats
 from utils.exporter import export_sequence_to_csv
-from utils.plotting import draw_histogram
-from gui.widgets import HoverAccentButton, Toast
+from utils.plotting import draw_histogram_counts
+from gui.widgets import HoverAccentButton, JobProgress, Toast, VirtualTable
 from gui.theme import PALETTE
 
-from matplotlib.figure import Figure
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+def generate_job(ctx: JobContext, alg_name: str, n: int, seed: int, bins: int = 10,
+                 **kwargs) -> Dict[str, Any]:
+    """Trabajo en segundo plano: secuencia (vía caché, por tramos), métricas e histograma."""
+    def report(done: int, total: int) -> None:
+        ctx.progress(done, total, f"Generando {done:,}/{total:,}")
+
+    result = default_sequence_cache().generate(alg_name, n, seed, progress=report, **kwargs)
+    ctx.progress(n, n, "Calculando métricas e histograma…")
+    # Una sola pasada por tramos (media, M2, min y max juntos)
+    result["stats"] = sequence_stats(result["values"])
+    # Conteos del histograma aquí: el hilo de Tk solo dibuja las barras
+    result["histogram"] = np.histogram(result["values"], bins=bins)
+    return result
+
 
 class GeneradoresTab(ttk.Frame):
     def __init__(self, parent, state: AppState):
@@ -67,6 +98,19 @@ class GeneradoresTab(ttk.Frame):
         self.btn_save_png = ttk.Button(controls, text="Guardar PNG", command=self.on_save_png)
         self.btn_save_png.grid(row=0, column=14, padx=6, pady=8)
 
+        # Semillas sugeridas por el atlas (fila 2)
+        ttk.Label(controls, text="Sugeridas:").grid(row=1, column=0, padx=6, pady=(0, 8), sticky="e")
+        self.combo_suggest = ttk.Combobox(controls, state="readonly", width=38)
+        self.combo_suggest.grid(row=1, column=1, padx=6, pady=(0, 8), sticky="w")
+        self.combo_suggest.bind("<<ComboboxSelected>>", self._on_suggestion_selected)
+        self._suggestions = []
+
+        # Avance de la generación en segundo plano
+        self.progress = JobProgress(controls)
+        self.progress.grid(row=1, column=2, columnspan=8, padx=6, pady=(0, 8), sticky="w")
+        self.jobs = JobRunner(self)
+        self._job = None
+
         # Distribución columnas
         for i in range(15):
             controls.grid_columnconfigure(i, weight=0)
@@ -90,20 +134,35 @@ class GeneradoresTab(ttk.Frame):
         for w in (self.lbl_n, self.lbl_mu, self.lbl_sd, self.lbl_min, self.lbl_max):
             w.pack(side="left", padx=6, pady=4)
 
-        self.tree = ttk.Treeview(left_frame, columns=("index", "value"), show="headings", height=22)
-        self.tree.heading("index", text="Índice")
-        self.tree.heading("value", text="Valor / Paso")
-        self.tree.column("index", width=80, anchor="e")
-        self.tree.column("value", width=780, anchor="w")
-        self.tree.pack(fill="both", expand=True)
-
-        # Derecha: gráfico
-        right_frame = ttk.Frame(middle)
-        middle.add(right_frame, weight=1)
+        # Ciclo detectado (cola, periodo e índice donde empieza a repetirse)
+        cycle = ttk.Frame(left_frame)
+        cycle.pack(fill="x", padx=2, pady=(0, 6))
+        self.lbl_tail = ttk.Label(cycle, text="cola: —", style="Metric.TLabel")
+        self.lbl_period = ttk.Label(cycle, text="periodo: —", style="Metric.TLabel")
+        self.lbl_cycle_start = ttk.Label(cycle, text="inicio ciclo: —", style="Metric.TLabel")
+        for w in (self.lbl_tail, self.lbl_period, self.lbl_cycle_start):
+            w.pack(side="left", padx=6, pady=4)
 
-        self.figure = Figure(figsize=(5, 4), dpi=100, facecolor=PALETTE["elev"])
-        self.canvas = FigureCanvasTkAgg(self.figure, master=right_frame)
-        self.canvas.get_tk_widget().pack(fill="both", expand=True)
+        # Saltar a una fila (o al inicio del ciclo detectado)
+        ttk.Label(cycle, text="Ir a índice:").pack(side="left", padx=(18, 4))
+        self.entry_goto = ttk.Entry(cycle, width=12)
+        self.entry_goto.pack(side="left", padx=4)
+        self.entry_goto.bind("<Return>", lambda e: self.on_goto())
+        ttk.Button(cycle, text="Ir", command=self.on_goto).pack(side="left", padx=4)
+        self.btn_goto_cycle = ttk.Button(cycle, text="Ir al ciclo", state="disabled",
+                                         command=lambda: self.table.jump_to(self._cycle_start))
+        self.btn_goto_cycle.pack(side="left", padx=4)
+        self._cycle_start: Optional[int] = None
+
+        self.table = VirtualTable(left_frame, (("index", "Índice", 80, "e"), ("value", "Valor / Paso", 780, "w")),
+                                  height=22)
+        self.table.pack(fill="both", expand=True)
+
+        # Derecha: gráfico (la figura se crea con el primer histograma)
+        self.right_frame = ttk.Frame(middle)
+        middle.add(self.right_frame, weight=1)
+        self.figure = None
+        self.canvas = None
 
         # Inicializar visibilidad dinámica
         self._on_algorithm_changed()
@@ -143,7 +202,43 @@ class GeneradoresTab(ttk.Frame):
             self.lbl_const.grid_forget()
             self.entry_const.grid_forget()
 
+        self._load_suggestions(alg_name)
+
+    def _load_suggestions(self, alg_name: str) -> None:
+        """Llena el combo con las mejores semillas del atlas (si existe)."""
+        try:
+            self._suggestions = suggest_seeds(alg_name) if alg_name else []
+        except (OSError, ValueError, KeyError):
+            self._suggestions = []
+        labels = []
+        for s in self._suggestions:
+            params = [f"X0={s['seed']}"]
+            if "seed2" in s:
+                params.append(f"X1={s['seed2']}")
+            if "const_a" in s:
+                params.insert(0, f"a={s['const_a']}")
+            labels.append(f"{', '.join(params)}  (periodo {s['period']}, "
+                          f"pruebas {s['passed']}/{s['tests']})")
+        self.combo_suggest.configure(values=labels)
+        self.combo_suggest.set("" if labels else "— sin atlas —")
+
+    def _on_suggestion_selected(self, *_):
+        idx = self.combo_suggest.current()
+        if idx < 0 or idx >= len(self._suggestions):
+            return
+        s = self._suggestions[idx]
+        for entry, key in ((self.entry_seed1, "seed"), (self.entry_seed2, "seed2"),
+                           (self.entry_const, "const_a")):
+            if key in s:
+                entry.delete(0, "end")
+                entry.insert(0, str(s[key]))
+
     def on_generate(self) -> None:
+        if self._job is not None:
+            # El botón dice "Cancelar" mientras hay una generación en curso
+            self.jobs.cancel(self._job)
+            self.btn_generar.configure(text="Cancelando…", state="disabled")
+            return
         try:
             n = int(self.entry_n.get())
             if n <= 0:
@@ -194,65 +289,120 @@ class GeneradoresTab(ttk.Frame):
                 messagebox.showerror("Constante (a)", f"'a' debe tener D>3 dígitos. Recibido D={D}.")
                 return
 
-        # Generación
-        generator = gen_cls()
+        # Generación en segundo plano (vía caché de secuencias)
         kwargs = {}
         if need_two:
             kwargs["seed2"] = seed2
         if need_const:
             kwargs["const_a"] = const_a
+        # Los generadores de dígitos medios cortan al detectar el ciclo y lo repiten
+        kwargs["detect_cycles"] = True
 
-        seq = generator.generate(n=n, seed=seed1, **kwargs)
+        params: Dict[str, Any] = {"n": n, "seed": seed1}
+        if need_two:
+            params["seed2"] = seed2
+        if need_const:
+            params["const_a"] = const_a
+
+        bins = int(self.state.params.get("k", 10))
+        self._job = self.jobs.submit(generate_job, alg_name, n, seed1, bins=bins, **kwargs,
+                                     on_progress=self.progress.set,
+                                     on_done=lambda result: self._on_generated(result, params),
+                                     on_error=self._on_generate_error,
+                                     on_cancel=self._on_generate_cancelled)
+        self.btn_generar.configure(text="Cancelar")
+        self.progress.start("Generando…")
+
+    def _finish_job(self) -> None:
+        self._job = None
+        self.progress.stop()
+        self.btn_generar.configure(text="Generar", state="normal")
+
+    def _on_generated(self, result: Dict[str, Any], params: Dict[str, Any]) -> None:
+        self._finish_job()
+        seq = result["values"]
 
         # Guardar estado + trazas si el generador las provee
         self.state.sequence = seq
-        self.state.params["n"] = n
-        self.state.params["seed"] = seed1
-        if need_two:
-            self.state.params["seed2"] = seed2
-        if need_const:
-            self.state.params["const_a"] = const_a
-        self.state.params["trace"] = getattr(generator, "trace", [])
+        self.state.params.update(params)
+        self.state.params["trace"] = result["trace"] if result["trace"] is not None else []
 
         # Refrescar UI
         self._fill_table(seq)
-        self._update_metrics(seq)
-        self._draw_histogram(seq)
+        self._update_metrics(result["stats"])
+        self._update_cycle(result["cycle_info"])
+        self._draw_histogram(*result["histogram"])
 
         Toast(self, text="Secuencia generada ✔")
 
-    def _fill_table(self, seq: np.ndarray) -> None:
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+    def _on_generate_error(self, error: BaseException) -> None:
+        self._finish_job()
+        messagebox.showerror("Generación", str(error))
 
-        max_rows = min(len(seq), 10000)
+    def _on_generate_cancelled(self) -> None:
+        self._finish_job()
+        Toast(self, text="Generación cancelada")
+
+    def _fill_table(self, seq: np.ndarray) -> None:
+        # Filas de la traza (si el generador la provee) y, después, valores de la secuencia
         trace = self.state.params.get("trace", [])
+        n_trace = len(trace)
 
-        if trace:
-            for i, line in enumerate(trace[:max_rows]):
-                if i % 500 == 0:
-                    self.tree.update_idletasks()
-                self.tree.insert("", "end", values=(i, line))
-        else:
-            for i in range(max_rows):
-                if i % 500 == 0:
-                    self.tree.update_idletasks()
-                self.tree.insert("", "end", values=(i, float(seq[i])))
-
-    def _update_metrics(self, seq: np.ndarray) -> None:
-        mu = float(np.mean(seq))
-        sd = float(np.std(seq, ddof=1)) if len(seq) > 1 else 0.0
-        vmin = float(np.min(seq))
-        vmax = float(np.max(seq))
-        self.lbl_n.config(text=f"n: {len(seq)}")
+        def row(i: int):
+            return (i, trace[i]) if i < n_trace else (i, seq[i].item())
+
+        self.table.set_source(len(seq), row)
+
+    def on_goto(self) -> None:
+        if self.table.count == 0:
+            messagebox.showwarning("Ir a índice", "Primero genera una secuencia.")
+            return
+        index = self._parse_int_or_none(self.entry_goto.get())
+        if index is None or not 0 <= index < self.table.count:
+            messagebox.showerror("Ir a índice", f"El índice debe ser un entero en [0, {self.table.count - 1}].")
+            return
+        self.table.jump_to(index)
+
+    def _update_metrics(self, stats: Any) -> None:
+        mu = stats.mean
+        sd = float(np.sqrt(stats.variance)) if stats.n > 1 else 0.0
+        vmin = stats.min
+        vmax = stats.max
+        self.lbl_n.config(text=f"n: {stats.n}")
         self.lbl_mu.config(text=f"μ: {mu:.6f}")
         self.lbl_sd.config(text=f"σ: {sd:.6f}")
         self.lbl_min.config(text=f"min: {vmin:.6f}")
         self.lbl_max.config(text=f"max: {vmax:.6f}")
 
-    def _draw_histogram(self, seq: np.ndarray) -> None:
-        bins = int(self.state.params.get("k", 10))
-        draw_histogram(self.figure, seq, bins=bins)
+    def _update_cycle(self, info: Optional[dict]) -> None:
+        if not info:
+            self.lbl_tail.config(text="cola: —")
+            self.lbl_period.config(text="periodo: —")
+            self.lbl_cycle_start.config(text="inicio ciclo: —")
+            self._cycle_start = None
+            self.btn_goto_cycle.config(state="disabled")
+            return
+        zero = " (cae en 0)" if info.get("zero") else ""
+        self.lbl_tail.config(text=f"cola: {info['tail']}")
+        self.lbl_period.config(text=f"periodo: {info['period']}{zero}")
+        self.lbl_cycle_start.config(text=f"inicio ciclo: {info['cycle_start']}")
+        self._cycle_start = info.get("cycle_start")
+        can_jump = self._cycle_start is not None and 0 <= self._cycle_start < self.table.count
+        self.btn_goto_cycle.config(state="normal" if can_jump else "disabled")
+
+    def _ensure_canvas(self) -> None:
+        if self.canvas is not None:
+            return
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+        self.figure = Figure(figsize=(5, 4), dpi=100, facecolor=PALETTE["elev"])
+        self.canvas = FigureCanvasTkAgg(self.figure, master=self.right_frame)
+        self.canvas.get_tk_widget().pack(fill="both", expand=True)
+
+    def _draw_histogram(self, counts: np.ndarray, edges: np.ndarray) -> None:
+        self._ensure_canvas()
+        draw_histogram_counts(self.figure, edges, counts)
         self.canvas.draw_idle()
 
     def on_export_csv(self) -> None:
@@ -270,7 +420,7 @@ class GeneradoresTab(ttk.Frame):
         Toast(self, text="CSV guardado 📄")
 
     def on_save_png(self) -> None:
-        if self.state.sequence is None:
+        if self.state.sequence is None or self.figure is None:
             messagebox.showwarning("Guardar PNG", "No hay gráfico para guardar. Genera primero.")
             return
         path = filedialog.asksaveasfilename(
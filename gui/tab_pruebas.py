@@ -1,19 +1,115 @@
 """
-Tab 'Pruebas' con estilos oscuros y resultados en fuente monoespaciada.
+Tab 'Pruebas' con estilos oscuros.
 - Muestra lista de pruebas (Registry).
-- Ejecuta y presenta resultados en JSON legible.
+- Ejecuta las seleccionadas con core.test_runner (una pasada compartida
+  sobre la secuencia) y presenta:
+  - una grilla resumen (prueba, estadístico, crítico, p-value, decisión,
+    tiempo), una fila por prueba;
+  - el detalle de la prueba elegida: sus campos y su tabla por categoría
+    en una VirtualTable, que solo pide las filas visibles (la tabla de
+    χ² con m grande no se arma completa).
+  El JSON completo solo se genera al exportar (utils.exporter).
 - Si alguna prueba devuelve 'warnings', se alerta con messagebox.
+- Segundo nivel (core.second_level): una prueba sobre B bloques de la
+  secuencia, KS o χ² sobre los p-values y su histograma (Matplotlib se
+  importa al dibujar el primero).
+- Las pruebas y el segundo nivel corren en un hilo aparte (core.jobs): la
+  grilla resumen se llena a medida que termina cada prueba, la barra
+  muestra el avance y el botón en curso pasa a "Cancelar" (la cancelación
+  se atiende entre pruebas o entre grupos de bloques).
 """
 import tkinter as tk
-from tkinter import ttk, messagebox
-from typing import Dict, Any, List
-import json
+from tkinter import ttk, messagebox, filedialog
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
 import numpy as np
 
 from core.app_state import AppState
+from core.jobs import JobContext, JobRunner
 from core.registry import Registry
-from tests.base import RandomnessTest
-from gui.widgets import HoverAccentButton, Toast
+from core.second_level import SECOND_LEVEL_METHODS, second_level
+from core.test_runner import SHARED_PASS, run_tests
+from tests.result import TestResult
+from utils.exporter import export_results_to_json
+from utils.plotting import draw_p_value_histogram
+from gui.widgets import HoverAccentButton, JobProgress, Toast, VirtualTable
+from gui.theme import PALETTE
+
+TESTS_PER_ROW = 4
+SECOND_LEVEL_BLOCKS = 20
+
+# Columnas de la grilla resumen: (id, encabezado, ancho, anchor)
+SUMMARY_COLUMNS = (("test", "Prueba", 260, "w"), ("stat", "Estadístico", 110, "e"),
+                   ("crit", "Crítico", 150, "e"), ("p", "p-value", 100, "e"),
+                   ("decision", "Decisión", 110, "w"), ("ms", "Tiempo (ms)", 90, "e"))
+DETAIL_COLUMNS = (("c0", "", 200, "w"), ("c1", "", 110, "e"), ("c2", "", 110, "e"), ("c3", "", 110, "e"))
+# Campos que se muestran como estadístico y como valor crítico (el primero presente)
+STAT_KEYS = ("chi2_stat", "Z", "Q", "ks_D")
+CRIT_KEYS = ("chi2_crit_(1-alpha,df)", "z_crit_(1-alpha/2)")
+# No se listan en la línea de campos del detalle
+DETAIL_SKIP = {"test", "p_values", "histogram", "table", "warnings", "status"}
+
+
+def fmt(value: Any) -> str:
+    if isinstance(value, (bool, np.bool_)):
+        return "sí" if value else "no"
+    if isinstance(value, (float, np.floating)):
+        return f"{value:.6g}"
+    if isinstance(value, (list, tuple)):
+        return "[" + ", ".join(fmt(v) for v in value) + "]"
+    return str(value)
+
+
+def summary_row(result: Mapping[str, Any], seconds: Optional[float]) -> Tuple[str, ...]:
+    """Fila de la grilla resumen de un resultado."""
+    stat = next((result[k] for k in STAT_KEYS if k in result), None)
+    crit = next((result[k] for k in CRIT_KEYS if k in result), None)
+    if crit is None and "chi2_lower" in result:
+        crit = [result["chi2_lower"], result["chi2_upper"]]
+    decision = "✔ pasa" if result.get("passed") else "✘ no pasa"
+    if result.get("warnings"):
+        decision += " ⚠"
+    return (str(result.get("test", "")), fmt(stat) if stat is not None else "—",
+            fmt(crit) if crit is not None else "—", fmt(result.get("p_value", float("nan"))),
+            decision, f"{seconds * 1000:.2f}" if seconds is not None else "—")
+
+
+def detail_source(result: Mapping[str, Any]) -> Tuple[Tuple[str, ...], int, Callable[[int], Tuple]]:
+    """(encabezados, filas, fila(i)) de la tabla de detalle de un resultado."""
+    if isinstance(result, TestResult) and result.table is not None:
+        t = result.table
+        return ((t.label_key, "O_i", "E_i", "término"), len(t),
+                lambda i: (t.label(i), int(t.O[i]), fmt(float(t.E[i])), fmt(float(t.terms[i]))))
+    if "p_values" in result:
+        p = result["p_values"]
+        alpha = result.get("alpha", 0.05)
+        return (("bloque", "p-value", "p >= α", ""), len(p),
+                lambda i: (str(i), fmt(p[i]), fmt(p[i] >= alpha), ""))
+    rows = result.get("table") or []
+    if rows:
+        keys = list(rows[0].keys())[:4]
+        return (tuple(keys) + ("",) * (4 - len(keys)), len(rows),
+                lambda i: tuple(fmt(rows[i][k]) for k in keys) + ("",) * (4 - len(keys)))
+    return (("", "", "", ""), 0, lambda i: ())
+
+
+def tests_job(ctx: JobContext, sequence: Any, names: List[str], **kwargs) -> Dict[str, Any]:
+    """Trabajo en segundo plano: run_tests con cada resultado como parcial."""
+    def report(done: int, total: int, name: str, result: Mapping[str, Any]) -> None:
+        ctx.partial(result)
+        ctx.progress(done, total, f"{done}/{total} pruebas")
+
+    ctx.progress(0, len(names), "Ejecutando pruebas…")
+    return run_tests(sequence, names, progress=report, **kwargs)
+
+
+def second_level_job(ctx: JobContext, sequence: Any, name: str, **kwargs) -> Dict[str, Any]:
+    """Trabajo en segundo plano: second_level con avance por grupos de bloques."""
+    def report(done: int, total: int) -> None:
+        ctx.progress(done, total, f"{done}/{total} grupos de bloques")
+
+    ctx.progress(0, 1, "Segundo nivel…")
+    return second_level(sequence, name, progress=report, **kwargs)
+
 
 class PruebasTab(ttk.Frame):
     def __init__(self, parent, state: AppState):
@@ -23,24 +119,188 @@ class PruebasTab(ttk.Frame):
         top = ttk.Labelframe(self, text="Pruebas disponibles")
         top.pack(side="top", fill="x", padx=10, pady=10)
 
+        # Uniformidad e independencia: TESTS_PER_ROW casillas por fila
         self.tests_vars: Dict[str, tk.BooleanVar] = {}
-        for name in Registry.tests.keys():
+        for i, name in enumerate(Registry.tests.keys()):
             var = tk.BooleanVar(value=False)
-            ttk.Checkbutton(top, text=name, variable=var).pack(side="left", padx=8, pady=8)
+            row, col = divmod(i, TESTS_PER_ROW)
+            ttk.Checkbutton(top, text=name, variable=var).grid(row=row, column=col, padx=8, pady=6, sticky="w")
             self.tests_vars[name] = var
 
         self.btn_run = HoverAccentButton(top, text="Probar", command=self.on_run_tests)
-        self.btn_run.pack(side="left", padx=10)
+        self.btn_run.grid(row=0, column=TESTS_PER_ROW, rowspan=2, padx=10)
 
-        # Resultados
+        # Segundo nivel: prueba por bloques + uniformidad de los p-values
+        level2 = ttk.Labelframe(self, text="Segundo nivel")
+        level2.pack(side="top", fill="x", padx=10, pady=(0, 10))
+
+        ttk.Label(level2, text="Prueba:").grid(row=0, column=0, padx=6, pady=8, sticky="e")
+        self.combo_level2 = ttk.Combobox(level2, state="readonly", width=38,
+                                         values=list(Registry.tests.keys()))
+        if Registry.tests:
+            self.combo_level2.current(0)
+        self.combo_level2.grid(row=0, column=1, padx=6, pady=8, sticky="w")
+
+        ttk.Label(level2, text="Bloques (B):").grid(row=0, column=2, padx=6, pady=8, sticky="e")
+        self.entry_blocks = ttk.Entry(level2, width=8)
+        self.entry_blocks.insert(0, str(SECOND_LEVEL_BLOCKS))
+        self.entry_blocks.grid(row=0, column=3, padx=6, pady=8, sticky="w")
+
+        ttk.Label(level2, text="Sobre p-values:").grid(row=0, column=4, padx=6, pady=8, sticky="e")
+        self.combo_method = ttk.Combobox(level2, state="readonly", width=6, values=list(SECOND_LEVEL_METHODS))
+        self.combo_method.current(0)
+        self.combo_method.grid(row=0, column=5, padx=6, pady=8, sticky="w")
+
+        self.btn_level2 = HoverAccentButton(level2, text="Segundo nivel", command=self.on_run_second_level)
+        self.btn_level2.grid(row=0, column=6, padx=10)
+
+        # Resultados: resumen, detalle virtual e histograma de p-values (al primer segundo nivel)
         bottom = ttk.Labelframe(self, text="Resultados")
         bottom.pack(side="top", fill="both", expand=True, padx=10, pady=10)
 
-        self.txt_results = tk.Text(bottom, height=20, bg="#0F141E", fg="#E6EAF2",
-                                   insertbackground="#E6EAF2", font=("Consolas", 10))
-        self.txt_results.pack(fill="both", expand=True)
+        actions = ttk.Frame(bottom)
+        actions.pack(side="top", fill="x")
+        self.lbl_shared = ttk.Label(actions, text="", style="Subtle.TLabel")
+        self.lbl_shared.pack(side="left", padx=6)
+        # Avance del trabajo en curso (pruebas o segundo nivel)
+        self.progress = JobProgress(actions)
+        self.progress.pack(side="left", padx=6)
+        ttk.Button(actions, text="Exportar JSON", command=self.on_export_json).pack(side="right", padx=6, pady=4)
+
+        left = ttk.Frame(bottom)
+        left.pack(side="left", fill="both", expand=True)
+
+        self.summary = ttk.Treeview(left, columns=[c[0] for c in SUMMARY_COLUMNS], show="headings",
+                                    height=6, selectmode="browse")
+        for cid, heading, width, anchor in SUMMARY_COLUMNS:
+            self.summary.heading(cid, text=heading)
+            self.summary.column(cid, width=width, anchor=anchor, stretch=(anchor == "w"))
+        self.summary.pack(side="top", fill="x")
+        self.summary.bind("<<TreeviewSelect>>", self._on_summary_select)
+
+        self.lbl_fields = ttk.Label(left, text="", style="Subtle.TLabel", wraplength=900, justify="left")
+        self.lbl_fields.pack(side="top", fill="x", padx=4, pady=6)
+
+        self.detail = VirtualTable(left, DETAIL_COLUMNS, height=12)
+        self.detail.pack(side="top", fill="both", expand=True)
+
+        self.results: List[Mapping[str, Any]] = []
+        self.summary_items: List[str] = []
+
+        self.hist_frame = ttk.Frame(bottom)
+        self.figure = None
+        self.canvas = None
+
+        # Un trabajo a la vez: su botón pasa a "Cancelar" y el otro se deshabilita
+        self.jobs = JobRunner(self)
+        self._job = None
+        self._job_button: Optional[HoverAccentButton] = None
+        self._job_title = ""
+        self._job_done: Optional[Callable[[Any], None]] = None
+        self._buttons = {self.btn_run: "Probar", self.btn_level2: "Segundo nivel"}
+
+    # ----------------- Presentación -----------------
+
+    def _show_results(self, results: List[Mapping[str, Any]], seconds: List[Optional[float]]) -> None:
+        """Llena la grilla resumen (una fila por prueba) y muestra el detalle de la primera."""
+        self.results = list(results)
+        self.state.test_results = self.results
+        self.summary.delete(*self.summary.get_children())
+        self.summary_items = [self.summary.insert("", "end", values=summary_row(r, secs))
+                              for r, secs in zip(self.results, seconds)]
+        if self.summary_items:
+            self.summary.selection_set(self.summary_items[0])
+        self._show_detail(0 if self.results else None)
+
+    def _add_result(self, result: Mapping[str, Any]) -> None:
+        """Agrega a la grilla el resultado de una prueba recién terminada."""
+        self.results.append(result)
+        self.summary_items.append(self.summary.insert("", "end", values=summary_row(result, None)))
+        if len(self.summary_items) == 1:
+            self.summary.selection_set(self.summary_items[0])
+
+    def _on_summary_select(self, _event) -> None:
+        chosen = self.summary.selection()
+        if chosen and chosen[0] in self.summary_items:
+            self._show_detail(self.summary_items.index(chosen[0]))
+
+    def _show_detail(self, index: Optional[int]) -> None:
+        if index is None:
+            self.lbl_fields.configure(text="")
+            self.detail.clear()
+            return
+        result = self.results[index]
+        self.lbl_fields.configure(text="  ·  ".join(f"{key}: {fmt(result[key])}" for key in result
+                                                   if key not in DETAIL_SKIP))
+        headings, count, row_fn = detail_source(result)
+        for (cid, *_), heading in zip(DETAIL_COLUMNS, headings):
+            self.detail.tree.heading(cid, text=heading)
+        self.detail.set_source(count, row_fn)
+
+    def on_export_json(self) -> None:
+        if not self.results:
+            messagebox.showwarning("Exportar JSON", "No hay resultados para exportar. Ejecuta una prueba.")
+            return
+        path = filedialog.asksaveasfilename(
+            defaultextension=".json",
+            filetypes=[("JSON", "*.json"), ("JSON lines (tablas en columnas)", "*.jsonl")],
+            title="Exportar resultados"
+        )
+        if not path:
+            return
+        try:
+            export_results_to_json(self.results, path)
+            Toast(self, text="Resultados exportados ✔")
+        except Exception as e:
+            messagebox.showerror("Exportar JSON", f"Error al exportar: {e}")
+
+    # ----------------- Trabajos en segundo plano -----------------
+
+    def _start_job(self, button: HoverAccentButton, text: str, fn: Callable[..., Any], *args,
+                   on_done: Callable[[Any], None], title: str, **kwargs) -> None:
+        self._job_button = button
+        for other in self._buttons:
+            if other is not button:
+                other.configure(state="disabled")
+        button.configure(text="Cancelar")
+        self.progress.start(text)
+        self._job_title = title
+        self._job_done = on_done
+        self._job = self.jobs.submit(fn, *args, **kwargs,
+                                     on_progress=self.progress.set, on_partial=self._add_result,
+                                     on_done=self._on_job_done, on_error=self._on_job_error,
+                                     on_cancel=self._on_job_cancelled)
+
+    def _cancel_job(self) -> bool:
+        """Si hay un trabajo en curso lo cancela (el botón decía "Cancelar")."""
+        if self._job is None:
+            return False
+        self.jobs.cancel(self._job)
+        self._job_button.configure(text="Cancelando…", state="disabled")
+        return True
+
+    def _finish_job(self) -> None:
+        self._job = None
+        self._job_button = None
+        self.progress.stop()
+        for button, text in self._buttons.items():
+            button.configure(text=text, state="normal")
+
+    def _on_job_done(self, value: Any) -> None:
+        self._finish_job()
+        self._job_done(value)
+
+    def _on_job_error(self, error: BaseException) -> None:
+        self._finish_job()
+        messagebox.showerror(self._job_title, str(error))
+
+    def _on_job_cancelled(self) -> None:
+        self._finish_job()
+        Toast(self, text=f"{self._job_title}: cancelado")
 
     def on_run_tests(self) -> None:
+        if self._cancel_job():
+            return
         if self.state.sequence is None:
             messagebox.showwarning("Pruebas", "Primero genera una secuencia.")
             return
@@ -50,35 +310,77 @@ class PruebasTab(ttk.Frame):
             messagebox.showinfo("Pruebas", "Selecciona al menos una prueba.")
             return
 
-        self.txt_results.delete("1.0", "end")
-        results_summary: List[Dict[str, Any]] = []
-
         # Variables globales
         alpha = self.state.params.get("alpha", 0.05)
         k_bins = self.state.params.get("k", 10)  # usaremos k como m en uniformidad
 
-        for name in selected:
-            factory = Registry.tests.get(name)
-            if factory is None:
-                continue
-            test_obj: RandomnessTest = factory()
-            res: Dict[str, Any] = test_obj.run(
-                self.state.sequence,
-                alpha=alpha,
-                # pasamos ambos por si alguna prueba usa k o m
-                k=k_bins,
-                m=k_bins,
-            )
-            results_summary.append(res)
-
-        # Mostrar resultados
-        self.txt_results.insert("1.0", json.dumps(results_summary, indent=2, ensure_ascii=False))
+        # La grilla se llena con cada prueba que termina (on_partial)
+        self.lbl_shared.configure(text="")
+        self._show_results([], [])
+        self._start_job(self.btn_run, "Ejecutando pruebas…", tests_job,
+                        self.state.sequence, selected,
+                        on_done=lambda run: self._on_tests_done(run, selected), title="Pruebas",
+                        alpha=alpha,
+                        # pasamos ambos por si alguna prueba usa k o m
+                        k=k_bins,
+                        m=k_bins)
+
+    def _on_tests_done(self, run: Dict[str, Any], selected: List[str]) -> None:
+        results_summary = run["results"]
+        shared = run["timings"].get(SHARED_PASS)
+        self.lbl_shared.configure(text=f"{SHARED_PASS}: {shared * 1000:.2f} ms" if shared is not None else "")
+        self._show_results(results_summary, [run["timings"].get(name) for name in selected])
         Toast(self, text="Pruebas ejecutadas 🧪")
 
         # Si hay advertencias, mostrarlas
         warnings_all = []
         for r in results_summary:
-            if isinstance(r, dict) and r.get("warnings"):
+            if r.get("warnings"):
                 warnings_all.extend(r["warnings"])
         if warnings_all:
             messagebox.showwarning("Advertencias", "\n".join(dict.fromkeys(warnings_all)))  # unique lines
+
+    def on_run_second_level(self) -> None:
+        if self._cancel_job():
+            return
+        if self.state.sequence is None:
+            messagebox.showwarning("Segundo nivel", "Primero genera una secuencia.")
+            return
+        name = self.combo_level2.get()
+        if not name:
+            messagebox.showinfo("Segundo nivel", "Selecciona una prueba.")
+            return
+        try:
+            blocks = int(self.entry_blocks.get())
+        except ValueError:
+            messagebox.showerror("Segundo nivel", "B debe ser un entero.")
+            return
+
+        alpha = self.state.params.get("alpha", 0.05)
+        k_bins = self.state.params.get("k", 10)
+        self._start_job(self.btn_level2, "Segundo nivel…", second_level_job, self.state.sequence, name,
+                        on_done=self._on_second_level_done, title="Segundo nivel",
+                        blocks=blocks, method=self.combo_method.get(), alpha=alpha, k=k_bins, m=k_bins)
+
+    def _on_second_level_done(self, res: Dict[str, Any]) -> None:
+        self.lbl_shared.configure(text="")
+        self._show_results([res], [None])
+        self._ensure_canvas()
+        hist = res["histogram"]
+        draw_p_value_histogram(self.figure, hist["edges"], hist["counts"],
+                               title=f"p-values de {res['blocks']} bloques ({res['method'].upper()})")
+        self.canvas.draw_idle()
+        Toast(self, text="Segundo nivel ejecutado 🧪")
+        if res.get("warnings"):
+            messagebox.showwarning("Advertencias", "\n".join(res["warnings"]))
+
+    def _ensure_canvas(self) -> None:
+        if self.canvas is not None:
+            return
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+        self.hist_frame.pack(side="right", fill="both", expand=True, padx=(10, 0))
+        self.figure = Figure(figsize=(4, 3), dpi=100, facecolor=PALETTE["elev"])
+        self.canvas = FigureCanvasTkAgg(self.figure, master=self.hist_frame)
+        self.canvas.get_tk_widget().pack(fill="both", expand=True)
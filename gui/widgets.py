@@ -1,11 +1,18 @@
 """
-Widgets custom: barra animada, botones con hover y pequeños toasts.
+Widgets custom: barra animada, botones con hover, pequeños toasts, una
+tabla virtual (VirtualTable) para listas de cualquier tamaño y la barra de
+progreso de los trabajos en segundo plano (JobProgress, ver core.jobs).
 """
 import tkinter as tk
 from tkinter import ttk
-from typing import Optional, Tuple
+from typing import Callable, Optional, Sequence, Tuple
 from .theme import PALETTE
 
+# Alto de fila del Treeview (px) si el estilo no lo define
+TREE_ROW_HEIGHT = 20
+# Alto del encabezado del Treeview (px)
+TREE_HEADING_HEIGHT = 24
+
 class HoverAccentButton(ttk.Button):
     """
     Botón acento con hover suave (sin neón).
@@ -96,3 +103,177 @@ class Toast(ttk.Frame):
         for i in range(steps):
             self.after(i*22, lambda ii=i: self.label.configure(foreground=self._mix(1 - ii/steps)))
         self.after(steps*22 + 40, self.destroy)
+
+
+class JobProgress(ttk.Frame):
+    """
+    Barra de progreso y texto de un trabajo en segundo plano.
+    Vacía (sin barra) mientras no hay trabajo.
+    """
+    def __init__(self, master=None, length: int = 200, **kwargs):
+        super().__init__(master, **kwargs)
+        self.bar = ttk.Progressbar(self, orient="horizontal", mode="determinate", length=length)
+        self.label = ttk.Label(self, text="", style="Subtle.TLabel")
+
+    def start(self, text: str = "") -> None:
+        self.bar.configure(value=0, maximum=1)
+        self.label.configure(text=text)
+        self.bar.pack(side="left", padx=(0, 6))
+        self.label.pack(side="left")
+
+    def set(self, done: int, total: int, text: str = "") -> None:
+        self.bar.configure(maximum=max(total, 1), value=min(done, max(total, 1)))
+        if text:
+            self.label.configure(text=text)
+
+    def stop(self) -> None:
+        self.bar.pack_forget()
+        self.label.pack_forget()
+
+
+class VirtualTable(ttk.Frame):
+    """
+    Tabla virtual: un Treeview con solo las filas que caben en pantalla y
+    una barra de desplazamiento propia. Al desplazarse, las mismas filas se
+    rellenan con `row_fn(i)` (tupla de valores de la fila i), así la
+    memoria y el redibujo no dependen de la cantidad de filas.
+
+    columns: (id, encabezado, ancho, anchor) por columna.
+    set_source(count, row_fn) cambia el contenido; jump_to(i) lleva la
+    fila i a la vista y la selecciona; on_select(i) se llama al elegir una fila.
+    """
+    def __init__(self, master, columns: Sequence[Tuple[str, str, int, str]], height: int = 20,
+                 on_select: Optional[Callable[[int], None]] = None, **kwargs):
+        super().__init__(master, **kwargs)
+        ids = [c[0] for c in columns]
+        self.tree = ttk.Treeview(self, columns=ids, show="headings", height=height, selectmode="browse")
+        for cid, heading, width, anchor in columns:
+            self.tree.heading(cid, text=heading)
+            self.tree.column(cid, width=width, anchor=anchor, stretch=(anchor == "w"))
+        self.scroll = ttk.Scrollbar(self, orient="vertical", command=self._on_scrollbar)
+        self.scroll.pack(side="right", fill="y")
+        self.tree.pack(side="left", fill="both", expand=True)
+
+        self.on_select = on_select
+        self.count = 0
+        self.first = 0                  # índice de la primera fila visible
+        self.visible = height           # filas que caben en pantalla
+        self.selected: Optional[int] = None
+        self._row_fn: Optional[Callable[[int], Tuple]] = None
+        self._items: list = []          # filas del Treeview (se reutilizan)
+        try:
+            self._row_height = int(ttk.Style(self).lookup("Treeview", "rowheight") or TREE_ROW_HEIGHT)
+        except (tk.TclError, ValueError):
+            self._row_height = TREE_ROW_HEIGHT
+
+        self.tree.bind("<Configure>", self._on_configure)
+        self.tree.bind("<<TreeviewSelect>>", self._on_tree_select)
+        for seq in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.tree.bind(seq, self._on_wheel)
+        self.tree.bind("<Up>", lambda e: self._move_selection(-1))
+        self.tree.bind("<Down>", lambda e: self._move_selection(1))
+        self.tree.bind("<Prior>", lambda e: self._move_selection(-self.visible))
+        self.tree.bind("<Next>", lambda e: self._move_selection(self.visible))
+        self.tree.bind("<Home>", lambda e: self._move_selection(-self.count))
+        self.tree.bind("<End>", lambda e: self._move_selection(self.count))
+
+    # ----------------- Contenido -----------------
+
+    def set_source(self, count: int, row_fn: Optional[Callable[[int], Tuple]]) -> None:
+        self.count = max(int(count), 0) if row_fn is not None else 0
+        self._row_fn = row_fn
+        self.first = 0
+        self.selected = None
+        self._render()
+
+    def clear(self) -> None:
+        self.set_source(0, None)
+
+    def refresh(self) -> None:
+        """Vuelve a pedir las filas visibles (si cambió el contenido de la fuente)."""
+        self._render()
+
+    def jump_to(self, index: int, top: bool = True) -> None:
+        """
+        Muestra la fila `index` y la selecciona. Si hay que desplazarse, la
+        fila queda arriba (top=True) o se desplaza lo mínimo (teclado).
+        """
+        if self.count == 0:
+            return
+        index = min(max(int(index), 0), self.count - 1)
+        if not self.first <= index < self.first + self.visible:
+            below = not top and index >= self.first + self.visible
+            self.first = self._clamp_first(index - self.visible + 1 if below else index)
+        self.selected = index
+        self._render()
+        if self.on_select is not None:
+            self.on_select(index)
+
+    # ----------------- Ventana visible -----------------
+
+    def _clamp_first(self, first: int) -> int:
+        return min(max(int(first), 0), max(self.count - self.visible, 0))
+
+    def _scroll_to(self, first: int) -> None:
+        first = self._clamp_first(first)
+        if first != self.first:
+            self.first = first
+            self._render()
+
+    def _render(self) -> None:
+        rows = min(self.visible, self.count - self.first)
+        # Ajustar la cantidad de filas del Treeview (a lo sumo una pantalla)
+        while len(self._items) < rows:
+            self._items.append(self.tree.insert("", "end"))
+        while len(self._items) > rows:
+            self.tree.delete(self._items.pop())
+        selected_item = None
+        for k, item in enumerate(self._items):
+            i = self.first + k
+            self.tree.item(item, values=self._row_fn(i))
+            if i == self.selected:
+                selected_item = item
+        self.tree.selection_set((selected_item,) if selected_item is not None else ())
+        if self.count:
+            self.scroll.set(self.first / self.count, (self.first + rows) / self.count)
+        else:
+            self.scroll.set(0.0, 1.0)
+
+    # ----------------- Eventos -----------------
+
+    def _on_scrollbar(self, action: str, amount: str, unit: Optional[str] = None) -> None:
+        if action == "moveto":
+            self._scroll_to(round(float(amount) * self.count))
+        elif action == "scroll":
+            step = self.visible if unit == "pages" else 1
+            self._scroll_to(self.first + int(amount) * step)
+
+    def _on_wheel(self, event) -> str:
+        if getattr(event, "num", None) == 4 or getattr(event, "delta", 0) > 0:
+            self._scroll_to(self.first - 3)
+        else:
+            self._scroll_to(self.first + 3)
+        return "break"
+
+    def _on_configure(self, event) -> None:
+        visible = max(1, (event.height - TREE_HEADING_HEIGHT) // self._row_height)
+        if visible != self.visible:
+            self.visible = visible
+            self.first = self._clamp_first(self.first)
+            self._render()
+
+    def _on_tree_select(self, _event) -> None:
+        chosen = self.tree.selection()
+        if not chosen or chosen[0] not in self._items:
+            return
+        index = self.first + self._items.index(chosen[0])
+        if index != self.selected:
+            self.selected = index
+            if self.on_select is not None:
+                self.on_select(index)
+
+    def _move_selection(self, delta: int) -> str:
+        if self.count:
+            start = self.selected if self.selected is not None else self.first
+            self.jump_to(start + delta, top=False)
+        return "break"
@@ -1,4 +1,5 @@
-# Autoregistro de pruebas en el Registry (solo las activas)
-from . import medias                 # Medias Z
-from . import varianza               # Varianza χ²
-from . import uniformidad_chi2       # Uniformidad χ²
+# Autoregistro de pruebas en el Registry (solo las activas). Se registran
+# descriptores: cada módulo se importa la primera vez que se usa su prueba.
+from core.plugins import register_builtin_tests
+
+register_builtin_tests()
@@ -0,0 +1,281 @@
+"""
+Acumulador de estadísticos suficientes para las pruebas de uniformidad.
+
+Consume la secuencia por tramos NumPy (de un generador, de un archivo, de
+un memmap...) en una sola pasada y guarda:
+- n, media y M2 = Σ(u - ū)^2 (Welford por tramos: cada tramo aporta su
+  media y su M2 y se combinan con la fórmula de Chan)
+- min y max
+- conteos fuera de rango: u < 0, u == 0, u == 1, u > 1
+- O_i: frecuencias en `bins` intervalos de igual ancho sobre [0,1] con
+  bincount de floor(u*m) (`bin_counts`), corregido contra los mismos
+  bordes que np.histogram para dar exactamente sus conteos (el último
+  intervalo es cerrado a la derecha)
+
+Con esto MeanZTest, VarianceChiSquare y UniformityChiSquare arman su
+resultado sin tener la secuencia completa en memoria (`run_stats`).
+
+Dos acumuladores con los mismos `bins` se combinan con `merge`: los
+conteos se suman tal cual y media/M2 con la fórmula de Chan, así cada
+proceso puede acumular su parte y el resultado es el de la secuencia unida.
+
+BatchStats guarda lo mismo para una matriz (una secuencia por fila), como
+arreglos con un valor por fila: medias y M2 con reducciones por eje y las
+frecuencias de todas las filas con un solo bincount desplazado
+(`row_bin_counts`). Lo usan las pruebas por lotes (RandomnessTest.run_batch).
+"""
+from typing import Any, Dict, Iterable, Optional
+import numpy as np
+
+from tests.base import CHUNK_SIZE, unit_chunks, unit_rows
+
+
+def bin_index(u: np.ndarray, m: int, edges: np.ndarray) -> np.ndarray:
+    """
+    Intervalo (0..m-1) de cada u (todo en [0,1], cualquier forma): floor(u*m).
+    Los bordes de linspace no son exactamente k/m, así que los valores con
+    u*m a pocas ulp de un entero se comparan contra `edges` con las mismas
+    reglas que np.histogram; el resto no necesita corrección.
+    """
+    t = u * m
+    idx = t.astype(np.intp)
+    np.minimum(idx, m - 1, out=idx)             # u == 1 va al último intervalo
+    frac = t - idx
+    tol = max(1e-9, 16.0 * m * np.finfo(float).eps)
+    near = np.flatnonzero((frac < tol) | (frac > 1.0 - tol))
+    if near.size:
+        flat = idx.reshape(-1)
+        v, j = u.reshape(-1)[near], flat[near]
+        j -= v < edges[j]
+        j += (v >= edges[j + 1]) & (j != m - 1)
+        flat[near] = j
+    return idx
+
+
+def bin_counts(u: np.ndarray, m: int, edges: np.ndarray) -> np.ndarray:
+    """Frecuencias de u (todo en [0,1]) en m intervalos: bincount de bin_index."""
+    return np.bincount(bin_index(u, m, edges), minlength=m)
+
+
+def row_bin_counts(U: np.ndarray, m: int, edges: np.ndarray,
+                   all_inside: Optional[bool] = None) -> np.ndarray:
+    """
+    Frecuencias por fila de U (rows, n) en una sola llamada a bincount: la
+    fila r usa los índices r*m .. r*m+m-1. Los valores fuera de [0,1] van a
+    un índice extra (rows*m) que se descarta. `all_inside=True` evita
+    revisar el rango si quien llama ya lo sabe.
+    """
+    rows = U.shape[0]
+    inside = None
+    if not all_inside:
+        inside = (U >= 0.0) & (U <= 1.0)
+        all_inside = bool(inside.all())
+    idx = bin_index(U if all_inside else np.where(inside, U, 0.0), m, edges)
+    idx += (np.arange(rows, dtype=np.intp) * m)[:, None]
+    if not all_inside:
+        idx[~inside] = rows * m
+    return np.bincount(idx.reshape(-1), minlength=rows * m + 1)[:rows * m].reshape(rows, m)
+
+
+class SufficientStats:
+    def __init__(self, bins: Optional[int] = None, scale: Optional[int] = None,
+                 chunk_size: int = CHUNK_SIZE):
+        if bins is not None and int(bins) < 1:
+            raise ValueError("bins debe ser un entero positivo.")
+        self.bins = int(bins) if bins is not None else None
+        # Divisor para secuencias enteras de estado crudo (r = X / scale)
+        self.scale = scale
+        # Tramos más chicos caben en caché y las operaciones de cada tramo la reutilizan
+        self.chunk_size = int(chunk_size)
+        self.edges = np.linspace(0.0, 1.0, self.bins + 1) if self.bins is not None else None
+        self.n = 0
+        self.mean = 0.0
+        self.M2 = 0.0
+        self.min = float("inf")
+        self.max = float("-inf")
+        self.below = 0       # u < 0
+        self.zeros = 0       # u == 0
+        self.ones = 0        # u == 1
+        self.above = 0       # u > 1
+        self.counts = np.zeros(self.bins, dtype=np.int64) if self.bins is not None else None
+
+    # ----------------- Construcción -----------------
+
+    @classmethod
+    def from_sequence(cls, sequence: Any, bins: Optional[int] = None,
+                      scale: Optional[int] = None) -> "SufficientStats":
+        stats = cls(bins=bins, scale=scale)
+        stats.update(sequence)
+        return stats
+
+    @classmethod
+    def from_chunks(cls, chunks: Iterable[Any], bins: Optional[int] = None,
+                    scale: Optional[int] = None) -> "SufficientStats":
+        """Acumula un iterable de tramos (p.ej. RandomGenerator.stream)."""
+        stats = cls(bins=bins, scale=scale)
+        for chunk in chunks:
+            stats.update(chunk)
+        return stats
+
+    def update(self, chunk: Any) -> "SufficientStats":
+        """Agrega un tramo (float, o entero crudo con `scale`)."""
+        for u in unit_chunks(chunk, self.scale, self.chunk_size):
+            self._update_unit(u)
+        return self
+
+    def _update_unit(self, u: np.ndarray) -> None:
+        k = u.shape[0]
+        if k == 0:
+            return
+        c_mean = float(np.mean(u))
+        c_M2 = float(np.sum((u - c_mean) ** 2))
+        self._combine(k, c_mean, c_M2)
+
+        lo, hi = float(u.min()), float(u.max())
+        self.min = min(self.min, lo)
+        self.max = max(self.max, hi)
+        # Solo se cuentan los bordes si el tramo no está entero en (0,1)
+        if lo <= 0.0:
+            self.below += int(np.count_nonzero(u < 0.0))
+            self.zeros += int(np.count_nonzero(u == 0.0))
+        if hi >= 1.0:
+            self.ones += int(np.count_nonzero(u == 1.0))
+            self.above += int(np.count_nonzero(u > 1.0))
+        if self.counts is not None:
+            if lo < 0.0 or hi > 1.0:
+                u = u[(u >= 0.0) & (u <= 1.0)]
+            self.counts += bin_counts(u, self.bins, self.edges)
+
+    def _combine(self, k: int, mean: float, M2: float) -> None:
+        if k == 0:
+            return
+        if self.n == 0:
+            self.n, self.mean, self.M2 = k, mean, M2
+            return
+        delta = mean - self.mean
+        total = self.n + k
+        self.mean += delta * k / total
+        self.M2 += M2 + delta * delta * self.n * k / total
+        self.n = total
+
+    def merge(self, other: "SufficientStats") -> "SufficientStats":
+        """Suma en sitio los estadísticos de `other` (mismos bins y scale)."""
+        if self.bins != other.bins:
+            raise ValueError(f"No se pueden combinar acumuladores con bins distintos "
+                             f"({self.bins} y {other.bins}).")
+        if self.scale != other.scale:
+            raise ValueError(f"No se pueden combinar acumuladores con scale distinto "
+                             f"({self.scale} y {other.scale}).")
+        self._combine(other.n, other.mean, other.M2)
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self.below += other.below
+        self.zeros += other.zeros
+        self.ones += other.ones
+        self.above += other.above
+        if self.counts is not None:
+            self.counts += other.counts
+        return self
+
+    # ----------------- Lectura -----------------
+
+    @property
+    def variance(self) -> float:
+        """S^2 insesgada (NaN con n < 2)."""
+        return self.M2 / (self.n - 1) if self.n > 1 else float("nan")
+
+    @property
+    def outside_open(self) -> int:
+        """Valores fuera de (0,1)."""
+        return self.below + self.zeros + self.ones + self.above
+
+    @property
+    def outside_closed(self) -> int:
+        """Valores fuera de [0,1]."""
+        return self.below + self.above
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"bins": self.bins, "scale": self.scale, "n": self.n, "mean": self.mean, "M2": self.M2,
+                "min": self.min, "max": self.max, "below": self.below, "zeros": self.zeros,
+                "ones": self.ones, "above": self.above,
+                "counts": self.counts.tolist() if self.counts is not None else None}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SufficientStats":
+        # scale: ausente en dicts de versiones anteriores (secuencias float)
+        stats = cls(bins=data["bins"], scale=data.get("scale"))
+        for name in ("n", "mean", "M2", "min", "max", "below", "zeros", "ones", "above"):
+            setattr(stats, name, data[name])
+        if data["counts"] is not None:
+            stats.counts = np.asarray(data["counts"], dtype=np.int64)
+        return stats
+
+
+class BatchStats:
+    """Estadísticos suficientes por fila de una matriz (rows, n) de secuencias."""
+
+    def __init__(self, rows: int, n: int, bins: Optional[int] = None):
+        if bins is not None and int(bins) < 1:
+            raise ValueError("bins debe ser un entero positivo.")
+        self.rows = int(rows)
+        self.n = int(n)
+        self.bins = int(bins) if bins is not None else None
+        self.edges = np.linspace(0.0, 1.0, self.bins + 1) if self.bins is not None else None
+        self.mean = np.full(self.rows, np.nan)
+        self.M2 = np.zeros(self.rows)
+        self.min = np.full(self.rows, np.inf)
+        self.max = np.full(self.rows, -np.inf)
+        self.below = np.zeros(self.rows, dtype=np.int64)
+        self.zeros = np.zeros(self.rows, dtype=np.int64)
+        self.ones = np.zeros(self.rows, dtype=np.int64)
+        self.above = np.zeros(self.rows, dtype=np.int64)
+        self.counts = np.zeros((self.rows, self.bins), dtype=np.int64) if self.bins is not None else None
+
+    @classmethod
+    def from_matrix(cls, matrix: Any, bins: Optional[int] = None, scale: Optional[int] = None,
+                    chunk_size: int = CHUNK_SIZE) -> "BatchStats":
+        """
+        Recorre la matriz por bloques de filas de ~chunk_size valores (float,
+        o entera cruda con `scale`). Cada fila da lo mismo que
+        SufficientStats.from_sequence sobre esa fila (n <= CHUNK_SIZE).
+        """
+        M = np.asarray(matrix)
+        if M.ndim != 2:
+            raise ValueError("Se espera una matriz 2-D (una secuencia por fila).")
+        stats = cls(M.shape[0], M.shape[1], bins=bins)
+        if stats.n == 0:
+            return stats
+        for lo, U in unit_rows(M, scale, chunk_size):
+            rows = slice(lo, lo + U.shape[0])
+            mean = np.mean(U, axis=1)
+            stats.mean[rows] = mean
+            stats.M2[rows] = np.sum((U - mean[:, None]) ** 2, axis=1)
+            lo_row, hi_row = U.min(axis=1), U.max(axis=1)
+            stats.min[rows] = lo_row
+            stats.max[rows] = hi_row
+            # Solo se cuentan los bordes si el bloque no está entero en (0,1)
+            if lo_row.min() <= 0.0:
+                stats.below[rows] = np.count_nonzero(U < 0.0, axis=1)
+                stats.zeros[rows] = np.count_nonzero(U == 0.0, axis=1)
+            if hi_row.max() >= 1.0:
+                stats.ones[rows] = np.count_nonzero(U == 1.0, axis=1)
+                stats.above[rows] = np.count_nonzero(U > 1.0, axis=1)
+            if stats.counts is not None:
+                inside = lo_row.min() >= 0.0 and hi_row.max() <= 1.0
+                stats.counts[rows] = row_bin_counts(U, stats.bins, stats.edges, all_inside=inside or None)
+        return stats
+
+    @property
+    def variance(self) -> np.ndarray:
+        """S^2 insesgada por fila (NaN con n < 2)."""
+        if self.n < 2:
+            return np.full(self.rows, np.nan)
+        return self.M2 / (self.n - 1)
+
+    @property
+    def outside_open(self) -> np.ndarray:
+        return self.below + self.zeros + self.ones + self.above
+
+    @property
+    def outside_closed(self) -> np.ndarray:
+        return self.below + self.above
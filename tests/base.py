@@ -1,13 +1,191 @@
 """
 Interfaz base para pruebas estadísticas.
-Cada prueba debe heredar y exponer `run(sequence, **kwargs) -> dict`.
+Cada prueba debe heredar y exponer `run(sequence, **kwargs)`, que retorna
+un Mapping de resultados (las pruebas incluidas, un tests.result.TestResult
+con `to_dict()` para el dict completo). Incluye "passed" (bool) con la
+decisión a nivel α, para que los procesos por lote (p.ej. core.seed_atlas)
+no tengan que interpretar textos.
+
+Tipos de secuencia admitidos (ver generators.base.OUTPUT_DTYPES):
+- float64 / float32: r en [0,1]
+- uint32 / uint64: estado crudo X; se pasa scale (10^D, o m en los
+  congruenciales) y se usa r = X / scale
+Las pruebas recorren la secuencia por tramos de CHUNK_SIZE valores
+(`unit_chunks`), así nunca se convierte el arreglo completo a float64.
+Las que solo necesitan estadísticos suficientes implementan además
+`run_stats(stats)` sobre un tests.accumulator.SufficientStats.
+
+Pruebas de independencia (corridas, póker, huecos, correlación serial):
+heredan de StreamingTest y definen un acumulador propio con `update(u)`
+que guarda lo necesario entre tramos (último valor, hueco en curso...);
+`run` y `run_chunks` lo alimentan tramo a tramo y `run_accumulator` arma
+el resultado, así el costo es O(n) con memoria de un tramo.
+
+Por lotes: `run_batch(matrix)` aplica la prueba a cada fila de una matriz
+(rows, n) y devuelve columnas (un arreglo por campo) en lugar de una lista
+de dicts. Las pruebas vectorizadas la implementan con reducciones por eje
+(tests.accumulator.BatchStats); la versión base recorre las filas.
 """
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import Dict, Any, Iterable, Iterator, List, Mapping, Optional, Tuple
 import numpy as np
 
+# Valores por tramo al recorrer secuencias largas
+CHUNK_SIZE = 1 << 20
+
+
+def unit_chunks(sequence: Any, scale: Optional[int] = None,
+                chunk_size: int = CHUNK_SIZE) -> Iterator[np.ndarray]:
+    """
+    Tramos float64 de r. Con float64 son vistas (sin copia); con float32 o
+    enteros solo se convierte el tramo actual.
+    """
+    u = np.asarray(sequence)
+    divisor = None
+    if u.dtype.kind in "ui":
+        if scale is None:
+            raise ValueError("Secuencia entera (estado crudo): indica scale, p.ej. 10^D o m.")
+        divisor = float(scale)
+    elif u.dtype.kind != "f":
+        u = u.astype(float)
+    u = u.ravel()
+    for lo in range(0, u.shape[0], chunk_size):
+        chunk = u[lo:lo + chunk_size]
+        if divisor is not None:
+            yield chunk / divisor
+        elif chunk.dtype != np.float64:
+            yield chunk.astype(np.float64)
+        else:
+            yield chunk
+
+
+def unit_rows(matrix: np.ndarray, scale: Optional[int] = None,
+              chunk_size: int = CHUNK_SIZE) -> Iterator[Tuple[int, np.ndarray]]:
+    """
+    (primera fila, bloque float64 de r) por bloques de filas con unos
+    chunk_size valores en total (al menos una fila por bloque).
+    """
+    M = np.asarray(matrix)
+    divisor = None
+    if M.dtype.kind in "ui":
+        if scale is None:
+            raise ValueError("Secuencia entera (estado crudo): indica scale, p.ej. 10^D o m.")
+        divisor = float(scale)
+    step = max(1, chunk_size // max(M.shape[1], 1))
+    for lo in range(0, M.shape[0], step):
+        block = M[lo:lo + step]
+        if divisor is not None:
+            yield lo, block / divisor
+        elif block.dtype != np.float64:
+            yield lo, block.astype(np.float64)
+        else:
+            yield lo, block
+
+
+def stack_results(results: List[Mapping[str, Any]]) -> Dict[str, Any]:
+    """
+    Columnas a partir de dicts de `run` (uno por fila): los campos escalares
+    que cambian entre filas pasan a arreglos; los que no cambian quedan como
+    escalar. Las listas (tablas, advertencias) se descartan.
+    """
+    columns: Dict[str, Any] = {"rows": len(results)}
+    if not results:
+        return columns
+    for key in results[0]:
+        if key in ("table", "warnings"):
+            continue
+        first = results[0][key]
+        if not isinstance(first, (bool, int, float, str, np.generic)):
+            continue
+        values = [r.get(key) for r in results]
+        columns[key] = first if all(v == first for v in values) else np.asarray(values)
+    return columns
+
+
 class RandomnessTest(ABC):
     @abstractmethod
-    def run(self, sequence: np.ndarray, **kwargs) -> Dict[str, Any]:
-        """Ejecuta la prueba y retorna un dict con resultados y conclusiones."""
+    def run(self, sequence: np.ndarray, **kwargs) -> Mapping[str, Any]:
+        """Ejecuta la prueba y retorna sus resultados y conclusiones (dict o TestResult)."""
+        raise NotImplementedError
+
+    def run_stats(self, stats: Any, **kwargs) -> Mapping[str, Any]:
+        """Misma prueba desde un tests.accumulator.SufficientStats (si la prueba lo admite)."""
+        raise NotImplementedError(f"{type(self).__name__} no admite acumuladores.")
+
+    def stats_bins(self, n: int, **kwargs) -> Optional[int]:
+        """Intervalos que run_stats necesita en el acumulador para n valores (None: ninguno)."""
+        return None
+
+    def run_batch(self, matrix: np.ndarray, **kwargs) -> Dict[str, Any]:
+        """
+        Misma prueba sobre cada fila de `matrix` (rows, n). Retorna columnas:
+        cada campo de `run` es un arreglo con un valor por fila (o un escalar
+        si es común a todas), p.ej. result["passed"][i] para la fila i.
+        Esta versión llama a `run` fila por fila; las pruebas vectorizadas la
+        sobrescriben.
+        """
+        M = np.asarray(matrix)
+        if M.ndim != 2:
+            raise ValueError("Se espera una matriz 2-D (una secuencia por fila).")
+        return stack_results([self.run(row, **kwargs) for row in M])
+
+
+class StreamingTest(RandomnessTest):
+    """Prueba con acumulador propio: se alimenta por tramos (streaming)."""
+
+    @abstractmethod
+    def accumulator(self, **kwargs) -> Any:
+        """Acumulador vacío con `update(u)` (u: tramo float64 de r)."""
         raise NotImplementedError
+
+    @abstractmethod
+    def run_accumulator(self, acc: Any, **kwargs) -> Mapping[str, Any]:
+        """Resultado de la prueba a partir del acumulador lleno."""
+        raise NotImplementedError
+
+    def feed(self, acc: Any, chunk: Any, scale: Optional[int] = None) -> None:
+        for u in unit_chunks(chunk, scale):
+            acc.update(u)
+
+    def run(self, sequence: np.ndarray, **kwargs) -> Mapping[str, Any]:
+        return self.run_chunks([sequence], **kwargs)
+
+    def run_chunks(self, chunks: Iterable[Any], **kwargs) -> Mapping[str, Any]:
+        """Misma prueba sobre un iterable de tramos (p.ej. RandomGenerator.stream)."""
+        acc = self.accumulator(**kwargs)
+        for chunk in chunks:
+            self.feed(acc, chunk, kwargs.get("scale"))
+        return self.run_accumulator(acc, **kwargs)
+
+
+def chi2_categories(observed: np.ndarray, expected: np.ndarray, alpha: float) -> Dict[str, Any]:
+    """χ² de bondad de ajuste sobre categorías: estadístico, df, crítico y p-value."""
+    from tests.quantiles import chi2_ppf, chi2_sf
+
+    O = np.asarray(observed, dtype=float)
+    E = np.asarray(expected, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        terms = np.where(E > 0, (O - E) ** 2 / E, np.nan)
+    stat = float(np.nansum(terms))
+    df = max(O.shape[0] - 1, 1)
+    crit = chi2_ppf(1.0 - alpha, df)
+    return {"chi2_stat": stat, "df": df, "chi2_crit_(1-alpha,df)": crit,
+            "p_value": chi2_sf(stat, df), "passed": bool(stat <= crit), "terms": terms}
+
+
+def merge_tail(observed: np.ndarray, probs: np.ndarray, n: int,
+               min_expected: float = 5.0) -> Tuple[np.ndarray, np.ndarray, int]:
+    """
+    Junta las últimas categorías (las menos probables, al final) hasta que
+    su E_i = n * p_i llegue a min_expected. Retorna (O, p, cantidad de
+    categorías juntadas en la última).
+    """
+    O = np.asarray(observed, dtype=np.int64)
+    p = np.asarray(probs, dtype=float)
+    k = O.shape[0]
+    cut = k - 1
+    while cut > 1 and n * p[cut:].sum() < min_expected:
+        cut -= 1
+    O = np.concatenate([O[:cut], [O[cut:].sum()]])
+    p = np.concatenate([p[:cut], [p[cut:].sum()]])
+    return O, p, k - cut
@@ -0,0 +1,92 @@
+"""
+Prueba de correlación serial con rezago k (independencia).
+
+Pasos:
+1) Pares (x_t, y_t) = (r_t, r_{t+k}), t = 1..N con N = n - k.
+2) Coeficiente de correlación muestral entre x e y:
+      ρ_k = (Sxy - Sx Sy / N) / sqrt((Sxx - Sx²/N) (Syy - Sy²/N))
+3) Bajo H0 (independencia) ρ_k ≈ N(0, 1/N):  Z = ρ_k sqrt(N);
+   acepta H0 si |Z| ≤ z_{1-α/2}. p-value bilateral: 2 * sf(|Z|).
+
+k: kwarg `lag` (por defecto 1).
+
+Streaming: solo se acumulan las cinco sumas (Sx, Sy, Sxx, Syy, Sxy); el
+acumulador guarda los últimos k valores de cada tramo para formar los
+pares que cruzan tramos. Cada tramo es O(tramo). Las sumas se calculan
+con los valores centrados en 1/2 (la correlación no cambia y se evita la
+cancelación de Sxy - Sx Sy / N con n grande).
+"""
+from typing import List
+import numpy as np
+
+from tests.base import StreamingTest
+from tests.quantiles import normal_ppf, normal_sf
+from tests.result import TestResult
+from core.registry import Registry
+
+
+class SerialCorrelationAccumulator:
+    def __init__(self, lag: int = 1):
+        if lag < 1:
+            raise ValueError(f"El rezago debe ser >= 1. Recibido lag={lag}.")
+        self.lag = int(lag)
+        self.n = 0
+        self.pairs = 0
+        self.Sx = self.Sy = self.Sxx = self.Syy = self.Sxy = 0.0
+        self.tail = np.empty(0)                  # últimos `lag` valores (centrados)
+
+    def update(self, u: np.ndarray) -> None:
+        if u.shape[0] == 0:
+            return
+        self.n += u.shape[0]
+        z = np.concatenate((self.tail, u - 0.5))
+        k = self.lag
+        if z.shape[0] > k:
+            x, y = z[:-k], z[k:]
+            self.pairs += x.shape[0]
+            self.Sx += float(x.sum())
+            self.Sy += float(y.sum())
+            self.Sxx += float(x @ x)
+            self.Syy += float(y @ y)
+            self.Sxy += float(x @ y)
+        self.tail = z[-k:].copy()
+
+
+class SerialCorrelationTest(StreamingTest):
+    def accumulator(self, **kwargs) -> SerialCorrelationAccumulator:
+        return SerialCorrelationAccumulator(int(kwargs.get("lag", 1)))
+
+    def run_accumulator(self, acc: SerialCorrelationAccumulator, **kwargs) -> TestResult:
+        alpha: float = float(kwargs.get("alpha", 0.05))
+        N = acc.pairs
+
+        warnings: List[str] = []
+        if N < 30:
+            warnings.append("Menos de 30 pares: la aproximación normal puede no ser fiable.")
+
+        if N > 1:
+            cov = acc.Sxy - acc.Sx * acc.Sy / N
+            vx = acc.Sxx - acc.Sx ** 2 / N
+            vy = acc.Syy - acc.Sy ** 2 / N
+            rho = cov / np.sqrt(vx * vy) if vx > 0 and vy > 0 else float("nan")
+        else:
+            rho = float("nan")
+        if N > 1 and not np.isfinite(rho):
+            warnings.append("Secuencia constante: la correlación no está definida.")
+        Z = rho * np.sqrt(N) if np.isfinite(rho) else float("nan")
+        zcrit = normal_ppf(1.0 - alpha / 2.0)
+        pval = 2.0 * normal_sf(abs(Z)) if np.isfinite(Z) else float("nan")
+        accept = abs(Z) <= zcrit if np.isfinite(Z) else False
+
+        return TestResult("Correlación serial", alpha, acc.n, pval, accept, fields={
+            "lag": acc.lag,
+            "pairs": N,
+            "rho": float(rho),
+            "Z": float(Z),
+            "z_crit_(1-alpha/2)": zcrit,
+            "conclusion": ("Pasa la prueba de correlación serial a nivel α" if accept
+                           else "No pasa la prueba de correlación serial a nivel α"),
+        }, warnings=warnings)
+
+# Registrar en el catálogo de pruebas
+Registry.register_test("Correlación serial", lambda: SerialCorrelationTest())
@@ -0,0 +1,87 @@
+"""
+Prueba de corridas arriba y abajo (independencia).
+
+Pasos:
+1) Para cada par consecutivo se anota 1 si r_{i+1} > r_i (sube) y 0 si no
+   (baja; los empates cuentan como bajada).
+2) a = cantidad de corridas (rachas máximas de símbolos iguales) en los
+   n-1 símbolos.
+3) Bajo H0 (independencia):
+      μ_a = (2n - 1) / 3 ,   σ²_a = (16n - 29) / 90
+4) Z = (a - μ_a) / σ_a ; acepta H0 si |Z| ≤ z_{1-α/2}.
+   p-value bilateral: 2 * sf(|Z|).
+
+Muy pocas corridas delatan tendencias largas; demasiadas, alternancia
+(correlación serial negativa).
+
+Streaming: el acumulador guarda el último valor y el último símbolo de
+cada tramo, así las corridas que cruzan tramos se cuentan una sola vez.
+Cada tramo es O(tramo): np.diff y un conteo de cambios de símbolo.
+
+Validaciones:
+- Advertencia si n<20 (la aproximación normal no es fiable).
+"""
+from typing import List, Optional
+import numpy as np
+
+from tests.base import StreamingTest
+from tests.quantiles import normal_ppf, normal_sf
+from tests.result import TestResult
+from core.registry import Registry
+
+
+class RunsUpDownAccumulator:
+    def __init__(self):
+        self.n = 0
+        self.runs = 0
+        self.last: Optional[float] = None       # último valor visto
+        self.last_up: Optional[bool] = None     # último símbolo (None: aún no hay pares)
+
+    def update(self, u: np.ndarray) -> None:
+        if u.shape[0] == 0:
+            return
+        self.n += u.shape[0]
+        if self.last is not None:
+            u = np.concatenate(([self.last], u))
+        self.last = float(u[-1])
+        if u.shape[0] < 2:
+            return
+        up = np.diff(u) > 0.0
+        # Corridas nuevas: el primer símbolo (si no continúa la del tramo anterior) y cada cambio
+        self.runs += int(np.count_nonzero(up[1:] != up[:-1]))
+        if self.last_up is None or bool(up[0]) != self.last_up:
+            self.runs += 1
+        self.last_up = bool(up[-1])
+
+
+class RunsUpDownTest(StreamingTest):
+    def accumulator(self, **kwargs) -> RunsUpDownAccumulator:
+        return RunsUpDownAccumulator()
+
+    def run_accumulator(self, acc: RunsUpDownAccumulator, **kwargs) -> TestResult:
+        alpha: float = float(kwargs.get("alpha", 0.05))
+        n, a = acc.n, acc.runs
+
+        warnings: List[str] = []
+        if n < 20:
+            warnings.append("n<20: la aproximación normal de las corridas puede no ser fiable.")
+
+        mu = (2.0 * n - 1.0) / 3.0
+        var = (16.0 * n - 29.0) / 90.0
+        Z = (a - mu) / np.sqrt(var) if var > 0 else float("nan")
+        zcrit = normal_ppf(1.0 - alpha / 2.0)
+        pval = 2.0 * normal_sf(abs(Z)) if np.isfinite(Z) else float("nan")
+        accept = abs(Z) <= zcrit if np.isfinite(Z) else False
+
+        return TestResult("Corridas arriba y abajo", alpha, n, pval, accept, fields={
+            "runs": a,
+            "mu_runs": mu,
+            "var_runs": var,
+            "Z": float(Z),
+            "z_crit_(1-alpha/2)": zcrit,
+            "conclusion": ("Pasa la prueba de corridas (independencia) a nivel α" if accept
+                           else "No pasa la prueba de corridas (independencia) a nivel α"),
+        }, warnings=warnings)
+
+# Registrar en el catálogo de pruebas
+Registry.register_test("Corridas arriba y abajo", lambda: RunsUpDownTest())
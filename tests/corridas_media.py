@@ -0,0 +1,85 @@
+"""
+Prueba de corridas arriba y abajo de la media (independencia).
+
+Pasos:
+1) Cada r_i se clasifica: 1 si r_i > 0.5 (arriba de la media), 0 si no.
+2) n1 = cantidad de 1, n2 = cantidad de 0 (n = n1 + n2),
+   b = cantidad de corridas (rachas máximas de símbolos iguales).
+3) Bajo H0 (independencia):
+      μ_b  = 2 n1 n2 / n + 1/2
+      σ²_b = 2 n1 n2 (2 n1 n2 - n) / (n² (n - 1))
+4) Z = (b - μ_b) / σ_b ; acepta H0 si |Z| ≤ z_{1-α/2}.
+   p-value bilateral: 2 * sf(|Z|).
+
+Streaming: el acumulador guarda n1, n, las corridas y el último símbolo;
+cada tramo es O(tramo) (comparación y conteo de cambios de símbolo).
+
+Validaciones:
+- Advertencia si n1 o n2 < 20 (la aproximación normal no es fiable).
+- Si todos los valores quedan del mismo lado, σ_b = 0 y no pasa.
+"""
+from typing import List, Optional
+import numpy as np
+
+from tests.base import StreamingTest
+from tests.quantiles import normal_ppf, normal_sf
+from tests.result import TestResult
+from core.registry import Registry
+
+
+class RunsMeanAccumulator:
+    def __init__(self):
+        self.n = 0
+        self.n1 = 0                              # arriba de la media
+        self.runs = 0
+        self.last_above: Optional[bool] = None
+
+    def update(self, u: np.ndarray) -> None:
+        if u.shape[0] == 0:
+            return
+        above = u > 0.5
+        self.n += u.shape[0]
+        self.n1 += int(np.count_nonzero(above))
+        self.runs += int(np.count_nonzero(above[1:] != above[:-1]))
+        if self.last_above is None or bool(above[0]) != self.last_above:
+            self.runs += 1
+        self.last_above = bool(above[-1])
+
+
+class RunsAboveBelowMeanTest(StreamingTest):
+    def accumulator(self, **kwargs) -> RunsMeanAccumulator:
+        return RunsMeanAccumulator()
+
+    def run_accumulator(self, acc: RunsMeanAccumulator, **kwargs) -> TestResult:
+        alpha: float = float(kwargs.get("alpha", 0.05))
+        n, n1, b = acc.n, acc.n1, acc.runs
+        n2 = n - n1
+
+        warnings: List[str] = []
+        if min(n1, n2) < 20:
+            warnings.append("n1 o n2 < 20: la aproximación normal de las corridas puede no ser fiable.")
+
+        prod = 2.0 * n1 * n2
+        mu = prod / n + 0.5 if n > 0 else float("nan")
+        var = prod * (prod - n) / (n * n * (n - 1.0)) if n > 1 else float("nan")
+        Z = (b - mu) / np.sqrt(var) if var > 0 else float("nan")
+        if not var > 0:
+            warnings.append("Todos los valores quedan del mismo lado de la media (σ_b = 0).")
+        zcrit = normal_ppf(1.0 - alpha / 2.0)
+        pval = 2.0 * normal_sf(abs(Z)) if np.isfinite(Z) else float("nan")
+        accept = abs(Z) <= zcrit if np.isfinite(Z) else False
+
+        return TestResult("Corridas arriba y abajo de la media", alpha, n, pval, accept, fields={
+            "n1_above": n1,
+            "n2_below": n2,
+            "runs": b,
+            "mu_runs": mu,
+            "var_runs": var,
+            "Z": float(Z),
+            "z_crit_(1-alpha/2)": zcrit,
+            "conclusion": ("Pasa la prueba de corridas respecto a la media a nivel α" if accept
+                           else "No pasa la prueba de corridas respecto a la media a nivel α"),
+        }, warnings=warnings)
+
+# Registrar en el catálogo de pruebas
+Registry.register_test("Corridas arriba y abajo de la media", lambda: RunsAboveBelowMeanTest())
@@ -0,0 +1,108 @@
+"""
+Prueba de huecos (independencia).
+
+Parámetros: intervalo [a, b) con 0 <= a < b <= 1 (kwarg `gap_interval`,
+por defecto GAP_INTERVAL; b = 1 incluye al 1), θ = b - a.
+
+Pasos:
+1) Se marcan los r_i que caen en [a, b).
+2) Hueco = cantidad de valores entre dos marcas consecutivas (0, 1, 2, ...).
+   El tramo antes de la primera marca y después de la última no cuentan.
+3) Bajo H0: P(hueco = i) = θ (1 - θ)^i ;  P(hueco >= t) = (1 - θ)^t.
+4) Categorías 0, 1, ..., t-1 y ">= t", con t el mayor que deja E_i >= 5
+   en todas (t >= 1); E_i = h P_i con h = cantidad de huecos.
+5) χ² = Σ (O_i - E_i)² / E_i con df = t; acepta H0 si χ² ≤ χ²_{1-α, df}.
+
+Streaming: el acumulador guarda el hueco en curso al final de cada tramo
+(valores desde la última marca) y un bincount de las longitudes de hueco
+(crece con el hueco más largo visto, que es O(log n / θ)). Cada tramo es
+O(tramo): np.flatnonzero de las marcas y np.diff de sus posiciones.
+"""
+from typing import Any, Dict, List, Optional, Tuple
+import numpy as np
+
+from tests.base import StreamingTest, chi2_categories
+from tests.result import BinTable, TestResult
+from core.registry import Registry
+
+GAP_INTERVAL = (0.0, 0.5)
+
+
+def gap_interval(kwargs: Dict[str, Any]) -> Tuple[float, float]:
+    a, b = kwargs.get("gap_interval") or GAP_INTERVAL
+    a, b = float(a), float(b)
+    if not 0.0 <= a < b <= 1.0:
+        raise ValueError(f"El intervalo de huecos debe cumplir 0 <= a < b <= 1. Recibido [{a}, {b}).")
+    return a, b
+
+
+class GapAccumulator:
+    def __init__(self, a: float, b: float):
+        self.a, self.b = a, b
+        self.n = 0
+        self.hits = 0
+        self.current: Optional[int] = None      # valores desde la última marca (None: sin marcas)
+        self.counts = np.zeros(0, dtype=np.int64)
+
+    def update(self, u: np.ndarray) -> None:
+        k = u.shape[0]
+        if k == 0:
+            return
+        inside = (u >= self.a) & ((u < self.b) if self.b < 1.0 else (u <= 1.0))
+        pos = np.flatnonzero(inside)
+        self.n += k
+        if pos.shape[0] == 0:
+            if self.current is not None:
+                self.current += k
+            return
+        self.hits += pos.shape[0]
+        gaps = np.diff(pos) - 1
+        if self.current is not None:
+            gaps = np.concatenate(([self.current + pos[0]], gaps))
+        if gaps.shape[0]:
+            found = np.bincount(gaps)
+            if found.shape[0] > self.counts.shape[0]:
+                self.counts = np.concatenate([self.counts,
+                                              np.zeros(found.shape[0] - self.counts.shape[0], dtype=np.int64)])
+            self.counts[:found.shape[0]] += found
+        self.current = k - 1 - int(pos[-1])
+
+
+class GapTest(StreamingTest):
+    def accumulator(self, **kwargs) -> GapAccumulator:
+        return GapAccumulator(*gap_interval(kwargs))
+
+    def run_accumulator(self, acc: GapAccumulator, **kwargs) -> TestResult:
+        alpha: float = float(kwargs.get("alpha", 0.05))
+        theta = acc.b - acc.a
+        h = int(acc.counts.sum())
+
+        warnings: List[str] = []
+        # Mayor t con E >= 5 en la última categoría individual y en la cola
+        t = 1
+        while h * theta * (1.0 - theta) ** t >= 5.0 and h * (1.0 - theta) ** (t + 1) >= 5.0:
+            t += 1
+        probs = np.append(theta * (1.0 - theta) ** np.arange(t), (1.0 - theta) ** t)
+        O = np.zeros(t + 1, dtype=np.int64)
+        head = acc.counts[:t]
+        O[:head.shape[0]] = head
+        O[t] = acc.counts[t:].sum()
+        E = h * probs
+        if h < 10 or np.any(E < 5):
+            warnings.append("Pocos huecos: alguna categoría tiene E_i < 5; los resultados pueden ser inexactos.")
+        chi = chi2_categories(O, E, alpha)
+
+        labels = [str(i) for i in range(t)] + [f">= {t}"]
+
+        return TestResult("Huecos", alpha, acc.n, chi["p_value"], chi["passed"] and h > 0, fields={
+            "interval": [acc.a, acc.b],
+            "theta": theta,
+            "gaps": h,
+            "df": chi["df"],
+            "chi2_stat": chi["chi2_stat"],
+            "chi2_crit_(1-alpha,df)": chi["chi2_crit_(1-alpha,df)"],
+            "decision": ("No se rechaza H0 (pasa huecos)" if chi["passed"] else "Se rechaza H0 (no pasa huecos)"),
+        }, table=BinTable("gap", O, E, chi["terms"], categories=labels), warnings=warnings)
+
+# Registrar en el catálogo de pruebas
+Registry.register_test("Huecos", lambda: GapTest())
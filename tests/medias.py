@@ -7,7 +7,14 @@ Decisión (bilateral, nivel α):
   Aceptar H0 si |Z| ≤ z_{1-α/2}
 
 También se reporta p-value bilateral:
-  p = 2 * (1 - Φ(|Z|))
+  p = 2 * (1 - Φ(|Z|)) = 2 * sf(|Z|)
+Críticos y colas vienen de tests.quantiles (memoizados, sin SciPy).
+
+Admite secuencias float64/float32 o el estado crudo uint32/uint64 con
+scale (ver tests.base.unit_chunks). `run_stats` calcula lo mismo desde un
+tests.accumulator.SufficientStats (secuencias en streaming o por procesos).
+`run_batch` evalúa una matriz (una secuencia por fila) con reducciones por
+eje y devuelve columnas (Z, p_value, passed... un valor por fila).
 
 Validaciones:
 - Advertencia si n<10.
@@ -15,49 +22,74 @@ Validaciones:
 """
 from typing import Dict, Any, List
 import numpy as np
-from scipy.stats import norm
 
+from tests.accumulator import BatchStats, SufficientStats
 from tests.base import RandomnessTest
+from tests.result import TestResult
+from tests.quantiles import normal_ppf, normal_sf, normal_sf_array
 from core.registry import Registry
 
 class MeanZTest(RandomnessTest):
-    def run(self, sequence: np.ndarray, **kwargs) -> Dict[str, Any]:
+    def run(self, sequence: np.ndarray, **kwargs) -> TestResult:
+        return self.run_stats(SufficientStats.from_sequence(sequence, scale=kwargs.get("scale")), **kwargs)
+
+    def run_stats(self, stats: SufficientStats, **kwargs) -> TestResult:
         alpha: float = float(kwargs.get("alpha", 0.05))
-        u = np.asarray(sequence, dtype=float)
+        n = stats.n
+        ubar = stats.mean if n > 0 else float("nan")
 
-        n = u.size
         warnings: List[str] = []
         if n < 10:
             warnings.append("n<10: la prueba de medias puede no ser fiable (muestra pequeña).")
 
-        if not np.all((u > 0.0) & (u < 1.0)):
+        if stats.outside_open:
             warnings.append("Se detectaron valores fuera de (0,1); la hipótesis Uniforme[0,1] queda comprometida.")
 
-        ubar = float(np.mean(u)) if n > 0 else float("nan")
         # Z = sqrt(12 n) * ( ū - 0.5 )
         Z = float(np.sqrt(12.0 * n) * (ubar - 0.5)) if n > 0 else float("nan")
 
         # Crítico bilateral
-        zcrit = float(norm.ppf(1.0 - alpha / 2.0))
+        zcrit = normal_ppf(1.0 - alpha / 2.0)
         # p-value bilateral
-        pval = float(2.0 * (1.0 - norm.cdf(abs(Z)))) if np.isfinite(Z) else float("nan")
+        pval = 2.0 * normal_sf(abs(Z)) if np.isfinite(Z) else float("nan")
         accept = abs(Z) <= zcrit if np.isfinite(Z) else False
 
-        result: Dict[str, Any] = {
+        return TestResult("Medias Z (Uniforme[0,1])", alpha, n, pval, accept, fields={
+            "mean": ubar,
+            "Z": Z,
+            "z_crit_(1-alpha/2)": zcrit,
+            "conclusion": ("Pasa la prueba de medias a nivel α" if accept else "No pasa la prueba de medias a nivel α"),
+        }, warnings=warnings)
+
+    def run_batch(self, matrix: np.ndarray, **kwargs) -> Dict[str, Any]:
+        alpha: float = float(kwargs.get("alpha", 0.05))
+        stats = BatchStats.from_matrix(matrix, scale=kwargs.get("scale"))
+        n = stats.n
+
+        warnings: List[str] = []
+        if n < 10:
+            warnings.append("n<10: la prueba de medias puede no ser fiable (muestra pequeña).")
+        outside = stats.outside_open
+
+        Z = np.sqrt(12.0 * n) * (stats.mean - 0.5) if n > 0 else np.full(stats.rows, np.nan)
+        zcrit = normal_ppf(1.0 - alpha / 2.0)
+        pval = 2.0 * normal_sf_array(np.abs(Z))
+        accept = np.abs(Z) <= zcrit            # NaN -> False
+
+        return {
             "test": "Medias Z (Uniforme[0,1])",
+            "rows": stats.rows,
             "alpha": alpha,
             "n": n,
-            "mean": ubar,
+            "mean": stats.mean,
             "Z": Z,
             "z_crit_(1-alpha/2)": zcrit,
             "p_value": pval,
-            "conclusion": ("Pasa la prueba de medias a nivel α" if accept else "No pasa la prueba de medias a nivel α"),
-            "status": "ok",
+            "passed": accept,
+            "outside_(0,1)": outside,
+            "status": np.where((outside > 0) | bool(warnings), "warning", "ok"),
+            "warnings": warnings,
         }
-        if warnings:
-            result["warnings"] = warnings
-            result["status"] = "warning"
-        return result
 
 # Registrar en el catálogo de pruebas (nombre correcto: Prueba de medias)
 Registry.register_test("Medias Z (Uniforme[0,1])", lambda: MeanZTest())
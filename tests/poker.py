@@ -0,0 +1,219 @@
+"""
+Prueba de póker sobre los D dígitos del estado (independencia).
+
+Cada r_i se toma como la "mano" de sus D dígitos decimales X = floor(r_i 10^D)
+(en los generadores de dígitos medios, el estado X_i de D dígitos). La
+categoría de la mano es el patrón de repeticiones de sus dígitos (una
+partición de D). Para D = 5 son las clásicas:
+    todos diferentes 1+1+1+1+1, un par 2+1+1+1, dos pares 2+2+1,
+    tercia 3+1+1, full 3+2, póker 4+1, quintilla 5
+Bajo H0 (dígitos independientes y uniformes) la probabilidad del patrón λ
+con k partes y m_j partes iguales a j es
+    P(λ) = 10!/(10-k)! * D! / (Π λ_i! * Π m_j!) / 10^D
+Pasos:
+1) O_i = manos con el patrón i; E_i = n P_i (patrones de mayor a menor P).
+2) Los patrones finales (menos probables) se juntan hasta E_i >= 5.
+3) χ² = Σ (O_i - E_i)² / E_i con df = categorías - 1; acepta H0 si
+   χ² ≤ χ²_{1-α, df}.
+
+D: kwarg `digits`; si no se da, el menor d <= POKER_MAX_DIGITS tal que los
+primeros valores son múltiplos exactos de 10^-d (secuencias de estados de
+D dígitos), o POKER_DEFAULT_DIGITS (5, la prueba clásica) si ninguno.
+Con el estado crudo entero (scale = 10^D) se usan los enteros directamente.
+
+Vectorizado y por tramos: los dígitos de cada tramo salen de D divisiones
+(una por posición, sobre todo el tramo), las repeticiones de D(D-1)/2
+comparaciones entre posiciones (uint8) y el patrón de la clave
+Σ_posiciones (D+1)^repeticiones, que no depende del orden de los dígitos;
+el acumulador solo suma conteos por patrón (bincount).
+"""
+from functools import lru_cache
+from math import factorial
+from typing import Any, List, Optional, Tuple
+import numpy as np
+
+from tests.base import CHUNK_SIZE, StreamingTest, chi2_categories, merge_tail
+from tests.result import BinTable, TestResult
+from core.registry import Registry
+
+POKER_DEFAULT_DIGITS = 5
+POKER_MAX_DIGITS = 12
+
+# Nombres clásicos (D = 5)
+POKER_NAMES = {
+    (1, 1, 1, 1, 1): "Todos diferentes",
+    (2, 1, 1, 1): "Un par",
+    (2, 2, 1): "Dos pares",
+    (3, 1, 1): "Tercia",
+    (3, 2): "Full",
+    (4, 1): "Póker",
+    (5,): "Quintilla",
+}
+
+
+def _partitions(D: int, largest: Optional[int] = None) -> List[Tuple[int, ...]]:
+    largest = D if largest is None else largest
+    if D == 0:
+        return [()]
+    out = []
+    for first in range(min(D, largest), 0, -1):
+        out.extend((first,) + rest for rest in _partitions(D - first, first))
+    return out
+
+
+def _pattern_key(parts: Tuple[int, ...], D: int) -> int:
+    """Clave del patrón: Σ_partes c (D+1)^c (ver PokerAccumulator.update_states)."""
+    return sum(c * (D + 1) ** c for c in parts)
+
+
+@lru_cache(maxsize=None)
+def poker_patterns(D: int) -> Tuple[Tuple[Tuple[int, ...], ...], np.ndarray, np.ndarray]:
+    """
+    (patrones, probabilidades, claves) con los patrones posibles (a lo
+    sumo 10 partes) de mayor a menor probabilidad.
+    """
+    pats, probs = [], []
+    for lam in _partitions(D):
+        k = len(lam)
+        if k > 10:
+            continue
+        ways = factorial(10) // factorial(10 - k) * factorial(D)
+        den = 1
+        for part in lam:
+            den *= factorial(part)
+        for j in set(lam):
+            den *= factorial(lam.count(j))
+        pats.append(lam)
+        probs.append(ways / den / 10 ** D)
+    order = sorted(range(len(pats)), key=lambda i: -probs[i])
+    pats = tuple(pats[i] for i in order)
+    probs = np.array([probs[i] for i in order])
+    keys = np.array([_pattern_key(lam, D) for lam in pats], dtype=np.int64)
+    return pats, probs, keys
+
+
+def _power_of_ten(scale: Optional[int]) -> Optional[int]:
+    """D si scale = 10^D, si no None."""
+    if scale is None:
+        return None
+    text = str(int(scale))
+    return len(text) - 1 if text.rstrip("0") == "1" else None
+
+
+def digit_tolerance(D: int) -> float:
+    """Holgura para leer X = floor(r 10^D) cuando r = X / 10^D se redondeó."""
+    return 1e-9 + 10.0 ** D * 2.0 ** -48
+
+
+def infer_digits(u: np.ndarray, sample: int = 4096) -> Optional[int]:
+    """Menor d tal que los primeros valores son múltiplos de 10^-d (o None)."""
+    v = np.asarray(u[:sample], dtype=float)
+    for d in range(1, POKER_MAX_DIGITS + 1):
+        t = v * 10.0 ** d
+        if np.all(np.abs(t - np.rint(t)) <= digit_tolerance(d)):
+            return d
+    return None
+
+
+class PokerAccumulator:
+    def __init__(self, digits: Optional[int] = None):
+        self.D = digits
+        self.n = 0
+        self.counts: Optional[np.ndarray] = None
+
+    def _start(self, u: Optional[np.ndarray]) -> None:
+        if self.D is None:
+            inferred = infer_digits(u) if u is not None else None
+            self.D = max(2, inferred or POKER_DEFAULT_DIGITS)
+        if not 2 <= self.D <= POKER_MAX_DIGITS:
+            raise ValueError(f"La prueba de póker requiere 2 <= D <= {POKER_MAX_DIGITS}. Recibido D={self.D}.")
+        self.counts = np.zeros(len(poker_patterns(self.D)[0]), dtype=np.int64)
+
+    def update(self, u: np.ndarray) -> None:
+        """Tramo de r en [0,1]."""
+        if u.shape[0] == 0:
+            return
+        if self.counts is None:
+            self._start(u)
+        x = np.floor(u * 10.0 ** self.D + digit_tolerance(self.D))
+        np.clip(x, 0, 10 ** self.D - 1, out=x)
+        self.update_states(x)
+
+    def update_states(self, x: np.ndarray) -> None:
+        """Tramo de estados X de D dígitos (enteros, o float con valor entero)."""
+        if self.counts is None:
+            self._start(None)
+        D, h = self.D, x.shape[0]
+        if h == 0:
+            return
+        # Dígitos de derecha a izquierda (float64 es exacto con D <= POKER_MAX_DIGITS)
+        t = np.asarray(x, dtype=np.float64)
+        digits = np.empty((D, h), dtype=np.uint8)
+        for j in range(D):
+            q = np.floor(t / 10.0)
+            digits[j] = t - 10.0 * q
+            t = q
+        # mult[j] = veces que aparece el dígito de la posición j en la mano
+        mult = np.ones((D, h), dtype=np.uint8)
+        for i in range(D):
+            for j in range(i + 1, D):
+                eq = digits[i] == digits[j]
+                mult[i] += eq
+                mult[j] += eq
+        # Σ_j (D+1)^mult[j] = Σ_partes c (D+1)^c: cada coeficiente es <= D, la clave es única
+        key = ((D + 1) ** np.arange(D + 1, dtype=np.int64))[mult].sum(axis=0)
+        _, _, keys = poker_patterns(D)
+        order = np.argsort(keys)
+        pos = order[np.searchsorted(keys[order], key)]
+        self.counts += np.bincount(pos, minlength=self.counts.shape[0])
+        self.n += h
+
+
+class PokerTest(StreamingTest):
+    def accumulator(self, **kwargs) -> PokerAccumulator:
+        digits = kwargs.get("digits")
+        return PokerAccumulator(int(digits) if digits is not None else None)
+
+    def feed(self, acc: PokerAccumulator, chunk: Any, scale: Optional[int] = None) -> None:
+        x = np.asarray(chunk)
+        D = _power_of_ten(scale) if x.dtype.kind in "ui" else None
+        # Estado crudo con scale = 10^D: los enteros ya son las manos
+        if D is not None and acc.D in (None, D):
+            acc.D = D
+            for lo in range(0, x.shape[0], CHUNK_SIZE):
+                acc.update_states(x[lo:lo + CHUNK_SIZE].astype(np.int64))
+            return
+        super().feed(acc, x, scale)
+
+    def run_accumulator(self, acc: PokerAccumulator, **kwargs) -> TestResult:
+        alpha: float = float(kwargs.get("alpha", 0.05))
+        n = acc.n
+        D = acc.D if acc.D is not None else POKER_DEFAULT_DIGITS
+        pats, probs, _ = poker_patterns(D)
+        counts = acc.counts if acc.counts is not None else np.zeros(len(pats), dtype=np.int64)
+
+        warnings: List[str] = []
+        O, p, merged = merge_tail(counts, probs, n)
+        if O.shape[0] < 2:
+            warnings.append("Muy pocas manos para formar dos categorías con E_i >= 5.")
+        E = n * p
+        chi = chi2_categories(O, E, alpha)
+        if n > 0 and np.any(E < 5):
+            warnings.append("Alguna categoría tiene E_i < 5; los resultados pueden ser inexactos.")
+
+        labels = [POKER_NAMES.get(lam, "+".join(map(str, lam))) if D == 5 else "+".join(map(str, lam))
+                  for lam in pats]
+        if merged > 1:
+            labels = labels[:-merged] + [" / ".join(labels[-merged:])]
+
+        passed = chi["passed"] and O.shape[0] >= 2
+        return TestResult("Póker", alpha, n, chi["p_value"], passed, fields={
+            "digits": D,
+            "df": chi["df"],
+            "chi2_stat": chi["chi2_stat"],
+            "chi2_crit_(1-alpha,df)": chi["chi2_crit_(1-alpha,df)"],
+            "decision": ("No se rechaza H0 (pasa póker)" if chi["passed"] else "Se rechaza H0 (no pasa póker)"),
+        }, table=BinTable("category", O, E, chi["terms"], categories=labels), warnings=warnings)
+
+# Registrar en el catálogo de pruebas
+Registry.register_test("Póker", lambda: PokerTest())
@@ -0,0 +1,270 @@
+"""
+Resultados de las pruebas: objetos con __slots__ y columnas NumPy.
+
+TestResult guarda en slots los campos comunes (test, alpha, n, p_value,
+passed, warnings), en `fields` los propios de cada prueba (chi2_stat, df,
+decision, ...) y, si la prueba tiene tabla por categoría, un BinTable con
+arreglos O_i / E_i / term. Las etiquetas de la tabla ("[0.1000, 0.2000)",
+nombres de mano, huecos) se generan solo cuando alguien las pide.
+
+Compatibilidad: TestResult es un Mapping de solo lectura con las mismas
+claves que el dict de antes (result["passed"], result.get("warnings"),
+dict(result), record.update(result)); "table" se arma como lista de dicts
+al pedirla. `to_dict()` devuelve ese dict completo.
+
+Serialización (una línea / un registro por resultado):
+- JSON-lines: `to_json_dict()` con la tabla en columnas (listas O_i, E_i,
+  term y los bordes o categorías, sin etiquetas ni un dict por fila);
+  `to_json_line()` / `TestResult.from_json_line()`; write_jsonl / read_jsonl.
+- Binario: `to_bytes()` / `TestResult.from_bytes()` = MAGIC + largo del
+  encabezado (uint32) + encabezado JSON (escalares y dtype/shape de cada
+  columna) + bytes crudos de las columnas. write_binary / read_binary
+  prefijan cada registro con su largo (uint64).
+"""
+from collections.abc import Mapping
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, Sequence, Union
+import json
+import struct
+import numpy as np
+
+MAGIC = b"PRNGRES1"
+# Columnas numéricas de BinTable (nombre en la tabla -> atributo)
+TABLE_COLUMNS = {"O_i": "O", "E_i": "E", "term": "terms"}
+# Textos de la decisión: van después de p_value (mismo orden que el dict de antes)
+VERDICT_KEYS = ("decision", "conclusion")
+
+
+def plain(value: Any) -> Any:
+    """Escalares y arreglos NumPy a tipos de Python (para JSON)."""
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, (list, tuple)):
+        return [plain(v) for v in value]
+    return value
+
+
+class BinTable:
+    """
+    Tabla por categoría en columnas. Las etiquetas salen de `edges`
+    (intervalos [a_i, b_i), el último cerrado) o de `categories`.
+    """
+    __slots__ = ("label_key", "O", "E", "terms", "edges", "categories")
+
+    def __init__(self, label_key: str, O: np.ndarray, E: Union[float, np.ndarray], terms: np.ndarray,
+                 edges: Optional[np.ndarray] = None, categories: Optional[Sequence[str]] = None):
+        if (edges is None) == (categories is None):
+            raise ValueError("BinTable requiere edges o categories (uno de los dos).")
+        self.label_key = label_key
+        self.O = np.asarray(O, dtype=np.int64)
+        self.E = np.broadcast_to(np.asarray(E, dtype=float), self.O.shape)
+        self.terms = np.asarray(terms, dtype=float)
+        self.edges = None if edges is None else np.asarray(edges, dtype=float)
+        self.categories = None if categories is None else list(categories)
+
+    def __len__(self) -> int:
+        return self.O.shape[0]
+
+    def label(self, i: int) -> str:
+        if self.categories is not None:
+            return self.categories[i]
+        # formato de intervalo: [a,b) excepto el último [a,b]; 4 decimales o los que pida m
+        m = len(self)
+        places = max(4, len(str(m)))
+        return f"[{self.edges[i]:.{places}f}, {self.edges[i + 1]:.{places}f}{']' if i == m - 1 else ')'}"
+
+    def rows(self, lo: int = 0, hi: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Filas [lo, hi) como dicts (etiqueta, O_i, E_i, term)."""
+        hi = len(self) if hi is None else min(hi, len(self))
+        return [{self.label_key: self.label(i), "O_i": int(self.O[i]),
+                 "E_i": float(self.E[i]), "term": float(self.terms[i])} for i in range(lo, hi)]
+
+    def to_list(self) -> List[Dict[str, Any]]:
+        return self.rows()
+
+    def columns(self) -> Dict[str, np.ndarray]:
+        cols = {name: getattr(self, attr) for name, attr in TABLE_COLUMNS.items()}
+        if self.edges is not None:
+            cols["edges"] = self.edges
+        return cols
+
+    def to_json_dict(self) -> Dict[str, Any]:
+        out: Dict[str, Any] = {"label_key": self.label_key}
+        out.update({name: col.tolist() for name, col in self.columns().items()})
+        if self.categories is not None:
+            out["categories"] = self.categories
+        return out
+
+    @classmethod
+    def from_columns(cls, meta: Dict[str, Any], cols: Dict[str, Any]) -> "BinTable":
+        return cls(meta["label_key"], cols["O_i"], cols["E_i"], cols["term"],
+                   edges=cols.get("edges"), categories=meta.get("categories"))
+
+
+class TestResult(Mapping):
+    """Resultado de una prueba (ver docstring del módulo)."""
+    __slots__ = ("test", "alpha", "n", "p_value", "passed", "warnings", "fields", "table")
+
+    def __init__(self, test: str, alpha: float, n: int, p_value: float, passed: bool,
+                 fields: Optional[Dict[str, Any]] = None, table: Optional[BinTable] = None,
+                 warnings: Optional[List[str]] = None):
+        self.test = test
+        self.alpha = float(alpha)
+        self.n = int(n)
+        self.p_value = float(p_value)
+        self.passed = bool(passed)
+        self.fields = fields if fields is not None else {}
+        self.table = table
+        self.warnings = list(warnings) if warnings else []
+
+    @property
+    def status(self) -> str:
+        return "warning" if self.warnings else "ok"
+
+    # ----------------- Mapping (compatibilidad con el dict) -----------------
+
+    def _keys(self) -> Iterator[str]:
+        yield from ("test", "alpha", "n")
+        yield from (key for key in self.fields if key not in VERDICT_KEYS)
+        yield "p_value"
+        yield from (key for key in VERDICT_KEYS if key in self.fields)
+        yield "passed"
+        if self.table is not None:
+            yield "table"
+        yield "status"
+        if self.warnings:
+            yield "warnings"
+
+    def __iter__(self) -> Iterator[str]:
+        return self._keys()
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self._keys())
+
+    def __getitem__(self, key: str) -> Any:
+        if key in ("test", "alpha", "n", "p_value", "passed", "status"):
+            return getattr(self, key)
+        if key == "table" and self.table is not None:
+            return self.table.to_list()
+        if key == "warnings" and self.warnings:
+            return self.warnings
+        if key in self.fields:
+            return self.fields[key]
+        raise KeyError(key)
+
+    def __repr__(self) -> str:
+        return f"TestResult(test={self.test!r}, n={self.n}, p_value={self.p_value:.4g}, passed={self.passed})"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Dict completo (con la tabla como lista de dicts), igual al formato anterior."""
+        return {key: self[key] for key in self._keys()}
+
+    # ----------------- JSON-lines -----------------
+
+    def to_json_dict(self) -> Dict[str, Any]:
+        """Dict apto para JSON con la tabla en columnas."""
+        out: Dict[str, Any] = {}
+        for key in self._keys():
+            if key == "table":
+                out[key] = self.table.to_json_dict()
+            elif key in self.fields:
+                out[key] = plain(self.fields[key])
+            else:
+                out[key] = self[key]
+        return out
+
+    def to_json_line(self) -> str:
+        return json.dumps(self.to_json_dict(), ensure_ascii=False, separators=(",", ":"))
+
+    @classmethod
+    def from_json_dict(cls, data: Dict[str, Any]) -> "TestResult":
+        data = dict(data)
+        table = data.pop("table", None)
+        data.pop("status", None)
+        common = {key: data.pop(key) for key in ("test", "alpha", "n", "p_value", "passed")}
+        warnings = data.pop("warnings", None)
+        return cls(**common, fields=data, warnings=warnings,
+                   table=BinTable.from_columns(table, table) if table is not None else None)
+
+    @classmethod
+    def from_json_line(cls, line: str) -> "TestResult":
+        return cls.from_json_dict(json.loads(line))
+
+    # ----------------- Binario -----------------
+
+    def to_bytes(self) -> bytes:
+        header = self.to_json_dict()
+        arrays: List[np.ndarray] = []
+        if self.table is not None:
+            specs = []
+            for name, col in self.table.columns().items():
+                col = np.ascontiguousarray(col)
+                specs.append([name, col.dtype.str, list(col.shape)])
+                arrays.append(col)
+            header["table"] = {"label_key": self.table.label_key, "columns": specs}
+            if self.table.categories is not None:
+                header["table"]["categories"] = self.table.categories
+        head = json.dumps(header, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        return b"".join([MAGIC, struct.pack("<I", len(head)), head] + [a.tobytes() for a in arrays])
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "TestResult":
+        if data[:len(MAGIC)] != MAGIC:
+            raise ValueError("No es un resultado binario (encabezado desconocido).")
+        pos = len(MAGIC)
+        (size,) = struct.unpack_from("<I", data, pos)
+        pos += 4
+        header = json.loads(data[pos:pos + size].decode("utf-8"))
+        pos += size
+        meta = header.pop("table", None)
+        result = cls.from_json_dict(header)
+        if meta is not None:
+            cols: Dict[str, np.ndarray] = {}
+            for name, dtype, shape in meta["columns"]:
+                dt = np.dtype(dtype)
+                count = int(np.prod(shape))
+                cols[name] = np.frombuffer(data, dtype=dt, count=count, offset=pos).reshape(shape)
+                pos += count * dt.itemsize
+            result.table = BinTable.from_columns(meta, cols)
+        return result
+
+
+def result_dict(result: Mapping, columnar: bool = True) -> Dict[str, Any]:
+    """Dict de un resultado (TestResult o dict de una prueba externa)."""
+    if isinstance(result, TestResult):
+        return result.to_json_dict() if columnar else result.to_dict()
+    return dict(result)
+
+
+def write_jsonl(results: Iterable[TestResult], fh: IO[str]) -> int:
+    count = 0
+    for result in results:
+        fh.write(result.to_json_line() + "\n")
+        count += 1
+    return count
+
+
+def read_jsonl(fh: IO[str]) -> Iterator[TestResult]:
+    for line in fh:
+        if line.strip():
+            yield TestResult.from_json_line(line)
+
+
+def write_binary(results: Iterable[TestResult], fh: IO[bytes]) -> int:
+    count = 0
+    for result in results:
+        data = result.to_bytes()
+        fh.write(struct.pack("<Q", len(data)))
+        fh.write(data)
+        count += 1
+    return count
+
+
+def read_binary(fh: IO[bytes]) -> Iterator[TestResult]:
+    while True:
+        prefix = fh.read(8)
+        if not prefix:
+            return
+        (size,) = struct.unpack("<Q", prefix)
+        yield TestResult.from_bytes(fh.read(size))
@@ -0,0 +1,226 @@
+"""
+Prueba serial χ² en d dimensiones (uniformidad de d-tuplas).
+
+Extiende UniformityChiSquare de intervalos a celdas: cada d-tupla
+(r_t, ..., r_{t+d-1}) cae en una de m^d celdas (m intervalos por eje,
+los mismos de la prueba de uniformidad).
+
+Entrada (kwargs):
+- d: dimensión, 2..5 (por defecto 2).
+- m: intervalos por eje (como en UniformityChiSquare; por defecto el
+     mayor con E = N/m^d >= 5). Si N/m^d < 5 se reduce m y se advierte.
+- serial_m: m por eje sin ajuste (grillas grandes y ralas, p.ej. m = 100
+     con d = 4); si E < 5 solo se advierte.
+- overlapping: False (por defecto) toma tuplas disjuntas
+     (r_1..r_d), (r_{d+1}..r_{2d}), ... (N = n // d);
+     True toma las n tuplas solapadas y circulares (t = 1..n, índices mod n).
+- alpha, scale: como en las demás pruebas.
+
+Estadístico (E = N / m^d):
+- Disjuntas:  χ² = Σ_celdas (O - E)² / E, df = m^d - 1.
+- Solapadas:  las tuplas no son independientes; se usa la diferencia de
+  Good  Δψ² = ψ²_d - ψ²_{d-1}  (ψ²_k: el χ² de las k-tuplas circulares),
+  que sigue χ² con df = m^d - m^{d-1}.
+Las celdas vacías no se guardan: con k celdas ocupadas,
+    Σ_celdas (O - E)²/E = Σ_ocupadas (O - E)²/E + (m^d - k) E
+y el segundo término (celdas vacías) es analítico.
+
+Conteo: cada tupla se codifica como un entero (id de celda
+Σ_j i_j m^(d-1-j), con i_j el intervalo de la coordenada j, mismos bordes
+que np.histogram). Si la grilla es chica (m^d <= DENSE_MAX_CELLS y a lo
+sumo DENSE_CELLS_PER_VALUE * N) se cuenta con bincount; si no, con
+np.unique por tramo y los pares (id, conteo) se combinan: la memoria es
+O(N), no O(m^d) (con m = 100 y d = 4 son 10^8 celdas).
+"""
+from typing import List, Optional, Tuple
+import numpy as np
+
+from tests.accumulator import bin_index
+from tests.base import RandomnessTest, unit_chunks
+from tests.quantiles import chi2_ppf, chi2_sf
+from tests.uniformidad_chi2 import UniformityChiSquare
+from tests.result import TestResult
+from core.registry import Registry
+
+SERIAL_DIMS = (2, 3, 4, 5)
+# Conteo denso (bincount) solo con grillas chicas
+DENSE_MAX_CELLS = 1 << 22
+DENSE_CELLS_PER_VALUE = 8
+
+
+def serial_cells(u: np.ndarray, d: int, m: int, edges: np.ndarray, step: int = 1) -> np.ndarray:
+    """Ids de celda de las tuplas u[t:t+d], t = 0, step, 2 step, ... (step = d: disjuntas)."""
+    idx = bin_index(np.clip(u, 0.0, 1.0), m, edges).astype(np.int64)
+    count = (idx.shape[0] - d) // step + 1
+    stop = (count - 1) * step + 1
+    ids = idx[:stop:step].copy()
+    for j in range(1, d):
+        ids *= m
+        ids += idx[j:j + stop:step]
+    return ids
+
+
+class CellCounts:
+    """Conteos por celda: densos (bincount) o dispersos (ids y conteos ordenados)."""
+
+    def __init__(self, cells: int, dense: bool):
+        self.cells = cells
+        self.dense = np.zeros(cells, dtype=np.int64) if dense else None
+        self._ids: List[np.ndarray] = []
+        self._counts: List[np.ndarray] = []
+        self._pending = 0
+
+    def add(self, ids: np.ndarray) -> None:
+        if ids.shape[0] == 0:
+            return
+        if self.dense is not None:
+            self.dense += np.bincount(ids, minlength=self.cells)
+            return
+        uniq, counts = np.unique(ids, return_counts=True)
+        self._ids.append(uniq)
+        self._counts.append(counts)
+        self._pending += uniq.shape[0]
+        # Compactar cuando lo pendiente crece: memoria ~ celdas ocupadas
+        if len(self._ids) > 8:
+            self._compact()
+
+    def _compact(self) -> None:
+        if len(self._ids) <= 1:
+            return
+        ids = np.concatenate(self._ids)
+        counts = np.concatenate(self._counts)
+        uniq, inverse = np.unique(ids, return_inverse=True)
+        self._ids = [uniq]
+        self._counts = [np.bincount(inverse, weights=counts, minlength=uniq.shape[0]).astype(np.int64)]
+        self._pending = uniq.shape[0]
+
+    def occupied(self) -> Tuple[np.ndarray, np.ndarray]:
+        """(ids, conteos) de las celdas con al menos una tupla."""
+        if self.dense is not None:
+            ids = np.flatnonzero(self.dense)
+            return ids, self.dense[ids]
+        self._compact()
+        if not self._ids:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+        return self._ids[0], self._counts[0]
+
+
+def psi2(counts: np.ndarray, cells: int, N: int) -> Tuple[float, float]:
+    """(χ² sobre todas las celdas, término de las celdas vacías) con E = N / cells."""
+    E = N / cells
+    occupied_term = float(np.sum((counts - E) ** 2) / E)
+    empty_term = (cells - counts.shape[0]) * E
+    return occupied_term + empty_term, empty_term
+
+
+class SerialChiSquare(UniformityChiSquare):
+    # No usa el acumulador de intervalos ni la versión por lotes de la uniformidad
+    run_stats = RandomnessTest.run_stats
+    run_batch = RandomnessTest.run_batch
+
+    def stats_bins(self, n: int, **kwargs) -> Optional[int]:
+        return None
+
+    @staticmethod
+    def choose_serial_m(N: int, d: int, m_user: Optional[int]) -> Tuple[int, List[str]]:
+        """m por eje para N tuplas en d dimensiones (y advertencias de los ajustes)."""
+        warnings: List[str] = []
+        m_max = max(2, int(np.floor((max(N, 1) / 5.0) ** (1.0 / d) + 1e-9)))
+        if m_user is None:
+            return m_max, warnings
+        m = int(m_user)
+        if m < 2:
+            warnings.append("m<2 no es válido; se ajusta a m=2.")
+            m = 2
+        if m > m_max and N / m ** d < 5:
+            warnings.append(f"m={m_user} produce E=N/m^{d}<5; se ajusta a m={m_max}.")
+            m = m_max
+        return m, warnings
+
+    def run(self, sequence: np.ndarray, **kwargs) -> TestResult:
+        alpha = float(kwargs.get("alpha", 0.05))
+        d = int(kwargs.get("d", 2))
+        if d not in SERIAL_DIMS:
+            raise ValueError(f"La prueba serial admite d en {SERIAL_DIMS}. Recibido d={d}.")
+        overlapping = bool(kwargs.get("overlapping", False))
+        n = int(np.size(sequence))
+        N = n if overlapping else n // d
+        if kwargs.get("serial_m") is not None:
+            m, warnings = int(kwargs["serial_m"]), []
+            if m < 2:
+                raise ValueError(f"serial_m debe ser >= 2. Recibido serial_m={m}.")
+        else:
+            m, warnings = self.choose_serial_m(N, d, kwargs.get("m", None))
+        if m ** d >= 1 << 62:
+            raise ValueError(f"m^d = {m}^{d} no cabe en un id de celda de 64 bits.")
+        cells = m ** d
+        edges = np.linspace(0.0, 1.0, m + 1)
+        dense = cells <= DENSE_MAX_CELLS and cells <= DENSE_CELLS_PER_VALUE * max(N, 1)
+        counts = CellCounts(cells, dense)
+
+        outside = 0
+        head = np.zeros(0)          # primeros d-1 valores (cierre circular)
+        carry = np.zeros(0)         # valores del tramo anterior que forman tuplas con este
+        for u in unit_chunks(sequence, kwargs.get("scale", None)):
+            outside += int(np.count_nonzero((u < 0.0) | (u > 1.0)))
+            if overlapping and head.shape[0] < d - 1:
+                head = np.concatenate((head, u[:d - 1 - head.shape[0]]))
+            z = np.concatenate((carry, u)) if carry.shape[0] else u
+            if overlapping:
+                if z.shape[0] >= d:
+                    counts.add(serial_cells(z, d, m, edges))
+                carry = z[-(d - 1):].copy() if z.shape[0] >= d - 1 else z.copy()
+            else:
+                usable = z.shape[0] - z.shape[0] % d
+                if usable:
+                    counts.add(serial_cells(z[:usable], d, m, edges, step=d))
+                carry = z[usable:].copy()
+        if overlapping and n >= d:
+            # Tuplas que cruzan el final: (r_{n-d+2}, ..., r_n, r_1, ...)
+            counts.add(serial_cells(np.concatenate((carry, head)), d, m, edges))
+        return self._serial_result(counts, n, N, d, m, overlapping, alpha, warnings, outside)
+
+    def _serial_result(self, counts: CellCounts, n: int, N: int, d: int, m: int, overlapping: bool,
+                       alpha: float, warnings: List[str], outside: int) -> TestResult:
+        cells = m ** d
+        ids, O = counts.occupied()
+        stat, empty_term = psi2(O, cells, N) if N > 0 else (float("nan"), float("nan"))
+        df = cells - 1
+        if overlapping and N > 0:
+            # ψ²_{d-1}: las (d-1)-tuplas circulares son el id sin la última coordenada
+            low_ids, inverse = np.unique(ids // m, return_inverse=True)
+            low_counts = np.bincount(inverse, weights=O, minlength=low_ids.shape[0])
+            low_stat = psi2(low_counts, cells // m, N)[0] if d > 1 else 0.0
+            stat -= low_stat
+            df = cells - cells // m
+
+        E = N / cells if cells else float("nan")
+        if N < 10:
+            warnings.insert(0, "Menos de 10 tuplas: la prueba serial puede no ser fiable.")
+        if N > 0 and E < 5:
+            warnings.append(f"E = N/m^d = {E:.2f} < 5; los resultados pueden ser inexactos.")
+        if outside:
+            warnings.append("Se detectaron valores fuera de [0,1]; se recortan al armar las tuplas.")
+
+        chi2_crit = chi2_ppf(1.0 - alpha, df)
+        accept = bool(stat <= chi2_crit) if np.isfinite(stat) else False
+        p_value = chi2_sf(stat, df) if np.isfinite(stat) else float("nan")
+        return TestResult("Serial χ² (d-tuplas)", alpha, n, p_value, accept, fields={
+            "d": d,
+            "m": m,
+            "overlapping": overlapping,
+            "tuples": N,
+            "cells": cells,
+            "occupied_cells": int(ids.shape[0]),
+            "empty_cells": int(cells - ids.shape[0]),
+            "E": E,
+            "empty_term": empty_term,
+            "counting": "bincount" if counts.dense is not None else "unique",
+            "df": df,
+            "chi2_stat": stat,
+            "chi2_crit_(1-alpha,df)": chi2_crit,
+            "decision": ("No se rechaza H0 (pasa serial)" if accept else "Se rechaza H0 (no pasa serial)"),
+        }, warnings=warnings)
+
+# Registro en catálogo
+Registry.register_test("Serial χ² (d-tuplas)", lambda: SerialChiSquare())
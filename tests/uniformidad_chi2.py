@@ -4,48 +4,108 @@ Prueba de uniformidad (chi-cuadrado) para U(0,1).
 Entrada:
 - sequence: np.ndarray de números en [0,1] (idealmente).
 - alpha: nivel de significancia (default 0.05).
+- scale: divisor si la secuencia es el estado crudo uint32/uint64 (r = X/scale).
 - m: número de clases/intervalos (opcional).
       Si no se indica, m = floor(sqrt(n)).
       Se intenta asegurar E_i = n/m >= 5 ajustando m hacia abajo.
       Si el usuario fija m y n/m<5, se reduce m y se advierte.
 
+La secuencia se recorre por tramos con tests.accumulator.SufficientStats
+(bins = m): las frecuencias O_i se suman tramo a tramo sin convertir todo a
+float64. `run_stats` arma el resultado desde un acumulador ya lleno; ahí m
+es el `bins` con que se acumuló (n no se conoce de antemano).
+`run_batch` evalúa cada fila de una matriz (rows, n): las O_i de todas las
+filas salen de un solo bincount desplazado (tests.accumulator.row_bin_counts)
+y el resultado son columnas (chi2_stat, p_value, passed por fila y la
+matriz de conteos) en lugar de una tabla por fila.
+
 Pasos:
 1) Validar rango [0,1] (advertencia si hay valores fuera).
 2) Construir m intervalos equiprobables: [0,1/m), [1/m,2/m), ..., [(m-1)/m,1]
 3) Calcular O_i (frecuencias observadas) y E_i = n/m.
 4) Estadístico: chi2_stat = sum (O_i - E_i)^2 / E_i
 5) df = m - 1  (no se estiman parámetros).
-6) Crítico: chi2_crit = chi2.ppf(1 - alpha, df)  (cuantil derecho).
-7) p-value: p = 1 - F_{chi2,df}(chi2_stat)
+6) Crítico: chi2_crit = χ²_{1-alpha, df}  (cuantil derecho, tests.quantiles).
+7) p-value: p = sf_{chi2,df}(chi2_stat)  (cola derecha, sin 1 - F).
 8) Decisión: no rechazar H0 si chi2_stat <= chi2_crit.
 
-Devuelve:
-- Tabla por intervalo con: [a_i,b_i], O_i, E_i, contribución.
+Devuelve (tests.result.TestResult):
+- Tabla por intervalo (BinTable) con: [a_i,b_i], O_i, E_i, contribución.
 - n, m, df, alpha, chi2_stat, chi2_crit, p_value y conclusión.
 """
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 import numpy as np
-from scipy.stats import chi2
 
+from tests.accumulator import BatchStats, SufficientStats
 from tests.base import RandomnessTest
+from tests.quantiles import chi2_ppf, chi2_sf, chi2_sf_array
+from tests.result import BinTable, TestResult
 from core.registry import Registry
 
 class UniformityChiSquare(RandomnessTest):
-    def run(self, sequence: np.ndarray, **kwargs) -> Dict[str, Any]:
+    def run(self, sequence: np.ndarray, **kwargs) -> TestResult:
+        m, warnings = self.choose_m(int(np.size(sequence)), kwargs.get("m", None))
+        stats = SufficientStats.from_sequence(sequence, bins=m, scale=kwargs.get("scale", None))
+        return self._result(stats, float(kwargs.get("alpha", 0.05)), warnings)
+
+    def run_stats(self, stats: SufficientStats, **kwargs) -> TestResult:
+        if stats.bins is None:
+            raise ValueError("El acumulador no tiene bins; créalo con SufficientStats(bins=m).")
+        m_user = kwargs.get("m", None)
+        m, warnings = self.choose_m(stats.n, m_user)
+        if m != stats.bins:
+            warnings = [f"m={m_user if m_user is not None else m} se ignora: "
+                        f"el acumulador se armó con m={stats.bins}."]
+        return self._result(stats, float(kwargs.get("alpha", 0.05)), warnings)
+
+    def run_batch(self, matrix: np.ndarray, **kwargs) -> Dict[str, Any]:
         alpha: float = float(kwargs.get("alpha", 0.05))
-        m_user: Optional[int] = kwargs.get("m", None)
+        M = np.asarray(matrix)
+        if M.ndim != 2:
+            raise ValueError("Se espera una matriz 2-D (una secuencia por fila).")
+        m, warnings = self.choose_m(M.shape[1], kwargs.get("m", None))
+        stats = BatchStats.from_matrix(M, bins=m, scale=kwargs.get("scale", None))
+        n = stats.n
+        if n < 10:
+            warnings.insert(0, "n<10: la prueba chi² puede no ser fiable (muestra pequeña).")
+        if n / m < 5:
+            warnings.append(f"E_i = n/m = {n/m:.2f} < 5; los resultados pueden ser inexactos.")
 
-        u = np.asarray(sequence, dtype=float)
-        n = int(u.size)
-        warnings: List[str] = []
+        O = stats.counts
+        E = n / m
+        with np.errstate(divide="ignore", invalid="ignore"):
+            contrib = ((O - E) ** 2) / E if E > 0 else np.full(O.shape, np.nan)
+        chi2_stat = np.nansum(contrib, axis=1)
 
-        if n < 10:
-            warnings.append("n<10: la prueba chi² puede no ser fiable (muestra pequeña).")
+        df = max(m - 1, 1)
+        chi2_crit = chi2_ppf(1.0 - alpha, df)
+        outside = stats.outside_closed
+        return {
+            "test": "Uniformidad χ² (Uniforme[0,1])",
+            "rows": stats.rows,
+            "alpha": alpha,
+            "n": n,
+            "m": m,
+            "df": df,
+            "E_i": float(E),
+            "edges": stats.edges,
+            "counts": O,
+            "chi2_stat": chi2_stat,
+            "chi2_crit_(1-alpha,df)": chi2_crit,
+            "p_value": chi2_sf_array(chi2_stat, df),
+            "passed": chi2_stat <= chi2_crit,
+            "outside_[0,1]": outside,
+            "status": np.where((outside > 0) | bool(warnings), "warning", "ok"),
+            "warnings": warnings,
+        }
 
-        # Rango
-        if not np.all((u >= 0.0) & (u <= 1.0)):
-            warnings.append("Se detectaron valores fuera de [0,1]; la prueba se aplica sobre [0,1].")
+    def stats_bins(self, n: int, **kwargs) -> Optional[int]:
+        return self.choose_m(n, kwargs.get("m", None))[0]
 
+    @staticmethod
+    def choose_m(n: int, m_user: Optional[int]) -> Tuple[int, List[str]]:
+        """m efectivo para n valores (y advertencias de los ajustes)."""
+        warnings: List[str] = []
         # Elegir m
         if m_user is None:
             m = int(np.floor(np.sqrt(n))) if n > 0 else 1
@@ -63,12 +123,20 @@ class UniformityChiSquare(RandomnessTest):
                 if m_new < m:
                     warnings.append(f"m={m_user} produce E_i=n/m<5; se ajusta a m={m_new}.")
                     m = m_new
+        return m, warnings
+
+    def _result(self, stats: SufficientStats, alpha: float, warnings: List[str]) -> TestResult:
+        n, m = stats.n, stats.bins
+        if n < 10:
+            warnings.insert(0, "n<10: la prueba chi² puede no ser fiable (muestra pequeña).")
 
-        # Bordes de los intervalos (último cerrado en 1)
-        edges = np.linspace(0.0, 1.0, m + 1)
-        # Histograma: numpy deja el último intervalo cerrado en el borde derecho
-        O, _ = np.histogram(u, bins=edges)
-        O = O.astype(int)
+        # Bordes de los intervalos (último cerrado en 1) y O_i del acumulador
+        edges = stats.edges
+        O = stats.counts.astype(int)
+
+        # Rango
+        if stats.outside_closed:
+            warnings.append("Se detectaron valores fuera de [0,1]; la prueba se aplica sobre [0,1].")
         E = n / m if m > 0 else np.nan
 
         # Contribuciones y estadístico
@@ -77,44 +145,22 @@ class UniformityChiSquare(RandomnessTest):
         chi2_stat = float(np.nansum(contrib))
 
         df = max(m - 1, 1)
-        chi2_crit = float(chi2.ppf(1.0 - alpha, df))
-        p_value = float(1.0 - chi2.cdf(chi2_stat, df))
+        chi2_crit = chi2_ppf(1.0 - alpha, df)
+        p_value = chi2_sf(chi2_stat, df)
 
         accept = chi2_stat <= chi2_crit
 
-        # Tabla por intervalo
-        table: List[Dict[str, Any]] = []
-        for i in range(m):
-            a_i = float(edges[i])
-            b_i = float(edges[i + 1])
-            # formato de intervalo: [a,b) excepto el último [a,b]
-            interval = f"[{a_i:.4f}, {b_i:.4f}{')' if i < m-1 else ']'}"
-            table.append({
-                "interval": interval,
-                "O_i": int(O[i]),
-                "E_i": float(E),
-                "term": float(contrib[i]),
-            })
-
-        result: Dict[str, Any] = {
-            "test": "Uniformidad χ² (Uniforme[0,1])",
-            "alpha": alpha,
-            "n": n,
+        if n / m < 5:
+            warnings.append(f"E_i = n/m = {n/m:.2f} < 5; los resultados pueden ser inexactos.")
+
+        # Tabla por intervalo en columnas; las etiquetas [a_i, b_i) se arman al pedirlas
+        return TestResult("Uniformidad χ² (Uniforme[0,1])", alpha, n, p_value, accept, fields={
             "m": m,
             "df": df,
             "chi2_stat": chi2_stat,
             "chi2_crit_(1-alpha,df)": chi2_crit,
-            "p_value": p_value,
             "decision": ("No se rechaza H0 (pasa uniformidad)" if accept else "Se rechaza H0 (no pasa uniformidad)"),
-            "table": table,
-            "status": "ok",
-        }
-        if n / m < 5:
-            warnings.append(f"E_i = n/m = {n/m:.2f} < 5; los resultados pueden ser inexactos.")
-        if warnings:
-            result["warnings"] = warnings
-            result["status"] = "warning"
-        return result
+        }, table=BinTable("interval", O, E, contrib, edges=edges), warnings=warnings)
 
 # Registro en catálogo
 Registry.register_test("Uniformidad χ² (Uniforme[0,1])", lambda: UniformityChiSquare())
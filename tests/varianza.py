@@ -7,7 +7,15 @@ Pasos:
 3) df = n-1 ; cuantiles χ^2_{α/2,df} y χ^2_{1-α/2,df}.
 4) Acepta H0 si χ^2_{α/2,df} ≤ Q ≤ χ^2_{1-α/2,df}.
 5) Intervalo de aceptación para S^2.
-6) p-value bilateral.
+6) p-value bilateral: 2 * min(F(Q), sf(Q)).
+Cuantiles y colas vienen de tests.quantiles (memoizados; Wilson–Hilferty
+para df muy grande).
+
+Admite secuencias float64/float32 o el estado crudo uint32/uint64 con
+scale (ver tests.base.unit_chunks). ū y S^2 salen de un
+tests.accumulator.SufficientStats; `run_stats` acepta uno ya acumulado.
+`run_batch` hace lo mismo para cada fila de una matriz con reducciones por
+eje (tests.accumulator.BatchStats) y devuelve columnas.
 
 Validaciones:
 - Advertencia si n<10.
@@ -15,48 +23,89 @@ Validaciones:
 """
 from typing import Dict, Any, List
 import numpy as np
-from scipy.stats import chi2
 
+from tests.accumulator import BatchStats, SufficientStats
 from tests.base import RandomnessTest
+from tests.result import TestResult
+from tests.quantiles import chi2_cdf, chi2_cdf_array, chi2_ppf, chi2_sf, chi2_sf_array
 from core.registry import Registry
 
 class VarianceChiSquare(RandomnessTest):
-    def run(self, sequence: np.ndarray, **kwargs) -> Dict[str, Any]:
+    def run(self, sequence: np.ndarray, **kwargs) -> TestResult:
+        return self.run_stats(SufficientStats.from_sequence(sequence, scale=kwargs.get("scale")), **kwargs)
+
+    def run_stats(self, stats: SufficientStats, **kwargs) -> TestResult:
         alpha: float = float(kwargs.get("alpha", 0.05))
-        u = np.asarray(sequence, dtype=float)
+        n = stats.n
+        ubar = stats.mean if n > 0 else float("nan")
 
-        n = u.size
         warnings: List[str] = []
         if n < 10:
             warnings.append("n<10: la prueba puede no ser fiable (muestra pequeña).")
 
-        if not np.all((u > 0.0) & (u < 1.0)):
+        if stats.outside_open:
             warnings.append("Se detectaron valores fuera de (0,1); la hipótesis Uniforme[0,1] queda comprometida.")
 
-        ubar = float(np.mean(u)) if n > 0 else float("nan")
-        S2 = float(np.var(u, ddof=1)) if n > 1 else float("nan")
+        S2 = stats.variance
 
         sigma0_sq = 1.0 / 12.0
         df = max(n - 1, 1)
         Q = float(((n - 1) * S2) / sigma0_sq) if n > 1 else float("nan")
 
-        chi2_lower = float(chi2.ppf(alpha / 2.0, df))
-        chi2_upper = float(chi2.ppf(1.0 - alpha / 2.0, df))
+        chi2_lower = chi2_ppf(alpha / 2.0, df)
+        chi2_upper = chi2_ppf(1.0 - alpha / 2.0, df)
 
         S2_low = sigma0_sq * chi2_lower / (n - 1) if n > 1 else float("nan")
         S2_high = sigma0_sq * chi2_upper / (n - 1) if n > 1 else float("nan")
 
-        FQ = float(chi2.cdf(Q, df)) if np.isfinite(Q) else float("nan")
-        pval = float(2.0 * min(FQ, 1.0 - FQ)) if np.isfinite(FQ) else float("nan")
+        FQ = chi2_cdf(Q, df) if np.isfinite(Q) else float("nan")
+        SQ = chi2_sf(Q, df) if np.isfinite(Q) else float("nan")
+        pval = float(2.0 * min(FQ, SQ)) if np.isfinite(FQ) else float("nan")
         pval = max(min(pval, 1.0), 0.0) if np.isfinite(pval) else pval
 
         accept = (chi2_lower <= Q <= chi2_upper) if np.isfinite(Q) else False
 
-        result: Dict[str, Any] = {
+        return TestResult("Varianza χ² (Uniforme[0,1])", alpha, n, pval, accept, fields={
+            "mean": ubar,
+            "S2": S2,
+            "sigma0_sq": sigma0_sq,
+            "Q": Q,
+            "df": df,
+            "chi2_lower": chi2_lower,
+            "chi2_upper": chi2_upper,
+            "accept_interval_S2": [S2_low, S2_high],
+            "conclusion": ("Pasa la prueba de varianza a nivel α" if accept else "No pasa la prueba de varianza a nivel α"),
+        }, warnings=warnings)
+
+    def run_batch(self, matrix: np.ndarray, **kwargs) -> Dict[str, Any]:
+        alpha: float = float(kwargs.get("alpha", 0.05))
+        stats = BatchStats.from_matrix(matrix, scale=kwargs.get("scale"))
+        n = stats.n
+
+        warnings: List[str] = []
+        if n < 10:
+            warnings.append("n<10: la prueba puede no ser fiable (muestra pequeña).")
+        outside = stats.outside_open
+
+        S2 = stats.variance
+        sigma0_sq = 1.0 / 12.0
+        df = max(n - 1, 1)
+        Q = ((n - 1) * S2) / sigma0_sq if n > 1 else np.full(stats.rows, np.nan)
+
+        chi2_lower = chi2_ppf(alpha / 2.0, df)
+        chi2_upper = chi2_ppf(1.0 - alpha / 2.0, df)
+        S2_low = sigma0_sq * chi2_lower / (n - 1) if n > 1 else float("nan")
+        S2_high = sigma0_sq * chi2_upper / (n - 1) if n > 1 else float("nan")
+
+        pval = np.clip(2.0 * np.minimum(chi2_cdf_array(Q, df), chi2_sf_array(Q, df)), 0.0, 1.0)
+        accept = (chi2_lower <= Q) & (Q <= chi2_upper)     # NaN -> False
+
+        return {
             "test": "Varianza χ² (Uniforme[0,1])",
+            "rows": stats.rows,
             "alpha": alpha,
             "n": n,
-            "mean": ubar,
+            "mean": stats.mean,
             "S2": S2,
             "sigma0_sq": sigma0_sq,
             "Q": Q,
@@ -65,13 +114,11 @@ class VarianceChiSquare(RandomnessTest):
             "chi2_upper": chi2_upper,
             "accept_interval_S2": [S2_low, S2_high],
             "p_value": pval,
-            "conclusion": ("Pasa la prueba de varianza a nivel α" if accept else "No pasa la prueba de varianza a nivel α"),
-            "status": "ok",
+            "passed": accept,
+            "outside_(0,1)": outside,
+            "status": np.where((outside > 0) | bool(warnings), "warning", "ok"),
+            "warnings": warnings,
         }
-        if warnings:
-            result["warnings"] = warnings
-            result["status"] = "warning"
-        return result
 
 # Registrar en el catálogo
 Registry.register_test("Varianza χ² (Uniforme[0,1])", lambda: VarianceChiSquare())
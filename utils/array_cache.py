@@ -0,0 +1,130 @@
+"""
+Caché en disco de arreglos NumPy (.npy) abiertos como memmap, con tope de
+tamaño y desalojo LRU.
+
+- Cada entrada es un archivo `<clave>.npy` dentro del directorio de caché.
+- La escritura se hace en un archivo temporal y se publica con os.replace,
+  así otro proceso nunca ve un .npy a medio escribir.
+- El "uso reciente" es la fecha de modificación del archivo: se actualiza
+  en cada acceso, de modo que el orden LRU se comparte entre procesos.
+- Al superar `max_bytes` se borran los archivos menos usados (nunca el que
+  se acaba de pedir).
+
+Directorio por defecto: $PSEUDOALEATORIOS_CACHE o ~/.cache/pseudoaleatorios.
+Tope por defecto: $PSEUDOALEATORIOS_CACHE_MB (2048 MB).
+"""
+from typing import Callable, Dict, Optional
+import os
+import pathlib
+import tempfile
+import numpy as np
+
+
+def default_cache_dir() -> pathlib.Path:
+    env = os.environ.get("PSEUDOALEATORIOS_CACHE")
+    if env:
+        return pathlib.Path(env)
+    return pathlib.Path.home() / ".cache" / "pseudoaleatorios"
+
+
+def default_max_bytes() -> int:
+    return int(float(os.environ.get("PSEUDOALEATORIOS_CACHE_MB", 2048)) * 1024 * 1024)
+
+
+class DiskArrayCache:
+    def __init__(self, directory: Optional[os.PathLike] = None, max_bytes: Optional[int] = None):
+        self.directory = pathlib.Path(directory) if directory is not None else default_cache_dir()
+        self.max_bytes = int(max_bytes) if max_bytes is not None else default_max_bytes()
+        # Memmaps ya abiertos en este proceso (evita reabrir el archivo)
+        self._open: Dict[str, np.ndarray] = {}
+
+    def path(self, key: str) -> pathlib.Path:
+        return self.directory / f"{key}.npy"
+
+    def get(self, key: str) -> Optional[np.ndarray]:
+        """Retorna el arreglo (memmap de solo lectura) o None si no está."""
+        p = self.path(key)
+        if not p.exists():
+            self._open.pop(key, None)
+            return None
+        self._touch(p)
+        arr = self._open.get(key)
+        if arr is None:
+            arr = np.load(p, mmap_mode="r")
+            self._open[key] = arr
+        return arr
+
+    def get_or_build(self, key: str, shape, dtype, build: Callable[[np.ndarray], None]) -> np.ndarray:
+        """
+        Retorna la entrada `key`; si no existe la crea con `build(out)`, que
+        debe llenar el memmap `out` (de la forma y dtype indicados).
+        """
+        arr = self.get(key)
+        if arr is not None:
+            return arr
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(prefix=f".{key}.", suffix=".tmp", dir=self.directory)
+        os.close(fd)
+        try:
+            out = np.lib.format.open_memmap(tmp, mode="w+", dtype=dtype, shape=shape)
+            build(out)
+            out.flush()
+            del out
+            os.replace(tmp, self.path(key))
+        except BaseException:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
+
+        self.evict(keep=key)
+        return self.get(key)
+
+    def evict(self, keep: Optional[str] = None) -> None:
+        """Borra entradas menos usadas hasta quedar bajo `max_bytes`."""
+        if not self.directory.exists():
+            return
+        entries = []
+        for p in self.directory.glob("*.npy"):
+            try:
+                st = p.stat()
+            except FileNotFoundError:      # otro proceso la borró
+                continue
+            entries.append((st.st_mtime, st.st_size, p))
+        total = sum(size for _, size, _ in entries)
+        for _, size, p in sorted(entries, key=lambda e: e[0]):
+            if total <= self.max_bytes:
+                break
+            if p.stem == keep:
+                continue
+            try:
+                p.unlink()
+            except FileNotFoundError:
+                pass
+            except OSError:                # en uso (p.ej. memmap en Windows)
+                continue
+            self._open.pop(p.stem, None)
+            total -= size
+
+    def clear(self) -> None:
+        for p in self.directory.glob("*.npy"):
+            p.unlink(missing_ok=True)
+        self._open.clear()
+
+    @staticmethod
+    def _touch(p: pathlib.Path) -> None:
+        try:
+            os.utime(p)
+        except OSError:
+            pass
+
+
+# Instancia compartida por los motores que la necesiten
+_default_cache: Optional[DiskArrayCache] = None
+
+
+def default_cache() -> DiskArrayCache:
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = DiskArrayCache()
+    return _default_cache
@@ -1,10 +1,13 @@
 """
-Exportación de resultados a CSV y guardado de gráficos a PNG.
+Exportación de resultados a CSV / JSON y guardado de gráficos a PNG.
 """
-from typing import Sequence
+from typing import Any, Mapping, Sequence
 import csv
+import json
 import pathlib
 
+from tests.result import plain, result_dict
+
 def export_sequence_to_csv(numbers: Sequence[float], path: str) -> None:
     p = pathlib.Path(path)
     p.parent.mkdir(parents=True, exist_ok=True)
@@ -14,4 +17,20 @@ def export_sequence_to_csv(numbers: Sequence[float], path: str) -> None:
         for i, x in enumerate(numbers):
             writer.writerow([i, x])
 
+def export_results_to_json(results: Sequence[Mapping[str, Any]], path: str) -> None:
+    """
+    Resultados de pruebas a JSON. Con extensión .jsonl: una línea por prueba
+    con las tablas en columnas (tests.result); si no, una lista con el dict
+    completo de cada prueba (tabla fila por fila), con sangría.
+    """
+    p = pathlib.Path(path)
+    p.parent.mkdir(parents=True, exist_ok=True)
+    with p.open("w", encoding="utf-8") as f:
+        if p.suffix.lower() == ".jsonl":
+            for r in results:
+                f.write(json.dumps(result_dict(r), ensure_ascii=False, default=plain) + "\n")
+        else:
+            json.dump([result_dict(r, columnar=False) for r in results], f,
+                      indent=2, ensure_ascii=False, default=plain)
+
 # La exportación de gráficos se hace desde utils.plotting (ver abajo)
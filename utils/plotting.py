@@ -1,18 +1,28 @@
 """
 Histograma con esquema oscuro sobrio (no neón).
+Matplotlib no se importa aquí: la figura la crea quien llama.
 """
-from typing import Optional
+from typing import List, Optional, TYPE_CHECKING
 import numpy as np
-from matplotlib.figure import Figure
 from gui.theme import PALETTE
 
-def draw_histogram(fig: Figure, data: np.ndarray, bins: int = 10) -> None:
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
+
+def draw_histogram(fig: "Figure", data: np.ndarray, bins: int = 10) -> None:
+    counts, edges = np.histogram(data, bins=bins)
+    draw_histogram_counts(fig, edges, counts)
+
+
+def draw_histogram_counts(fig: "Figure", edges: np.ndarray, counts: np.ndarray) -> None:
+    """Histograma ya contado (p.ej. con np.histogram en un trabajo en segundo plano)."""
     fig.clear()
     fig.set_facecolor(PALETTE["elev"])
     ax = fig.add_subplot(111)
     ax.set_facecolor(PALETTE["surface"])
     # barras con borde sutil
-    ax.hist(data, bins=bins, edgecolor="#2B3547")
+    edges_a = np.asarray(edges, dtype=float)
+    ax.bar(edges_a[:-1], counts, width=np.diff(edges_a), align="edge", edgecolor="#2B3547")
     ax.set_title("Histograma", color=PALETTE["text"])
     ax.set_xlabel("Valor", color=PALETTE["subtle"])
     ax.set_ylabel("Frecuencia", color=PALETTE["subtle"])
@@ -20,3 +30,24 @@ def draw_histogram(fig: Figure, data: np.ndarray, bins: int = 10) -> None:
     for spine in ax.spines.values():
         spine.set_color("#2B3547")
     fig.tight_layout()
+
+
+def draw_p_value_histogram(fig: "Figure", edges: List[float], counts: List[int],
+                           title: str = "p-values por bloque") -> None:
+    """Histograma ya contado de p-values en [0,1] con la línea del conteo esperado (uniforme)."""
+    fig.clear()
+    fig.set_facecolor(PALETTE["elev"])
+    ax = fig.add_subplot(111)
+    ax.set_facecolor(PALETTE["surface"])
+    edges_a = np.asarray(edges, dtype=float)
+    ax.bar(edges_a[:-1], counts, width=np.diff(edges_a), align="edge", edgecolor="#2B3547")
+    if len(counts):
+        ax.axhline(sum(counts) / len(counts), color=PALETTE["subtle"], linestyle="--", linewidth=1)
+    ax.set_xlim(0.0, 1.0)
+    ax.set_title(title, color=PALETTE["text"])
+    ax.set_xlabel("p-value", color=PALETTE["subtle"])
+    ax.set_ylabel("Bloques", color=PALETTE["subtle"])
+    ax.tick_params(colors=PALETTE["subtle"])
+    for spine in ax.spines.values():
+        spine.set_color("#2B3547")
+    fig.tight_layout()
@@ -0,0 +1,83 @@
+"""
+Presupuesto de arranque medido con `python -X importtime`.
+
+Importa `gui.main_window` (todo lo que se carga antes de mostrar la
+ventana) en un proceso nuevo, RUNS veces, y toma el mínimo del tiempo
+acumulado del módulo. Falla (código de salida 1) si:
+- el tiempo supera BUDGET_MS, o
+- se cargó algún módulo de FORBIDDEN (SciPy y Matplotlib se importan al
+  primer uso; los generadores y pruebas del catálogo core.plugins, al
+  generar o probar).
+
+Uso (desde la raíz del proyecto):
+    python -m utils.startup_budget [--budget MS] [--runs N] [--top K]
+
+Medido en el equipo de desarrollo (Python 3.11, NumPy 2.x):
+- antes de la carga diferida: ~1100 ms (Matplotlib ~870 ms)
+- con carga diferida:         ~140-160 ms (NumPy ~100 ms)
+"""
+from typing import Dict, List, Tuple
+import argparse
+import os
+import subprocess
+import sys
+
+from core.plugins import BUILTIN_GENERATORS, BUILTIN_TESTS
+
+TARGET = "gui.main_window"
+BUDGET_MS = 300.0
+RUNS = 3
+FORBIDDEN = ("scipy", "matplotlib", "concurrent.futures.process") + tuple(
+    sorted({d.module for d in BUILTIN_GENERATORS + BUILTIN_TESTS}))
+
+
+def measure(target: str = TARGET) -> Dict[str, Tuple[float, float]]:
+    """{módulo: (propio_ms, acumulado_ms)} de un import en un proceso nuevo."""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {target}"],
+                          cwd=root, capture_output=True, text=True)
+    if proc.returncode != 0:
+        raise RuntimeError(f"No se pudo importar {target}:\n{proc.stderr}")
+    times: Dict[str, Tuple[float, float]] = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        own, cumulative, name = line[len("import time:"):].split("|")
+        times[name.strip()] = (int(own) / 1000.0, int(cumulative) / 1000.0)
+    return times
+
+
+def forbidden_loaded(times: Dict[str, Tuple[float, float]]) -> List[str]:
+    return sorted(name for name in times
+                  if any(name == f or name.startswith(f + ".") for f in FORBIDDEN))
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--budget", type=float, default=BUDGET_MS, help="tope en ms")
+    parser.add_argument("--runs", type=int, default=RUNS, help="mediciones (se toma el mínimo)")
+    parser.add_argument("--top", type=int, default=10, help="módulos más lentos a mostrar")
+    args = parser.parse_args(argv)
+
+    runs = [measure() for _ in range(max(1, args.runs))]
+    best = min(runs, key=lambda t: t[TARGET][1])
+    total = best[TARGET][1]
+
+    print(f"{TARGET}: {total:.1f} ms (presupuesto {args.budget:.0f} ms, mínimo de {len(runs)})")
+    slowest = sorted(best.items(), key=lambda item: item[1][0], reverse=True)[:args.top]
+    for name, (own, cumulative) in slowest:
+        print(f"  {own:8.1f} ms propio  {cumulative:8.1f} ms acumulado  {name}")
+
+    ok = True
+    loaded = forbidden_loaded(best)
+    if loaded:
+        ok = False
+        print("Módulos que deberían cargarse al primer uso: " + ", ".join(loaded))
+    if total > args.budget:
+        ok = False
+        print(f"Se excede el presupuesto por {total - args.budget:.1f} ms.")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())